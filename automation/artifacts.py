@@ -0,0 +1,269 @@
+"""
+=============================================================================
+ARTIFACTS - Background Writer untuk Artifact Test Gagal
+=============================================================================
+File: artifacts.py
+Saat test gagal, proses test hanya mengambil bytes dari browser
+(screenshot PNG + DOM dan URL dalam satu execute_script) lalu memasukkannya
+ke antrean. Thread writer di background yang:
+- mengompres ulang PNG (IDAT di-deflate ulang level 9) dan DOM (gzip)
+- deduplikasi berdasarkan hash isi (screenshot/DOM identik disimpan sekali)
+- menulis index per worker (test, url, file screenshot & DOM)
+- menjaga total ukuran folder screenshots/ di bawah budget dengan
+  menghapus run paling lama
+
+Struktur folder:
+    screenshots/<run>/objects/<sha256>.png | .html.gz
+    screenshots/<run>/index-<worker>.jsonl
+
+Konfigurasi (environment variable):
+- ARTIFACT_DIR       : folder root artifact (default screenshots)
+- ARTIFACT_BUDGET_MB : total ukuran maksimum semua run (default 200)
+- ARTIFACT_QUEUE     : kapasitas antrean writer (default 32)
+=============================================================================
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import queue
+import shutil
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Satu round trip untuk URL dan DOM saat ini
+_SNAPSHOT_JS = "return [location.href, document.documentElement.outerHTML];"
+
+# Statistik per proses (worker), dikirim ke controller lewat conftest
+STATS = {
+    "queued": 0, "captured": 0, "deduplicated": 0, "dropped": 0, "evicted_runs": 0,
+    "raw_bytes": 0, "stored_bytes": 0, "capture_seconds": 0.0,
+}
+
+# (run_id, worker) untuk proses ini, diset conftest; writer dibuat saat capture pertama
+_run = None
+_writer = None
+
+
+def root_dir():
+    return Path(os.environ.get("ARTIFACT_DIR", "screenshots"))
+
+
+def budget_bytes():
+    return int(float(os.environ.get("ARTIFACT_BUDGET_MB", "200")) * 1024 * 1024)
+
+
+def new_run_id():
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+# =============================================================================
+# COMPRESSION
+# =============================================================================
+
+def _chunk(kind, body):
+    return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+
+
+def recompress_png(data, level=9):
+    """
+    Deflate ulang data gambar PNG dengan level kompresi maksimum (lossless).
+    Screenshot Chrome memakai kompresi cepat, sehingga biasanya jauh lebih kecil.
+    Mengembalikan data asli jika bukan PNG valid atau tidak lebih kecil.
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        return data
+    chunks, idat, position = [], [], len(PNG_SIGNATURE)
+    try:
+        while position < len(data):
+            (length,) = struct.unpack(">I", data[position:position + 4])
+            kind = data[position + 4:position + 8]
+            body = data[position + 8:position + 8 + length]
+            position += 12 + length
+            if kind == b"IDAT":
+                idat.append(body)
+            chunks.append((kind, body))
+        compressed = zlib.compress(zlib.decompress(b"".join(idat)), level)
+    except (struct.error, zlib.error):
+        return data
+    if len(compressed) >= sum(len(body) for body in idat):
+        return data
+
+    output, written = [PNG_SIGNATURE], False
+    for kind, body in chunks:
+        if kind == b"IDAT":
+            if not written:
+                output.append(_chunk(b"IDAT", compressed))
+                written = True
+            continue
+        output.append(_chunk(kind, body))
+    return b"".join(output)
+
+
+# =============================================================================
+# DISK BUDGET
+# =============================================================================
+
+def _dir_size(path):
+    return sum(entry.stat().st_size for entry in path.rglob("*") if entry.is_file())
+
+
+def enforce_budget(root, current_run, budget):
+    """
+    Hapus folder run paling lama (selain run saat ini) sampai total ukuran
+    di bawah budget. Mengembalikan (jumlah run dihapus, ukuran sisa).
+    """
+    if not root.is_dir():
+        return 0, 0
+    runs = sorted(path for path in root.iterdir() if path.is_dir())
+    sizes = {path: _dir_size(path) for path in runs}
+    total = sum(sizes.values())
+    evicted = 0
+    for path in runs:
+        if total <= budget:
+            break
+        if path.name == current_run:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        total -= sizes[path]
+        evicted += 1
+    return evicted, total
+
+
+# =============================================================================
+# WRITER
+# =============================================================================
+
+class ArtifactWriter:
+    """Thread background yang menulis artifact dari antrean ke disk."""
+
+    def __init__(self, run_id, worker="main", root=None, budget=None, maxsize=None):
+        self.run_dir = (root or root_dir()) / run_id
+        self.objects = self.run_dir / "objects"
+        self.index = self.run_dir / f"index-{worker}.jsonl"
+        self.budget = budget if budget is not None else budget_bytes()
+        self.queue = queue.Queue(maxsize or int(os.environ.get("ARTIFACT_QUEUE", "32")))
+        self.size = None  # total ukuran root, dihitung saat write pertama
+        self.thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, record):
+        """Masukkan artifact ke antrean tanpa menunggu disk (drop jika penuh)."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            STATS["dropped"] += 1
+
+    def close(self):
+        """Tunggu semua artifact tertulis lalu hentikan thread."""
+        self.queue.put(None)
+        self.thread.join()
+
+    def _run(self):
+        while True:
+            record = self.queue.get()
+            if record is None:
+                return
+            try:
+                self._write(record)
+            except OSError as exc:
+                STATS["dropped"] += 1
+                print(f"\n⚠️ Gagal menulis artifact {record['test']}: {exc}")
+
+    def _store(self, data, suffix, encode):
+        """Simpan object berdasarkan hash isi mentah; kembalikan (nama, bytes baru)."""
+        name = f"{hashlib.sha256(data).hexdigest()[:20]}{suffix}"
+        path = self.objects / name
+        if path.exists():
+            STATS["deduplicated"] += 1
+            return name, 0
+        encoded = encode(data)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(encoded)
+        os.replace(tmp, path)
+        return name, len(encoded)
+
+    def _write(self, record):
+        if self.size is None:
+            root = self.run_dir.parent
+            evicted, self.size = enforce_budget(root, self.run_dir.name, self.budget)
+            STATS["evicted_runs"] += evicted
+        raw = len(record["png"]) + len(record["dom"])
+        if self.size + raw > self.budget:
+            # Perkiraan kasar (sebelum kompresi): run ini sendiri sudah melewati budget
+            STATS["dropped"] += 1
+            return
+
+        self.objects.mkdir(parents=True, exist_ok=True)
+        screenshot, png_bytes = self._store(record["png"], ".png", recompress_png)
+        dom, dom_bytes = self._store(record["dom"], ".html.gz", lambda data: gzip.compress(data, 9))
+        entry = {
+            "test": record["test"], "url": record["url"], "time": record["time"],
+            "screenshot": f"objects/{screenshot}", "dom": f"objects/{dom}",
+        }
+        with self.index.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+        STATS["captured"] += 1
+        STATS["raw_bytes"] += raw
+        STATS["stored_bytes"] += png_bytes + dom_bytes
+        self.size += png_bytes + dom_bytes
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def configure(run_id, worker="main"):
+    """Set folder run (sama untuk semua worker) dan nama worker proses ini."""
+    global _run
+    _run = (run_id, worker)
+
+
+def capture(driver, test):
+    """
+    Ambil screenshot, DOM dan URL dari browser lalu serahkan ke writer.
+    Hanya bagian ini yang dibayar oleh test; kompresi dan disk di background.
+    Mengembalikan folder run tujuan.
+    """
+    global _writer
+    if _writer is None:
+        _writer = ArtifactWriter(*(_run or (new_run_id(), "main")))
+    start_time = time.perf_counter()
+    png = driver.get_screenshot_as_png()
+    url, dom = driver.execute_script(_SNAPSHOT_JS)
+    STATS["capture_seconds"] += time.perf_counter() - start_time
+    STATS["queued"] += 1
+    _writer.submit({
+        "test": test, "url": url, "time": datetime.now().isoformat(timespec="seconds"),
+        "png": png, "dom": dom.encode("utf-8"),
+    })
+    return _writer.run_dir
+
+
+def shutdown():
+    """Flush antrean writer (dipanggil di akhir session)."""
+    global _writer
+    if _writer is not None:
+        _writer.close()
+        _writer = None
+
+
+def format_stats(stats):
+    """Baris laporan artifact untuk terminal summary."""
+    saved = 1 - stats["stored_bytes"] / stats["raw_bytes"] if stats["raw_bytes"] else 0.0
+    mean_ms = stats["capture_seconds"] / max(stats["queued"], 1) * 1000
+    return [
+        f"Captured: {stats['captured']}  deduplicated objects: {stats['deduplicated']}  "
+        f"dropped: {stats['dropped']}  evicted runs: {stats['evicted_runs']}",
+        f"Raw {stats['raw_bytes'] / 1024:.0f} KB -> stored {stats['stored_bytes'] / 1024:.0f} KB "
+        f"({saved:.0%} lebih kecil)  capture di test: {mean_ms:.0f}ms rata-rata",
+    ]
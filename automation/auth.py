@@ -0,0 +1,161 @@
+"""
+=============================================================================
+AUTH - Login via HTTP + Cookie Injection
+=============================================================================
+File: auth.py
+Login ke DamnCRUD cukup sekali per worker lewat HTTP (requests), lalu
+cookie PHPSESSID di-inject ke browser. Test tidak perlu lagi mengisi form
+login.php lewat UI di setiap test.
+
+Login lewat UI tetap tersedia (login_via_ui) untuk test yang memang
+menguji alur login.
+=============================================================================
+"""
+
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from database import DB_COOKIE, active_database
+from http_client import SESSION_COOKIE, DamnCRUDClient
+
+
+# Cache session id per worker. Setiap worker xdist adalah proses terpisah,
+# jadi cache level modul otomatis terpisah per worker.
+_session_cache = {}
+
+
+class LoginError(Exception):
+    """Login via HTTP gagal (kredensial salah atau server bermasalah)."""
+
+
+# =============================================================================
+# HTTP LOGIN
+# =============================================================================
+
+def http_login(base_url, username, password, timeout=10):
+    """
+    Login lewat POST ke login.php dan kembalikan nilai PHPSESSID.
+    Login dianggap berhasil jika index.php bisa dibuka tanpa redirect.
+    """
+    client = DamnCRUDClient(base_url, timeout=timeout)
+    try:
+        client.login(username, password)
+        session_id = client.session_id
+        if not session_id:
+            raise LoginError(f"login.php tidak mengirim cookie {SESSION_COOKIE}")
+
+        # Verifikasi session valid: index.php redirect ke login.php jika tidak
+        response = client.get("index.php")
+        if response.status_code != 200 or 'id="employee"' not in response.text:
+            raise LoginError(f"Login sebagai '{username}' gagal (status {response.status_code})")
+    finally:
+        client.close()
+
+    return session_id
+
+
+def get_session_id(base_url, username, password, refresh=False):
+    """
+    Ambil PHPSESSID dari cache worker, login via HTTP jika belum ada.
+    """
+    key = (base_url, username, active_database())
+    if refresh or key not in _session_cache:
+        _session_cache[key] = http_login(base_url, username, password)
+    return _session_cache[key]
+
+
+def clear_session_cache():
+    """Lupakan semua PHPSESSID di cache (awal session pytest baru)."""
+    _session_cache.clear()
+
+
+# =============================================================================
+# BROWSER COOKIE HELPERS
+# =============================================================================
+
+def set_browser_cookie(driver, base_url, name, value):
+    """
+    Set cookie untuk origin base_url tanpa perlu membuka halaman terlebih dulu.
+    Di Chrome menggunakan CDP; fallback membuka functions.php (halaman kosong)
+    agar add_cookie bisa dipanggil pada domain yang benar.
+    """
+    parts = urlsplit(base_url)
+    try:
+        driver.execute_cdp_cmd("Network.setCookie", {
+            "name": name,
+            "value": value,
+            "domain": parts.hostname,
+            "path": "/",
+        })
+    except (AttributeError, WebDriverException):
+        if urlsplit(driver.current_url).netloc != parts.netloc:
+            driver.get(f"{base_url}/functions.php")
+        driver.add_cookie({"name": name, "value": value, "path": "/"})
+
+
+def select_database(driver, base_url):
+    """
+    Arahkan browser ke schema worker (cookie damncrud_db) jika isolasi
+    database per worker aktif. Harus dipanggil sebelum membuka halaman app.
+    """
+    database = active_database()
+    if database:
+        set_browser_cookie(driver, base_url, DB_COOKIE, database)
+
+
+def inject_login(driver, base_url, username, password):
+    """
+    Login ke browser dengan meng-inject PHPSESSID hasil login HTTP,
+    lalu buka dashboard (index.php) seperti hasil login lewat form.
+
+    Jika session di cache sudah tidak valid (mis. server restart),
+    login HTTP diulang sekali.
+    """
+    select_database(driver, base_url)
+    for refresh in (False, True):
+        session_id = get_session_id(base_url, username, password, refresh=refresh)
+        set_browser_cookie(driver, base_url, SESSION_COOKIE, session_id)
+        driver.get(f"{base_url}/index.php")
+        if "index.php" in driver.current_url:
+            return
+    raise LoginError("Session hasil login HTTP ditolak oleh index.php")
+
+
+def drop_session(driver):
+    """
+    Logout dengan menghapus cookie PHPSESSID dari browser.
+    Session di server tetap hidup sehingga bisa dipakai ulang test berikutnya
+    (berbeda dengan logout.php yang menghancurkan session).
+    """
+    try:
+        driver.delete_cookie(SESSION_COOKIE)
+    except WebDriverException:
+        pass
+
+
+# =============================================================================
+# UI LOGIN (untuk test alur login)
+# =============================================================================
+
+def login_via_ui(driver, base_url, username, password, timeout=10):
+    """Login lewat form login.php seperti yang dilakukan user."""
+    select_database(driver, base_url)
+    driver.get(f"{base_url}/login.php")
+
+    username_field = driver.find_element(By.ID, "inputUsername")
+    username_field.clear()
+    username_field.send_keys(username)
+
+    password_field = driver.find_element(By.ID, "inputPassword")
+    password_field.clear()
+    password_field.send_keys(password)
+
+    login_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+    login_button.click()
+
+    # Tunggu redirect ke dashboard
+    WebDriverWait(driver, timeout).until(EC.url_contains("index.php"))
@@ -0,0 +1,162 @@
+"""
+=============================================================================
+PROFILE BENCHMARK - Perbandingan Profil Launch Chrome pada Flow TC
+=============================================================================
+File: bench_profiles.py
+Meluncurkan Chrome dengan setiap profil dari browser.PROFILES (fast,
+faithful, debug) lalu menjalankan flow TC yang sama (TC-013 create,
+TC-018 update, TC-010 search, TC-028 profile; lihat journey_replay.py).
+Per profil diukur:
+- Waktu launch (spawn proses + first load login.php, dari STARTUP_LOG)
+- Durasi setiap flow
+- Latency per halaman (TTFB, load, FCP median dari page_metrics.py)
+- Memori proses chromedriver + Chrome setelah flow (PSS, fallback RSS;
+  dibaca dari /proc sehingga hanya tersedia di Linux)
+
+Setiap profil diulang --repeat kali dengan browser baru dan hasilnya
+diambil mediannya. Kontak @load.example.com (seed untuk update dan hasil
+flow create) dihapus di akhir.
+
+CARA MENJALANKAN:
+- Default : python bench_profiles.py
+- Custom  : python bench_profiles.py --profiles fast faithful --repeat 5
+- CI      : HEADLESS=1 python bench_profiles.py --output bench_profiles.json
+=============================================================================
+"""
+
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime
+
+import page_metrics
+from browser import PROFILES, STARTUP_LOG
+from browser_pool import driver_rss
+from journey_replay import JOURNEYS, login_browser
+from load_test import cleanup_load_contacts, seed_load_contacts
+from test_pytest import BASE_URL, create_driver
+
+
+# =============================================================================
+# KONFIGURASI
+# =============================================================================
+DEFAULT_FLOWS = ("create", "update", "search", "profile")
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+def run_once(profile, flows):
+    """Satu browser baru dengan `profile`: launch, login, semua flow, memori."""
+    driver = create_driver(profile=profile)
+    launch = STARTUP_LOG[-1]
+    try:
+        wrapped, listener = page_metrics.wrap_driver(driver)
+        login_browser(driver)
+        flow_ms = {}
+        for flow in flows:
+            start = time.perf_counter()
+            JOURNEYS[flow](wrapped, 0)
+            flow_ms[flow] = round((time.perf_counter() - start) * 1000, 1)
+        listener.capture(driver)
+        memory = driver_rss(driver, pss=True)
+    finally:
+        driver.quit()
+    return {
+        "launch_ms": round((launch["spawn"] + launch["first_load"]) * 1000, 1),
+        "flow_ms": flow_ms,
+        "pages": listener.pages,
+        "memory_mb": round(memory / 1024 / 1024, 1) if memory is not None else None,
+    }
+
+
+def _median(values):
+    values = [value for value in values if value is not None]
+    return round(statistics.median(values), 1) if values else None
+
+
+def bench_profile(profile, flows, repeat):
+    """Median hasil `repeat` kali run_once untuk satu profil."""
+    samples = []
+    for n in range(repeat):
+        sample = run_once(profile, flows)
+        samples.append(sample)
+        print(f"   #{n + 1} launch {sample['launch_ms']} ms, "
+              f"flow {sum(sample['flow_ms'].values()):.0f} ms, memori {sample['memory_mb']} MB")
+    pages = [page for sample in samples for page in sample["pages"]]
+    return {
+        "profile": profile,
+        "headless_default": PROFILES[profile]["headless"],
+        "launch_ms": _median(sample["launch_ms"] for sample in samples),
+        "flow_ms": {flow: _median(sample["flow_ms"][flow] for sample in samples) for flow in flows},
+        "total_flow_ms": _median(sum(sample["flow_ms"].values()) for sample in samples),
+        "pages": page_metrics.summarize(pages),
+        "memory_mb": _median(sample["memory_mb"] for sample in samples),
+    }
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+
+def print_table(results, flows):
+    """Tabel perbandingan: satu baris per profil, selisih terhadap baris pertama."""
+    columns = "".join(f" | {flow + ' ms':>10}" for flow in flows)
+    header = f"{'Profile':<9} | {'Launch ms':>9}{columns} | {'Total ms':>8} | {'Mem MB':>7} | vs {results[0]['profile']}"
+    print("\n" + "=" * len(header))
+    print(header)
+    print("-" * len(header))
+    baseline = results[0]["total_flow_ms"]
+    for r in results:
+        flow_cells = "".join(f" | {r['flow_ms'][flow]:>10}" for flow in flows)
+        delta = f"{(r['total_flow_ms'] / baseline - 1) * 100:+.0f}%" if baseline else "-"
+        memory = r["memory_mb"] if r["memory_mb"] is not None else "-"
+        print(f"{r['profile']:<9} | {r['launch_ms']:>9}{flow_cells} | {r['total_flow_ms']:>8} | {memory:>7} | {delta}")
+    print("=" * len(header))
+
+    print("\nLatency per halaman (median):")
+    for r in results:
+        for page, item in sorted(r["pages"].items()):
+            print(f"  {r['profile']:<9} {page_metrics.format_summary(page, item)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bandingkan profil launch Chrome pada flow TC")
+    parser.add_argument("--profiles", nargs="+", choices=list(PROFILES), default=list(PROFILES),
+                        help="profil yang dibandingkan (default semua)")
+    parser.add_argument("--flows", nargs="+", choices=list(JOURNEYS), default=list(DEFAULT_FLOWS),
+                        help="flow TC yang dijalankan per browser")
+    parser.add_argument("--repeat", type=int, default=3, help="browser baru per profil (median)")
+    parser.add_argument("--output", default="bench_profiles.json", help="file JSON hasil")
+    args = parser.parse_args()
+
+    flows = list(args.flows)
+    results = []
+    try:
+        if "update" in flows:
+            # update mengubah kontak @load.example.com, bukan data asli
+            seed_load_contacts(1)
+        for profile in args.profiles:
+            print(f"\n▶ Profil {profile}: {len(PROFILES[profile]['args'])} argumen Chrome")
+            results.append(bench_profile(profile, flows, args.repeat))
+    finally:
+        print(f"\n✓ {cleanup_load_contacts()} kontak benchmark dihapus")
+
+    print_table(results, flows)
+
+    with open(args.output, "w") as f:
+        json.dump({
+            "base_url": BASE_URL,
+            "executed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "repeat": args.repeat,
+            "flows": flows,
+            "profiles": {name: list(PROFILES[name]["args"]) for name in args.profiles},
+            "results": results,
+        }, f, indent=2)
+    print(f"\n✓ Hasil disimpan ke {args.output}")
+
+
+if __name__ == "__main__":
+    main()
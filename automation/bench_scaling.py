@@ -0,0 +1,216 @@
+"""
+=============================================================================
+SCALING BENCHMARK - index.php & DataTables pada Berbagai Ukuran Tabel
+=============================================================================
+File: bench_scaling.py
+Menyapu ukuran tabel contacts (mis. 100, 1k, 10k, 50k baris) dan di setiap
+ukuran mengukur:
+- Server time-to-first-byte (TTFB) index.php
+- Ukuran HTML yang ditransfer
+- Waktu inisialisasi DataTables (#employee)
+- Latency filter per keystroke di #employee_filter input
+
+Hasil ditampilkan sebagai tabel dan disimpan ke file JSON, beserta ukuran
+pertama di mana halaman melewati budget (berhenti scale).
+
+CARA MENJALANKAN:
+- Default : python bench_scaling.py
+- Custom  : python bench_scaling.py --sizes 100 1000 10000 50000 --repeat 5
+- Output  : python bench_scaling.py --output bench_scaling.json
+=============================================================================
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+from datetime import datetime
+
+from selenium.webdriver.common.by import By
+
+import database
+import seed_contacts
+from auth import inject_login
+from http_client import PASSWORD, USERNAME, DamnCRUDClient
+from test_pytest import create_driver
+from waits import datatable_redraw, wait_for_datatable
+
+
+# =============================================================================
+# KONFIGURASI
+# =============================================================================
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:81/DamnCRUD")
+
+DEFAULT_SIZES = (100, 1000, 10000, 50000)
+SEARCH_QUERY = "John"
+
+# Re-inisialisasi DataTable dan ukur durasinya di dalam browser
+_DATATABLE_INIT_JS = """
+var table = jQuery(arguments[0]);
+table.DataTable().destroy();
+var start = performance.now();
+table.DataTable();
+return performance.now() - start;
+"""
+
+# Kosongkan kotak pencarian dan filter DataTable sebelum putaran berikutnya
+_RESET_SEARCH_JS = """
+jQuery(arguments[0] + '_filter input').val('');
+jQuery(arguments[0]).DataTable().search('').draw();
+"""
+
+
+# =============================================================================
+# MEASUREMENTS
+# =============================================================================
+
+def measure_index_http(client, repeat):
+    """
+    Ukur TTFB (sampai header diterima) dan total waktu transfer index.php.
+    Mengembalikan median dari `repeat` sampel beserta ukuran HTML (bytes).
+    """
+    ttfb, total, size = [], [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get("index.php", stream=True)
+        ttfb.append(time.perf_counter() - start)
+        body = response.content
+        total.append(time.perf_counter() - start)
+        size = len(body)
+    return {
+        "ttfb_ms": round(statistics.median(ttfb) * 1000, 1),
+        "transfer_ms": round(statistics.median(total) * 1000, 1),
+        "html_bytes": size,
+    }
+
+
+def measure_datatables(driver, repeat, query=SEARCH_QUERY):
+    """
+    Ukur waktu init DataTables dan latency filter per keystroke.
+    Latency keystroke = waktu dari send_keys satu karakter sampai event
+    draw.dt dengan nilai search tersebut.
+    """
+    driver.get(f"{BASE_URL}/index.php")
+    wait_for_datatable(driver)
+
+    init_ms = [driver.execute_script(_DATATABLE_INIT_JS, "#employee") for _ in range(repeat)]
+    wait_for_datatable(driver)
+
+    keystrokes = []
+    search_box = driver.find_element(By.CSS_SELECTOR, "#employee_filter input")
+    for _ in range(repeat):
+        with datatable_redraw(driver, search=""):
+            driver.execute_script(_RESET_SEARCH_JS, "#employee")
+        typed = ""
+        for char in query:
+            typed += char
+            start = time.perf_counter()
+            with datatable_redraw(driver, search=typed):
+                search_box.send_keys(char)
+            keystrokes.append(time.perf_counter() - start)
+
+    return {
+        "datatables_init_ms": round(statistics.median(init_ms), 1),
+        "keystroke_ms_median": round(statistics.median(keystrokes) * 1000, 1),
+        "keystroke_ms_max": round(max(keystrokes) * 1000, 1),
+    }
+
+
+def clear_seeded():
+    """Hapus kontak sintetis agar tabel kembali ke data asli."""
+    connection = database.connect(database.DEFAULT_DATABASE)
+    try:
+        return seed_contacts.clear_synthetic(connection)
+    finally:
+        connection.close()
+
+
+def run_sweep(sizes, repeat, ttfb_budget_ms, keystroke_budget_ms):
+    """Jalankan benchmark untuk setiap ukuran tabel."""
+    client = DamnCRUDClient(BASE_URL, timeout=120)
+    client.login(USERNAME, PASSWORD)
+    driver = create_driver()
+    driver.set_page_load_timeout(300)
+    results = []
+
+    try:
+        inject_login(driver, BASE_URL, USERNAME, PASSWORD)
+        for size in sizes:
+            print(f"\n▶ {size} kontak sintetis")
+            seeded = seed_contacts.seed_contacts(size, replace=True)
+            print(f"   ✓ Seeding selesai dalam {seeded['seconds']}s")
+
+            result = {"size": size}
+            result.update(measure_index_http(client, repeat))
+            result.update(measure_datatables(driver, repeat))
+            result["within_budget"] = (
+                result["ttfb_ms"] <= ttfb_budget_ms
+                and result["keystroke_ms_median"] <= keystroke_budget_ms
+            )
+            results.append(result)
+            print(f"   ✓ TTFB {result['ttfb_ms']} ms, HTML {result['html_bytes'] / 1024:.0f} KB, "
+                  f"init {result['datatables_init_ms']} ms, "
+                  f"keystroke {result['keystroke_ms_median']} ms")
+    finally:
+        driver.quit()
+        client.close()
+        clear_seeded()
+
+    return results
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+
+def print_table(results):
+    """Tampilkan hasil sweep sebagai tabel."""
+    header = (f"{'Rows':>8} | {'TTFB ms':>8} | {'Transfer ms':>11} | {'HTML KB':>8} | "
+              f"{'DT init ms':>10} | {'Key p50 ms':>10} | {'Key max ms':>10} | Budget")
+    print("\n" + "=" * len(header))
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['size']:>8} | {r['ttfb_ms']:>8} | {r['transfer_ms']:>11} | "
+              f"{r['html_bytes'] / 1024:>8.0f} | {r['datatables_init_ms']:>10} | "
+              f"{r['keystroke_ms_median']:>10} | {r['keystroke_ms_max']:>10} | "
+              f"{'OK' if r['within_budget'] else 'OVER'}")
+    print("=" * len(header))
+
+    breaking = next((r["size"] for r in results if not r["within_budget"]), None)
+    if breaking is None:
+        print("Semua ukuran masih dalam budget")
+    else:
+        print(f"Halaman berhenti scale mulai {breaking} kontak")
+    return breaking
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling sweep index.php + DataTables")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="jumlah kontak sintetis per langkah")
+    parser.add_argument("--repeat", type=int, default=3, help="sampel per ukuran (median)")
+    parser.add_argument("--ttfb-budget-ms", type=float, default=1000,
+                        help="batas TTFB index.php (default 1000 ms)")
+    parser.add_argument("--keystroke-budget-ms", type=float, default=100,
+                        help="batas latency filter per keystroke (default 100 ms)")
+    parser.add_argument("--output", default="bench_scaling.json", help="file JSON hasil")
+    args = parser.parse_args()
+
+    results = run_sweep(args.sizes, args.repeat, args.ttfb_budget_ms, args.keystroke_budget_ms)
+    breaking = print_table(results)
+
+    with open(args.output, "w") as f:
+        json.dump({
+            "base_url": BASE_URL,
+            "executed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "budgets": {"ttfb_ms": args.ttfb_budget_ms, "keystroke_ms": args.keystroke_budget_ms},
+            "stops_scaling_at": breaking,
+            "results": results,
+        }, f, indent=2)
+    print(f"\n✓ Hasil disimpan ke {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+=============================================================================
+BENCHMARK - Timing Fase Test, Baseline & Regression Gate
+=============================================================================
+File: benchmark.py
+Mengukur durasi fase bernama (login, load dashboard, submit form, search)
+di dalam flow test yang bertanda @pytest.mark.benchmark. Saat mode
+benchmark aktif, setiap test dijalankan beberapa putaran (warmup + sampel),
+lalu median dan p95 tiap fase dibandingkan dengan baseline JSON di
+benchmarks/baseline.json.
+
+Konfigurasi (environment variable):
+- BENCHMARK           : 1 untuk mengaktifkan mode benchmark
+- BENCHMARK_ROUNDS    : jumlah putaran yang diukur (default 5)
+- BENCHMARK_WARMUP    : jumlah putaran warmup, tidak diukur (default 1)
+- BENCHMARK_THRESHOLD : toleransi regresi relatif (default 0.25 = 25%)
+- BENCHMARK_MIN_DELTA_MS : selisih minimum agar dianggap regresi (default 5)
+- BENCHMARK_FAIL      : 1 agar regresi, atau fase tanpa baseline, menggagalkan
+                        run (default hanya warning)
+- BENCHMARK_SAVE      : 1 untuk menulis hasil run ini sebagai baseline baru
+
+CARA MENJALANKAN:
+- Ukur & bandingkan : BENCHMARK=1 pytest test_pytest.py -m benchmark
+- Simpan baseline   : BENCHMARK=1 BENCHMARK_SAVE=1 pytest test_pytest.py -m benchmark
+- Gate di CI        : BENCHMARK=1 BENCHMARK_FAIL=1 pytest test_pytest.py -m benchmark
+
+Putaran benchmark harus berjalan serial (tanpa -n): warmup hanya
+memanaskan worker yang menjalankannya, sehingga conftest.py menolak
+BENCHMARK=1 bersama pytest -n.
+=============================================================================
+"""
+
+import json
+import math
+import os
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+
+BASELINE_PATH = Path(__file__).resolve().parent / "benchmarks" / "baseline.json"
+
+
+# =============================================================================
+# CONFIG
+# =============================================================================
+
+def enabled():
+    """True jika mode benchmark aktif (BENCHMARK=1)."""
+    return os.environ.get("BENCHMARK", "0") == "1"
+
+
+def rounds():
+    return int(os.environ.get("BENCHMARK_ROUNDS", "5"))
+
+
+def warmup_rounds():
+    return int(os.environ.get("BENCHMARK_WARMUP", "1"))
+
+
+def threshold():
+    return float(os.environ.get("BENCHMARK_THRESHOLD", "0.25"))
+
+
+def min_delta_ms():
+    return float(os.environ.get("BENCHMARK_MIN_DELTA_MS", "5"))
+
+
+def fail_on_regression():
+    return os.environ.get("BENCHMARK_FAIL", "0") == "1"
+
+
+def save_requested():
+    return os.environ.get("BENCHMARK_SAVE", "0") == "1"
+
+
+def round_params():
+    """
+    Parameter putaran untuk parametrize: (index, warmup).
+    Putaran warmup dijalankan lebih dulu dan tidak dicatat.
+    """
+    warmup = [(n, True) for n in range(warmup_rounds())]
+    measured = [(n, False) for n in range(rounds())]
+    return warmup + measured
+
+
+def round_id(param):
+    index, warmup = param
+    return f"warmup{index + 1}" if warmup else f"round{index + 1}"
+
+
+# =============================================================================
+# RECORDER
+# =============================================================================
+
+class Benchmark:
+    """
+    Pencatat durasi fase untuk satu test (satu putaran).
+    Gunakan phase() sebagai context manager di dalam flow test:
+
+        with benchmark.phase("submit_create"):
+            save_button.click()
+            WebDriverWait(driver, 10).until(EC.url_contains("index.php"))
+    """
+
+    def __init__(self, name, warmup=False):
+        self.name = name
+        self.warmup = warmup
+        self.samples = {}
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples.setdefault(name, []).append(time.perf_counter() - start)
+
+
+# =============================================================================
+# STATISTICS
+# =============================================================================
+
+def percentile(values, pct):
+    """Percentile nearest-rank dari list angka."""
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(samples):
+    """
+    Ringkas sampel {test: {phase: [detik, ...]}} menjadi
+    {test: {phase: {count, median_ms, p95_ms, min_ms, max_ms}}}.
+    """
+    summary = {}
+    for test, phases in samples.items():
+        for phase, values in phases.items():
+            summary.setdefault(test, {})[phase] = {
+                "count": len(values),
+                "median_ms": round(statistics.median(values) * 1000, 1),
+                "p95_ms": round(percentile(values, 95) * 1000, 1),
+                "min_ms": round(min(values) * 1000, 1),
+                "max_ms": round(max(values) * 1000, 1),
+            }
+    return summary
+
+
+def compare(summary, baseline, tolerance=None, min_delta=None):
+    """
+    Bandingkan ringkasan run ini dengan baseline. Fase dianggap regresi
+    jika median atau p95 naik lebih dari `tolerance` (relatif) dan lebih
+    dari `min_delta` ms. Mengembalikan list dict regresi.
+    """
+    tolerance = threshold() if tolerance is None else tolerance
+    min_delta = min_delta_ms() if min_delta is None else min_delta
+    regressions = []
+    for test, phases in summary.items():
+        for phase, current in phases.items():
+            base = baseline.get(test, {}).get(phase)
+            if not base:
+                continue
+            for metric in ("median_ms", "p95_ms"):
+                delta = current[metric] - base[metric]
+                if delta > min_delta and current[metric] > base[metric] * (1 + tolerance):
+                    regressions.append({
+                        "test": test, "phase": phase, "metric": metric,
+                        "baseline": base[metric], "current": current[metric],
+                    })
+    return regressions
+
+
+def missing_baseline(summary, baseline):
+    """Pasangan (test, fase) di ringkasan run ini yang belum punya baseline."""
+    return [
+        (test, phase)
+        for test, phases in summary.items()
+        for phase in phases
+        if not baseline.get(test, {}).get(phase)
+    ]
+
+
+# =============================================================================
+# BASELINE FILE
+# =============================================================================
+
+def load_baseline(path=BASELINE_PATH):
+    """Baca baseline {test: {phase: ringkasan}}; kosong jika file belum ada."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8")).get("tests", {})
+
+
+def save_baseline(summary, path=BASELINE_PATH):
+    """
+    Tulis ringkasan run ini sebagai baseline. Test yang tidak ikut
+    dijalankan tetap memakai baseline lamanya.
+    """
+    path = Path(path)
+    tests = load_baseline(path)
+    tests.update(summary)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "rounds": rounds(),
+        "warmup": warmup_rounds(),
+        "tests": tests,
+    }, indent=2, sort_keys=True) + "\n", encoding="utf-8")
@@ -0,0 +1,316 @@
+"""
+=============================================================================
+BROWSER - Fast Chrome Startup dengan Cache ChromeDriver
+=============================================================================
+File: browser.py
+Satu jalur untuk meluncurkan Chrome di semua suite (test_simple.py,
+test_damncrud.py, fixture pytest). ChromeDriver di-resolve sekali per
+versi mayor Chrome lalu disimpan di cache lokal, sehingga startup
+berikutnya tidak butuh network sama sekali.
+
+Urutan resolve ChromeDriver:
+1. CHROMEDRIVER_PATH (environment variable)
+2. Cache: <CHROMEDRIVER_CACHE>/drivers.json per versi mayor Chrome
+3. chromedriver di PATH dengan versi mayor yang cocok
+4. webdriver-manager (butuh network), hasilnya disimpan ke cache
+Jika semua gagal, Selenium Manager bawaan Selenium yang dipakai.
+
+Setiap startup dicatat (resolve driver, spawn proses, first page load)
+dan diringkas di akhir run.
+
+Konfigurasi (environment variable):
+- CHROMEDRIVER_PATH  : path chromedriver yang dipakai langsung
+- CHROMEDRIVER_CACHE : folder cache (default ~/.cache/damncrud/chromedriver)
+- CHROME_BIN         : path binary Chrome jika tidak ada di PATH
+- CHROME_PROFILE     : profil launch untuk semua suite (fast, faithful, debug)
+                       (default: fixture pytest fast, script manual debug)
+- HEADLESS           : 1/0 untuk memaksa mode headless/headed di semua suite
+                       (default mengikuti profil)
+
+Profil launch (PROFILES, satu-satunya tempat argumen Chrome didefinisikan):
+- fast     : headless, tanpa gambar, background networking, component
+             update, extension, sync, font remote dan fitur renderer yang
+             tidak dipakai test. Default fixture pytest.
+- faithful : headless dengan argumen minimal, halaman dirender seperti di
+             browser user (gambar ikut dimuat). Dipakai test page budget.
+- debug    : headed dan maximized untuk melihat test berjalan.
+Dampak tiap profil diukur dengan bench_profiles.py.
+=============================================================================
+"""
+
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+
+CACHE_DIR = Path(os.environ.get(
+    "CHROMEDRIVER_CACHE", Path.home() / ".cache" / "damncrud" / "chromedriver"
+))
+CACHE_FILE = CACHE_DIR / "drivers.json"
+
+CHROME_CANDIDATES = (
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+    "C:/Program Files/Google/Chrome/Application/chrome.exe",
+    "C:/Program Files (x86)/Google/Chrome/Application/chrome.exe",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+)
+
+_VERSION_RE = re.compile(r"(\d+)\.\d+\.\d+(?:\.\d+)?")
+
+# Hasil resolve di proses ini: (path atau None, sumber)
+_resolved = None
+
+# Catatan startup per proses (worker), dikirim ke controller lewat conftest
+STARTUP_LOG = []
+
+
+# =============================================================================
+# VERSION DETECTION
+# =============================================================================
+
+def chrome_binary():
+    """Path binary Chrome, atau None jika tidak ditemukan."""
+    if os.environ.get("CHROME_BIN"):
+        return os.environ["CHROME_BIN"]
+    for candidate in CHROME_CANDIDATES:
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            return path
+    return None
+
+
+def _binary_major(path):
+    """Versi mayor dari output `<binary> --version`, atau None."""
+    try:
+        output = subprocess.run(
+            [path, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = _VERSION_RE.search(output)
+    return int(match.group(1)) if match else None
+
+
+def chrome_major_version(binary=None):
+    """
+    Versi mayor Chrome yang terpasang, tanpa network.
+    Di Windows chrome.exe --version tidak mencetak apa pun, sehingga versi
+    dibaca dari nama folder versi di samping chrome.exe.
+    """
+    binary = binary or chrome_binary()
+    if not binary:
+        return None
+    if sys.platform == "win32":
+        for entry in Path(binary).parent.iterdir():
+            match = _VERSION_RE.fullmatch(entry.name)
+            if entry.is_dir() and match:
+                return int(match.group(1))
+        return None
+    return _binary_major(binary)
+
+
+# =============================================================================
+# CHROMEDRIVER CACHE
+# =============================================================================
+
+def _load_cache():
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_cache(major, path):
+    """Simpan path driver untuk versi mayor (atomic, aman untuk worker paralel)."""
+    cache = _load_cache()
+    cache[str(major)] = str(path)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, CACHE_FILE)
+
+
+def resolve_chromedriver():
+    """
+    Cari chromedriver untuk Chrome yang terpasang.
+    Mengembalikan (path, sumber); path None berarti serahkan ke Selenium Manager.
+    """
+    global _resolved
+    if _resolved is not None:
+        return _resolved
+
+    if os.environ.get("CHROMEDRIVER_PATH"):
+        _resolved = (os.environ["CHROMEDRIVER_PATH"], "env")
+        return _resolved
+
+    major = chrome_major_version()
+    cached = _load_cache().get(str(major)) if major else None
+    if cached and os.path.isfile(cached):
+        _resolved = (cached, "cache")
+        return _resolved
+
+    on_path = shutil.which("chromedriver")
+    if on_path and major and _binary_major(on_path) == major:
+        _store_cache(major, on_path)
+        _resolved = (on_path, "path")
+        return _resolved
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        downloaded = ChromeDriverManager().install()
+        if major:
+            _store_cache(major, downloaded)
+        _resolved = (downloaded, "webdriver-manager")
+    except Exception as exc:  # offline atau webdriver-manager tidak terpasang
+        print(f"\n⚠️ ChromeDriver tidak bisa di-resolve ({exc}), memakai Selenium Manager")
+        _resolved = (None, "selenium-manager")
+    return _resolved
+
+
+# =============================================================================
+# LAUNCH PROFILES
+# =============================================================================
+
+_BASE_ARGS = ("--no-sandbox", "--disable-dev-shm-usage", "--window-size=1920,1080", "--disable-notifications")
+
+PROFILES = {
+    "fast": {
+        "headless": True,
+        "args": _BASE_ARGS + (
+            "--disable-gpu",
+            "--disable-infobars",
+            "--blink-settings=imagesEnabled=false",
+            "--disable-background-networking",
+            "--disable-background-timer-throttling",
+            "--disable-component-update",
+            "--disable-extensions",
+            "--disable-default-apps",
+            "--disable-sync",
+            "--disable-client-side-phishing-detection",
+            "--disable-domain-reliability",
+            "--disable-breakpad",
+            "--disable-remote-fonts",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--metrics-recording-only",
+            "--mute-audio",
+            "--password-store=basic",
+            "--disable-features=Translate,OptimizationHints,MediaRouter,"
+            "InterestFeedContentSuggestions,CalculateNativeWinOcclusion,BackForwardCache",
+        ),
+        # Pengaman kedua jika blink-settings diabaikan versi Chrome tertentu
+        "prefs": {"profile.managed_default_content_settings.images": 2},
+    },
+    "faithful": {
+        "headless": True,
+        "args": _BASE_ARGS + ("--disable-gpu", "--disable-extensions", "--disable-infobars"),
+        "prefs": {},
+    },
+    "debug": {
+        "headless": False,
+        "args": ("--start-maximized", "--disable-notifications"),
+        "prefs": {},
+    },
+}
+
+
+def headless(default):
+    """True jika Chrome diluncurkan headless (HEADLESS, run_tests.py --headless)."""
+    value = os.environ.get("HEADLESS")
+    return default if value is None else value != "0"
+
+
+def resolve_profile(profile=None, default="fast"):
+    """Nama profil: argumen eksplisit > CHROME_PROFILE > default suite."""
+    name = profile or os.environ.get("CHROME_PROFILE") or default
+    if name not in PROFILES:
+        raise ValueError(f"Profil Chrome tidak dikenal: {name} (pilihan: {', '.join(PROFILES)})")
+    return name
+
+
+def chrome_options(profile):
+    """Options Chrome untuk profil `profile` (HEADLESS tetap bisa memaksa mode)."""
+    spec = PROFILES[profile]
+    options = Options()
+    if headless(spec["headless"]):
+        options.add_argument("--headless")
+    for argument in spec["args"]:
+        options.add_argument(argument)
+    if spec["prefs"]:
+        options.add_experimental_option("prefs", spec["prefs"])
+    return options
+
+
+# =============================================================================
+# STARTUP
+# =============================================================================
+
+def create_chrome(options, first_url=None, profile=None, setup=None):
+    """
+    Luncurkan Chrome dengan ChromeDriver dari cache dan catat durasi
+    resolve driver, spawn proses dan (opsional) first page load.
+
+    setup(driver) dipanggil setelah spawn dan sebelum first page load
+    (mis. cdn_cache.install), sehingga halaman pertama sudah memakainya.
+    """
+    start = time.perf_counter()
+    path, source = resolve_chromedriver()
+    resolved = time.perf_counter()
+
+    service = Service(executable_path=path) if path else Service()
+    driver = webdriver.Chrome(service=service, options=options)
+    spawned = time.perf_counter()
+
+    if setup:
+        setup(driver)
+    if first_url:
+        driver.get(first_url)
+    loaded = time.perf_counter()
+
+    STARTUP_LOG.append({
+        "source": source,
+        "profile": profile or "custom",
+        "resolve": resolved - start,
+        "spawn": spawned - resolved,
+        "first_load": loaded - spawned if first_url else None,
+    })
+    return driver
+
+
+def summarize_startup(records):
+    """Rata-rata tiap komponen startup dan jumlah per sumber driver dan profil."""
+    summary = {"launches": len(records), "sources": {}, "profiles": {}}
+    for record in records:
+        summary["sources"][record["source"]] = summary["sources"].get(record["source"], 0) + 1
+        profile = record.get("profile", "custom")
+        summary["profiles"][profile] = summary["profiles"].get(profile, 0) + 1
+    for phase in ("resolve", "spawn", "first_load"):
+        values = [record[phase] for record in records if record[phase] is not None]
+        summary[phase] = statistics.mean(values) if values else None
+    return summary
+
+
+def format_startup(records):
+    """Baris laporan startup untuk terminal summary / output script."""
+    summary = summarize_startup(records)
+    phases = "  ".join(
+        f"{phase}={summary[phase] * 1000:.0f}ms" if summary[phase] is not None else f"{phase}=-"
+        for phase in ("resolve", "spawn", "first_load")
+    )
+    sources = ", ".join(f"{source}={count}" for source, count in sorted(summary["sources"].items()))
+    profiles = ", ".join(f"{profile}={count}" for profile, count in sorted(summary["profiles"].items()))
+    return [
+        f"Launches: {summary['launches']}  driver source: {sources}  profile: {profiles}",
+        f"Mean per launch: {phases}",
+    ]
@@ -0,0 +1,238 @@
+"""
+=============================================================================
+BROWSER POOL - Reusable Chrome Instance per Worker
+=============================================================================
+File: browser_pool.py
+Menyimpan browser Chrome yang sudah diluncurkan agar bisa dipakai ulang
+oleh test berikutnya di worker pytest-xdist yang sama, alih-alih
+meluncurkan dan menutup Chrome di setiap test.
+
+Antar test, state browser di-reset (cookies, storage, tab, alert).
+Browser di-recycle setelah dipakai N test atau jika memorinya terlalu besar.
+
+Konfigurasi (environment variable):
+- BROWSER_POOL_MAX_USES   : jumlah test maksimal per browser (default 25)
+- BROWSER_POOL_MAX_RSS_MB : batas RSS proses Chrome dalam MB (default 1024)
+=============================================================================
+"""
+
+import os
+import time
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+
+DEFAULT_MAX_USES = int(os.environ.get("BROWSER_POOL_MAX_USES", "25"))
+DEFAULT_MAX_RSS_MB = int(os.environ.get("BROWSER_POOL_MAX_RSS_MB", "1024"))
+
+
+# =============================================================================
+# MEMORY PROBE
+# =============================================================================
+
+def _process_memory(pid, pss=False):
+    """
+    Memori satu proses dalam bytes: VmRSS, atau PSS (smaps_rollup) jika
+    pss=True dengan fallback ke VmRSS. 0 jika proses sudah selesai.
+    """
+    sources = [(f"/proc/{pid}/status", "VmRSS:")]
+    if pss:
+        sources.insert(0, (f"/proc/{pid}/smaps_rollup", "Pss:"))
+    for path, field in sources:
+        try:
+            with open(path) as f:
+                for line in f:
+                    if line.startswith(field):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            continue
+    return 0
+
+
+def _process_tree_rss(root_pid, pss=False):
+    """
+    Hitung total RSS (bytes) dari proses root_pid beserta semua turunannya.
+    Chrome berjalan sebagai anak dari chromedriver, jadi yang diukur adalah
+    pohon proses chromedriver. pss=True menjumlahkan PSS, yang membagi
+    halaman shared antar proses renderer sehingga tidak dihitung berulang.
+    Mengembalikan None jika /proc tidak tersedia.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # Field ke-4 (ppid) berada setelah nama proses "(...)"
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += _process_memory(pid, pss)
+        stack.extend(children.get(pid, []))
+    return total
+
+
+def driver_rss(driver, pss=False):
+    """
+    RSS (bytes) dari proses chromedriver + Chrome milik driver ini
+    (PSS jika pss=True), atau None jika tidak bisa diukur.
+    """
+    try:
+        pid = driver.service.process.pid
+    except AttributeError:
+        return None
+    return _process_tree_rss(pid, pss)
+
+
+# =============================================================================
+# BROWSER POOL
+# =============================================================================
+
+class BrowserPool:
+    """
+    Pool browser untuk satu worker (satu proses pytest).
+
+    Pemakaian:
+        pool = BrowserPool(create_driver, base_url=BASE_URL)
+        driver = pool.acquire()
+        ...
+        pool.release(driver)
+        pool.close()
+    """
+
+    def __init__(self, factory, base_url=None, max_uses=DEFAULT_MAX_USES,
+                 max_rss_mb=DEFAULT_MAX_RSS_MB, stats=None):
+        self.factory = factory
+        self.base_url = base_url
+        self.max_uses = max_uses
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024
+        self._idle = []
+        self._uses = {}
+        # stats bisa dibagi beberapa pool (mis. pool per profil Chrome)
+        self.stats = stats if stats is not None else {
+            "acquired": 0,
+            "launches": 0,
+            "launch_seconds": 0.0,
+            "recycled_max_uses": 0,
+            "recycled_memory": 0,
+            "discarded_broken": 0,
+        }
+
+    # -------------------------------------------------------------------------
+    # PUBLIC API
+    # -------------------------------------------------------------------------
+
+    def acquire(self):
+        """Ambil browser dari pool, luncurkan baru jika pool kosong."""
+        self.stats["acquired"] += 1
+        if self._idle:
+            return self._idle.pop()
+
+        start = time.perf_counter()
+        driver = self.factory()
+        self.stats["launch_seconds"] += time.perf_counter() - start
+        self.stats["launches"] += 1
+        self._uses[id(driver)] = 0
+        return driver
+
+    def release(self, driver):
+        """
+        Kembalikan browser ke pool setelah test selesai.
+        Browser di-reset; jika gagal reset, sudah terlalu sering dipakai,
+        atau memorinya melebihi batas, browser ditutup.
+        """
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+
+        try:
+            self.reset(driver)
+        except WebDriverException:
+            self.stats["discarded_broken"] += 1
+            self._quit(driver)
+            return
+
+        if self._uses[id(driver)] >= self.max_uses:
+            self.stats["recycled_max_uses"] += 1
+            self._quit(driver)
+            return
+
+        rss = driver_rss(driver)
+        if rss is not None and rss > self.max_rss_bytes:
+            self.stats["recycled_memory"] += 1
+            self._quit(driver)
+            return
+
+        self._idle.append(driver)
+
+    def reset(self, driver):
+        """
+        Bersihkan state browser agar test berikutnya terisolasi:
+        alert, tab tambahan, cookies, localStorage dan sessionStorage.
+        """
+        # 1. Tutup alert yang masih terbuka
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+
+        # 2. Tutup semua tab selain tab pertama
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # 3. Hapus cookies & storage (lewat CDP agar semua origin ikut bersih)
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            if self.base_url:
+                parts = urlsplit(self.base_url)
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                    "origin": f"{parts.scheme}://{parts.netloc}",
+                    "storageTypes": "local_storage,session_storage,indexeddb,cache_storage",
+                })
+        except (AttributeError, WebDriverException):
+            # Fallback untuk driver non-Chromium
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+            driver.delete_all_cookies()
+
+        # 4. Kosongkan halaman agar tidak ada script yang masih berjalan
+        driver.get("about:blank")
+
+    def close(self):
+        """Tutup semua browser yang masih ada di pool."""
+        while self._idle:
+            self._quit(self._idle.pop())
+
+    def _quit(self, driver):
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+
+def format_pool_stats(stats):
+    """Format ringkasan statistik pool untuk terminal summary."""
+    saved = stats["acquired"] - stats["launches"]
+    avg_launch = stats["launch_seconds"] / stats["launches"] if stats["launches"] else 0.0
+    return [
+        f"Tests served      : {stats['acquired']}",
+        f"Chrome launches   : {stats['launches']} (avg {avg_launch:.2f}s)",
+        f"Launches saved    : {saved} (~{saved * avg_launch:.1f}s)",
+        f"Recycled (uses)   : {stats['recycled_max_uses']}",
+        f"Recycled (memory) : {stats['recycled_memory']}",
+        f"Discarded (broken): {stats['discarded_broken']}",
+    ]
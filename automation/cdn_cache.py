@@ -0,0 +1,315 @@
+"""
+=============================================================================
+CDN CACHE - Offline Asset Interception lewat Chrome DevTools Protocol
+=============================================================================
+File: cdn_cache.py
+style_script() di functions.php memuat Bootstrap, jQuery dan DataTables
+dari cdn.jsdelivr.net, code.jquery.com dan cdn.datatables.net. Di runner
+CI dengan network lambat/terputus, halaman tertahan sampai timeout dan
+DataTables kadang tidak pernah terinisialisasi.
+
+Modul ini memasang CDP Fetch interception pada browser: request ke host
+CDN di atas dijawab langsung dari cache lokal automation/assets/cdn/
+(Fetch.fulfillRequest). Asset yang tidak ada di cache diteruskan ke
+network dan dicatat sebagai miss di akhir run.
+
+Cache bersifat versioned dan di-commit ke repository: path file mengikuti
+URL (mis. cdn.datatables.net/1.10.20/js/jquery.dataTables.min.js) dan
+manifest.json menyimpan sha256 + ukuran tiap file. CI hanya memverifikasi
+cache, tidak pernah men-download atau menulis ulang manifest.
+
+Konfigurasi (environment variable):
+- CDN_CACHE : 0 untuk mematikan interception (default 1)
+
+CARA MENGISI CACHE (maintainer, saat versi asset di functions.php berubah):
+- python cdn_cache.py --fetch     # download asset style_script() yang belum
+                                    di-pin, tulis manifest, lalu commit hasilnya
+- python cdn_cache.py --verify    # cek file cache terhadap manifest (CI);
+                                    exit 1 jika ada file hilang/rusak
+=============================================================================
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+
+
+ASSETS_DIR = Path(__file__).resolve().parent / "assets" / "cdn"
+MANIFEST_PATH = ASSETS_DIR / "manifest.json"
+FUNCTIONS_PHP = Path(__file__).resolve().parent.parent / "functions.php"
+
+CDN_HOSTS = ("cdn.jsdelivr.net", "code.jquery.com", "cdn.datatables.net")
+CONTENT_TYPES = {
+    ".js": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+}
+
+# Statistik per proses (worker), dikirim ke controller lewat conftest
+STATS = {"served": 0, "missed": 0, "misses": []}
+
+
+def enabled():
+    """True jika interception CDN aktif (default aktif, CDN_CACHE=0 untuk mematikan)."""
+    return os.environ.get("CDN_CACHE", "1") == "1"
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+def asset_path(url):
+    """Lokasi file cache untuk sebuah URL CDN: assets/cdn/<host>/<path>."""
+    parts = urlsplit(url)
+    return ASSETS_DIR / parts.netloc / parts.path.lstrip("/")
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Baca manifest {url: {path, content_type, sha256, bytes}}."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8")).get("assets", {})
+
+
+def save_manifest(assets, path=MANIFEST_PATH):
+    Path(path).write_text(
+        json.dumps({"assets": assets}, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+class AssetCache:
+    """
+    Isi cache yang sudah diverifikasi sha256-nya, dimuat sekali per proses.
+    File yang hilang atau tidak cocok dengan manifest dianggap tidak ada.
+    """
+
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        self._assets = {}
+        for url, entry in load_manifest(manifest_path).items():
+            file = ASSETS_DIR / entry["path"]
+            if not file.is_file():
+                continue
+            body = file.read_bytes()
+            if entry.get("sha256") and hashlib.sha256(body).hexdigest() != entry["sha256"]:
+                continue
+            self._assets[url] = (base64.b64encode(body).decode("ascii"), entry["content_type"])
+
+    def __len__(self):
+        return len(self._assets)
+
+    def lookup(self, url):
+        """(body_base64, content_type) untuk URL, atau None jika tidak di-cache."""
+        return self._assets.get(url.split("#", 1)[0])
+
+
+_shared_cache = None
+
+
+def shared_cache():
+    """AssetCache yang dipakai bersama oleh semua browser di proses ini."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = AssetCache()
+    return _shared_cache
+
+
+# =============================================================================
+# CDP FETCH INTERCEPTOR
+# =============================================================================
+
+class CdnInterceptor:
+    """
+    Jawab request ke host CDN dari AssetCache lewat CDP Fetch domain.
+
+    Event Fetch.requestPaused hanya bisa diterima lewat koneksi websocket
+    DevTools (driver.bidi_connection()), sehingga interceptor berjalan di
+    thread tersendiri dengan event loop trio selama browser hidup.
+    """
+
+    def __init__(self, driver, cache=None, stats=STATS):
+        self.driver = driver
+        self.cache = cache or shared_cache()
+        self.stats = stats
+        self.error = None
+        self._ready = threading.Event()
+        self._thread = None
+
+    def start(self, timeout=10):
+        """Mulai interception; kembali setelah Fetch.enable aktif."""
+        self._thread = threading.Thread(target=self._run_thread, name="cdn-interceptor", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout)
+        return self.error is None and self._ready.is_set()
+
+    def _run_thread(self):
+        import trio
+
+        try:
+            trio.run(self._run)
+        except Exception as exc:  # koneksi DevTools tertutup saat browser quit
+            self.error = exc
+        finally:
+            self._ready.set()
+
+    async def _run(self):
+        import trio
+
+        async with self.driver.bidi_connection() as connection:
+            session, devtools = connection.session, connection.devtools
+            patterns = [devtools.fetch.RequestPattern(url_pattern=f"https://{host}/*") for host in CDN_HOSTS]
+            await session.execute(devtools.fetch.enable(patterns=patterns))
+            self._ready.set()
+
+            async with trio.open_nursery() as nursery:
+                async for event in session.listen(devtools.fetch.RequestPaused):
+                    nursery.start_soon(self._handle, session, devtools, event)
+
+    async def _handle(self, session, devtools, event):
+        """
+        Jawab satu request yang tertahan. Request yang gagal dijawab dari
+        cache diteruskan ke network (atau digagalkan) agar halaman tidak
+        menggantung, dan exception tidak menghentikan nursery interceptor.
+        """
+        try:
+            await self._respond(session, devtools, event)
+        except Exception:
+            self.stats["missed"] += 1
+            self.stats["misses"].append(event.request.url)
+            try:
+                await session.execute(devtools.fetch.continue_request(request_id=event.request_id))
+            except Exception:
+                try:
+                    await session.execute(devtools.fetch.fail_request(
+                        request_id=event.request_id, error_reason=devtools.network.ErrorReason.FAILED,
+                    ))
+                except Exception:  # koneksi DevTools sudah tertutup
+                    pass
+
+    async def _respond(self, session, devtools, event):
+        url = event.request.url
+        cached = self.cache.lookup(url)
+        if cached is None:
+            self.stats["missed"] += 1
+            self.stats["misses"].append(url)
+            await session.execute(devtools.fetch.continue_request(request_id=event.request_id))
+            return
+
+        body, content_type = cached
+        headers = [
+            devtools.fetch.HeaderEntry(name="Content-Type", value=content_type),
+            devtools.fetch.HeaderEntry(name="Access-Control-Allow-Origin", value="*"),
+            devtools.fetch.HeaderEntry(name="Cache-Control", value="public, max-age=31536000"),
+        ]
+        await session.execute(devtools.fetch.fulfill_request(
+            request_id=event.request_id, response_code=200, response_headers=headers, body=body,
+        ))
+        self.stats["served"] += 1
+
+
+def install(driver):
+    """
+    Pasang CdnInterceptor pada driver Chrome baru (jika CDN_CACHE aktif).
+    Dipakai sebagai create_chrome(..., setup=cdn_cache.install) agar aktif
+    sebelum first page load. Jika DevTools tidak tersedia, browser tetap
+    berjalan memakai network.
+    """
+    if not enabled():
+        return None
+    interceptor = CdnInterceptor(driver)
+    if not interceptor.start():
+        print(f"\n⚠️ CDN interception tidak aktif: {interceptor.error}")
+        return None
+    return interceptor
+
+
+def format_stats(stats):
+    """Baris ringkasan untuk terminal summary."""
+    lines = [f"Served from cache: {stats['served']}  missed: {stats['missed']}"]
+    for url in sorted(set(stats["misses"])):
+        lines.append(f"  miss: {url}")
+    return lines
+
+
+# =============================================================================
+# FETCH TOOL
+# =============================================================================
+
+def style_script_urls(path=FUNCTIONS_PHP):
+    """URL asset CDN yang dimuat style_script() di functions.php."""
+    text = Path(path).read_text(encoding="utf-8")
+    urls = re.findall(r'(?:href|src)="(https://[^"]+)"', text)
+    return [url for url in dict.fromkeys(urls) if urlsplit(url).netloc in CDN_HOSTS]
+
+
+def fetch_assets(urls, timeout=30):
+    """Download asset yang belum ada di cache dan perbarui manifest."""
+    assets = load_manifest()
+    for url in urls:
+        file = asset_path(url)
+        if not file.is_file():
+            response = requests.get(url, timeout=timeout)
+            response.raise_for_status()
+            file.parent.mkdir(parents=True, exist_ok=True)
+            file.write_bytes(response.content)
+            print(f"✓ {url}")
+        body = file.read_bytes()
+        assets[url] = {
+            "path": file.relative_to(ASSETS_DIR).as_posix(),
+            "content_type": CONTENT_TYPES.get(file.suffix, "application/octet-stream"),
+            "sha256": hashlib.sha256(body).hexdigest(),
+            "bytes": len(body),
+        }
+    save_manifest(assets)
+    return assets
+
+
+def unpinned_urls(urls):
+    """URL style_script() yang belum tercatat di manifest (tetap lewat network)."""
+    assets = load_manifest()
+    return [url for url in urls if url not in assets]
+
+
+def verify_assets():
+    """Kembalikan daftar URL di manifest yang filenya hilang atau rusak."""
+    broken = []
+    for url, entry in load_manifest().items():
+        file = ASSETS_DIR / entry["path"]
+        if not file.is_file() or hashlib.sha256(file.read_bytes()).hexdigest() != entry.get("sha256"):
+            broken.append(url)
+    return broken
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kelola cache asset CDN untuk test offline")
+    parser.add_argument("--fetch", action="store_true",
+                        help="(maintainer) download asset yang belum di-pin dan tulis manifest")
+    parser.add_argument("--verify", action="store_true", help="cek file cache terhadap manifest")
+    args = parser.parse_args()
+
+    if args.fetch:
+        try:
+            assets = fetch_assets(style_script_urls())
+        except requests.RequestException as exc:
+            raise SystemExit(f"✗ Asset CDN gagal di-download: {exc}")
+        print(f"✓ {len(assets)} asset tercatat di {MANIFEST_PATH}; commit assets/cdn/")
+
+    # Verifikasi hanya membaca: manifest dan file cache tidak pernah diubah
+    broken = verify_assets()
+    for url in broken:
+        print(f"✗ {url}")
+    for url in unpinned_urls(style_script_urls()):
+        print(f"⚠️ belum di-pin (dimuat dari network): {url}")
+    print(f"{len(load_manifest()) - len(broken)} asset OK, {len(broken)} hilang/rusak")
+    raise SystemExit(1 if broken else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,34 @@ Berisi fixtures dan hooks yang digunakan bersama oleh semua test
 
 import pytest
 import os
+import time
+import unittest
+import zlib
 from datetime import datetime
 
+import artifacts
+import auth
+import benchmark as bench
+import browser
+import cdn_cache
+import database
+import durations
+import health
+import history
+import page_metrics
+import pages
+import reruns
+import results
+import seed_contacts
+import waits
+from browser_pool import format_pool_stats
+from http_client import PASSWORD, USERNAME
+
+try:
+    from pytest_html import extras as html_extras
+except ImportError:
+    html_extras = None
+
 
 # =============================================================================
 # PYTEST HOOKS
@@ -30,28 +56,392 @@ def pytest_configure(config):
         config._metadata['Base URL'] = os.environ.get('BASE_URL', 'http://localhost:81/DamnCRUD')
         config._metadata['Parallel Workers'] = 'Auto (pytest-xdist)'
 
+    # Statistik yang dikumpulkan fixture selama test berjalan.
+    # Pada pytest-xdist, statistik tiap worker digabung di controller.
+    config._suite_stats = {}
+
+    # Catatan, statistik dan cache per proses dimulai kosong di setiap session
+    # (run_tests.py menjalankan beberapa session pytest dalam satu proses),
+    # sehingga tier berikutnya berjalan sama seperti pytest tersendiri:
+    # session login dan schema aktif milik tier sebelumnya tidak terbawa
+    for log in (waits.WAIT_LOG, browser.STARTUP_LOG, pages.FORM_LOG):
+        log.clear()
+    cdn_cache.STATS.update(served=0, missed=0, misses=[])
+    artifacts.STATS.update(dict.fromkeys(artifacts.STATS, 0))
+    results.pop_fixture_setup()
+    auth.clear_session_cache()
+    database.reset_active_database()
+
+    # Restore memakai trigger, tabel __seed, _test_changes dan AUTO_INCREMENT
+    # milik schema; tanpa isolasi semua worker xdist berbagi objek yang sama
+    # dan saling me-restore / me-reset data worker lain
+    distributed = not hasattr(config, 'workerinput') and config.getoption('numprocesses', None)
+    if distributed and database.restore_enabled() and not database.isolation_enabled():
+        raise pytest.UsageError(
+            "DB_RESTORE=1 dengan pytest -n butuh DB_ISOLATION=1 "
+            "(atau jalankan dengan -n 0 / DB_RESTORE=0)"
+        )
+    # Warmup hanya memanaskan worker yang menjalankannya; putaran yang
+    # tersebar ke worker lain mengukur browser dingin
+    if distributed and bench.enabled():
+        raise pytest.UsageError("BENCHMARK=1 harus dijalankan serial (-n 0 atau -p no:xdist)")
+
+    # Riwayat durasi test & utilisasi worker (hanya di controller)
+    if not hasattr(config, 'workerinput'):
+        config.pluginmanager.register(durations.DurationRecorder(config), 'duration_recorder')
+        config.pluginmanager.register(reruns.RerunReport(config), 'rerun_report')
+
+    # Stream hasil per fase ke results.jsonl (hanya di controller)
+    if not hasattr(config, 'workerinput') and results.enabled() and not config.option.collectonly:
+        config.pluginmanager.register(results.ResultsStream(config), 'results_stream')
+
+    # Artifact test gagal: satu folder run untuk controller dan semua worker
+    workerinput = getattr(config, 'workerinput', {})
+    config._artifact_run = workerinput.get('artifact_run') or artifacts.new_run_id()
+    artifacts.configure(config._artifact_run, workerinput.get('workerid', 'main'))
+
+
+def pytest_sessionstart(session):
+    """
+    Health gate (hanya di controller, sebelum worker/browser dimulai):
+    cek login.php, login HTTP dan tabel index.php. Jika gagal, run
+    dihentikan dengan diagnosis alih-alih setiap test timeout di browser.
+    """
+    config = session.config
+    if hasattr(config, 'workerinput') or config.option.collectonly or not health.enabled():
+        return
+
+    base_url = os.environ.get('BASE_URL', 'http://localhost:81/DamnCRUD')
+    checks = health.run_checks(base_url, USERNAME, PASSWORD)
+    lines = health.format_results(base_url, checks)
+    if not all(ok for _, ok, _, _ in checks):
+        pytest.exit("\n".join(lines + ["Run dihentikan: perbaiki environment atau set HEALTH_GATE=0"]),
+                    returncode=pytest.ExitCode.INTERRUPTED)
+
+    terminal = config.pluginmanager.get_plugin('terminalreporter')
+    if terminal is not None:
+        for line in lines:
+            terminal.write_line(line)
+
+
+def _test_tier(item):
+    """Urutan biaya: HTTP tanpa browser, test browser, lalu budget (Chrome khusus)."""
+    if item.get_closest_marker('http'):
+        return 0
+    if item.get_closest_marker('budget'):
+        return 2
+    return 1
+
+
+def _scope_group(item):
+    """
+    Node yang test-nya harus tetap berurutan: class unittest (setUpClass)
+    atau class/module yang memakai fixture scope class/module. Jika dipecah
+    oleh pengurutan, setup class/module dijalankan ulang. None jika bebas.
+    """
+    if item.cls is not None and issubclass(item.cls, unittest.TestCase):
+        return item.getparent(pytest.Class).nodeid
+    fixtureinfo = getattr(item, '_fixtureinfo', None)
+    scopes = {
+        fixturedefs[-1].scope for fixturedefs in fixtureinfo.name2fixturedefs.values()
+    } if fixtureinfo else set()
+    if scopes & {'module', 'package'}:
+        return item.getparent(pytest.Module).nodeid
+    if 'class' in scopes and item.cls is not None:
+        return item.getparent(pytest.Class).nodeid
+    return None
+
+
+def _duration_scheduling(config):
+    """True jika xdist membagi test dengan DurationScheduling (--dist load)."""
+    return config.getoption('dist', None) == 'load' and durations.enabled()
+
+
+def _shard_items(config, items, spec):
+    """
+    Simpan hanya test milik shard `spec` ('i/n', 1-based). Pembagian memakai
+    crc32 nodeid sehingga sama di setiap job CI dan setiap worker xdist.
+    Format divalidasi seperti run_tests.parse_shard: shard di luar 1..n
+    akan men-deselect semua test dan run terlihat lolos.
+    """
+    try:
+        index, count = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise pytest.UsageError(f"TEST_SHARD harus berformat i/n, bukan {spec!r}")
+    if not 1 <= index <= count:
+        raise pytest.UsageError(f"TEST_SHARD {spec} di luar 1..{count}")
+    selected, deselected = [], []
+    for item in items:
+        shard = zlib.crc32(item.nodeid.encode('utf-8')) % count + 1
+        (selected if shard == index else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
 
 def pytest_collection_modifyitems(config, items):
     """
     Hook untuk modifikasi test items setelah collection.
-    Menandai semua test dengan marker 'parallel'.
+    Jika TEST_SHARD=i/n diset (run_tests.py --shard), hanya test milik shard
+    tersebut yang dijalankan. Menandai semua test dengan marker 'parallel',
+    memberi budget rerun hanya pada test yang flaky menurut riwayat
+    (reruns.py), lalu mengurutkan test dari yang termurah (tier, lalu durasi
+    dari riwayat) agar kerusakan terlihat secepat mungkin. Pada worker
+    xdist dengan DurationScheduling, di dalam tier terlama dulu (LPT).
+    Test satu class/module yang berbagi setup (_scope_group) diurutkan
+    sebagai satu kelompok dengan urutan collection aslinya.
     """
+    if os.environ.get('TEST_SHARD'):
+        _shard_items(config, items, os.environ['TEST_SHARD'])
+
     for item in items:
         if "TestDamnCRUD" in str(item.cls):
             item.add_marker(pytest.mark.parallel)
 
+    rerun_policy = reruns.apply(config, items)
+    if rerun_policy:
+        config._suite_stats['rerun_policy'] = sorted(rerun_policy.items())
+
+    predicted, _ = durations.predict([item.nodeid for item in items], durations.load_history())
+    # Worker xdist dengan DurationScheduling: urutan ini menjadi urutan kirim,
+    # sehingga di dalam tier test terlama dulu (LPT)
+    longest_first = getattr(config, 'workerinput', {}).get('lpt_order', False)
+    sign = -1 if longest_first else 1
+    groups = {}
+    for item in items:
+        groups.setdefault(_scope_group(item) or item.nodeid, []).append(item)
+    ordered = sorted(groups.values(), key=lambda members: (
+        min(_test_tier(item) for item in members),
+        sign * sum(predicted[item.nodeid] for item in members),
+    ))
+    items[:] = [item for members in ordered for item in members]
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Hook parametrize. Saat mode benchmark aktif (BENCHMARK=1), test
+    bertanda 'benchmark' dijalankan beberapa putaran: warmup lalu sampel.
+    """
+    if not bench.enabled() or 'benchmark' not in metafunc.fixturenames:
+        return
+    if metafunc.definition.get_closest_marker('benchmark'):
+        params = bench.round_params()
+        metafunc.parametrize('benchmark', params, indirect=True,
+                             ids=[bench.round_id(param) for param in params])
+
 
 @pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """
+    Hook untuk mengukur biaya setup setiap fixture (browser, login, database).
+    """
+    with results.fixture_timer(fixturedef.argname):
+        yield
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Hook untuk menambahkan informasi tambahan ke report.
+    Hook untuk menambahkan informasi tambahan ke report setiap fase:
+    biaya setup fixture, description, page metrics, dan artifact saat gagal.
     """
     outcome = yield
     report = outcome.get_result()
-    
-    # Tambahkan docstring sebagai description
-    if report.when == "call":
+
+    # Biaya fixture di fase ini, diteruskan xdist ke controller (results.jsonl)
+    report.fixture_setup = results.pop_fixture_setup()
+
+    if report.when == 'call':
+        # Tambahkan docstring sebagai description
         report.description = str(item.function.__doc__ or "")
+        attach_page_metrics(item, report)
+
+        if report.failed:
+            capture_failure_artifact(item)
+
+
+def merge_stats(target, source):
+    """
+    Gabungkan statistik worker ke statistik controller.
+    Angka dijumlahkan, list disambung, dict digabung secara rekursif.
+    """
+    for key, value in source.items():
+        if isinstance(value, dict):
+            merge_stats(target.setdefault(key, {}), value)
+        elif isinstance(value, list):
+            target.setdefault(key, []).extend(value)
+        else:
+            target[key] = target.get(key, 0) + value
+
+
+def pytest_sessionfinish(session):
+    """
+    Hook di akhir session. Pada worker xdist, kirim statistik ke controller.
+    """
+    artifacts.shutdown()  # tunggu artifact di antrean selesai ditulis
+    if artifacts.STATS['queued']:
+        session.config._suite_stats['artifacts'] = dict(artifacts.STATS)
+    # extend, bukan assign: di controller xdist list ini sudah berisi
+    # catatan semua worker (merge_stats di pytest_testnodedown)
+    session.config._suite_stats.setdefault('waits', []).extend(waits.WAIT_LOG)
+    session.config._suite_stats.setdefault('browser_startup', []).extend(browser.STARTUP_LOG)
+    session.config._suite_stats.setdefault('form_fills', []).extend(pages.FORM_LOG)
+    if cdn_cache.STATS['served'] or cdn_cache.STATS['missed']:
+        session.config._suite_stats['cdn_cache'] = dict(cdn_cache.STATS)
+
+    workeroutput = getattr(session.config, 'workeroutput', None)
+    if workeroutput is not None:
+        workeroutput['suite_stats'] = session.config._suite_stats
+        return
+
+    # Controller (atau run tanpa xdist): semua sampel benchmark sudah terkumpul
+    samples = session.config._suite_stats.get('benchmark')
+    if samples:
+        summary = bench.summarize(samples)
+        baseline = bench.load_baseline()
+        regressions = bench.compare(summary, baseline)
+        session.config._benchmark_report = (summary, baseline, regressions)
+        if bench.save_requested():
+            bench.save_baseline(summary)
+        elif bench.fail_on_regression() and (regressions or bench.missing_baseline(summary, baseline)):
+            # Tanpa baseline gate tidak bisa mendeteksi regresi: gagal, bukan lolos diam-diam
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_unconfigure(config):
+    """
+    Hook setelah run selesai: catat results.jsonl ke riwayat SQLite (history.py).
+    """
+    stream = config.pluginmanager.get_plugin('results_stream')
+    if stream is None or stream.file is None or not history.enabled():
+        return
+    try:
+        history.ingest_results(stream.path)
+    except (OSError, ValueError, KeyError, history.sqlite3.Error) as e:
+        # Riwayat hanya pelengkap: record rusak/tak lengkap tidak boleh menggagalkan run
+        print(f"\n⚠️ Failed to record run history: {str(e)}")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """
+    Hook xdist: pada --dist load (default -n), pakai jadwal LPT dari riwayat
+    durasi test (duration_scheduler.py). DURATION_SCHEDULING=0 menonaktifkan.
+    """
+    if not _duration_scheduling(config):
+        return None
+    from duration_scheduler import DurationScheduling
+    return DurationScheduling(config, log)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hook xdist: kirim nama folder run artifact dan mode urutan test ke worker."""
+    node.workerinput['artifact_run'] = node.config._artifact_run
+    # Worker melihat --dist sebagai 'no'; urutan LPT diputuskan controller
+    node.workerinput['lpt_order'] = _duration_scheduling(node.config)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Hook xdist saat worker selesai. Gabungkan statistik worker tersebut.
+    """
+    worker_stats = getattr(node, 'workeroutput', {}).get('suite_stats', {})
+    merge_stats(node.config._suite_stats, worker_stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Hook untuk menampilkan ringkasan statistik di akhir test run.
+    """
+    pool_stats = config._suite_stats.get('browser_pool')
+    if pool_stats:
+        terminalreporter.section('Browser Pool')
+        for line in format_pool_stats(pool_stats):
+            terminalreporter.write_line(line)
+
+    startup_records = config._suite_stats.get('browser_startup')
+    if startup_records:
+        terminalreporter.section('Browser Startup')
+        for line in browser.format_startup(startup_records):
+            terminalreporter.write_line(line)
+
+    restore_stats = config._suite_stats.get('db_restore')
+    if restore_stats and restore_stats['restores']:
+        terminalreporter.section('Database Restore')
+        avg_ms = restore_stats['seconds'] / restore_stats['restores'] * 1000
+        terminalreporter.write_line(
+            f"Restores: {restore_stats['restores']}  rows: {restore_stats['rows']}  "
+            f"avg: {avg_ms:.1f} ms"
+        )
+
+    wait_records = config._suite_stats.get('waits')
+    if wait_records:
+        terminalreporter.section('DataTables Waits')
+        for name, item in sorted(waits.summarize(wait_records).items()):
+            terminalreporter.write_line(
+                f"{name:<18} count={item['count']:<4} total={item['total']:.2f}s "
+                f"mean={item['mean']:.3f}s max={item['max']:.3f}s failed={item['failed']}"
+            )
+        slowest = max(wait_records, key=lambda record: record['seconds'])
+        terminalreporter.write_line(
+            f"Slowest wait: {slowest['name']} {slowest['seconds']:.3f}s in {slowest['test']}"
+        )
+
+    fill_records = config._suite_stats.get('form_fills')
+    if fill_records:
+        terminalreporter.section('Form Fill')
+        for line in pages.format_fills(fill_records):
+            terminalreporter.write_line(line)
+
+    artifact_stats = config._suite_stats.get('artifacts')
+    if artifact_stats:
+        terminalreporter.section('Failure Artifacts')
+        for line in artifacts.format_stats(artifact_stats):
+            terminalreporter.write_line(line)
+
+    cdn_stats = config._suite_stats.get('cdn_cache')
+    if cdn_stats:
+        terminalreporter.section('CDN Cache')
+        for line in cdn_cache.format_stats(cdn_stats):
+            terminalreporter.write_line(line)
+
+    page_records = config._suite_stats.get('page_metrics')
+    if page_records:
+        terminalreporter.section('Page Metrics')
+        for page, item in sorted(page_metrics.summarize(page_records).items()):
+            terminalreporter.write_line(page_metrics.format_summary(page, item))
+
+    benchmark_report = getattr(config, '_benchmark_report', None)
+    if benchmark_report:
+        summary, baseline, regressions = benchmark_report
+        terminalreporter.section('Benchmark')
+        for test, phases in sorted(summary.items()):
+            terminalreporter.write_line(test.split('::')[-1])
+            for phase, item in sorted(phases.items()):
+                base = baseline.get(test, {}).get(phase)
+                versus = f"  baseline median={base['median_ms']}ms p95={base['p95_ms']}ms" if base else "  (baru)"
+                terminalreporter.write_line(
+                    f"  {phase:<18} n={item['count']:<3} median={item['median_ms']}ms "
+                    f"p95={item['p95_ms']}ms{versus}"
+                )
+        if bench.save_requested():
+            terminalreporter.write_line(f"Baseline disimpan ke {bench.BASELINE_PATH}")
+        elif bench.fail_on_regression():
+            missing = bench.missing_baseline(summary, baseline)
+            if missing:
+                terminalreporter.write_line(
+                    f"GATE GAGAL: {len(missing)} fase tanpa baseline di {bench.BASELINE_PATH}; "
+                    f"ukur dengan BENCHMARK_SAVE=1 lalu commit",
+                    red=True,
+                )
+        for regression in regressions:
+            terminalreporter.write_line(
+                f"REGRESI {regression['test'].split('::')[-1]} {regression['phase']} "
+                f"{regression['metric']}: {regression['baseline']}ms -> {regression['current']}ms",
+                red=bench.fail_on_regression(), yellow=not bench.fail_on_regression(),
+            )
 
 
 # =============================================================================
@@ -77,6 +467,128 @@ def test_session_info():
     print("="*70 + "\n")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def worker_database(request):
+    """
+    Fixture session yang membuat schema database sendiri untuk worker ini
+    (mis. damncrud_gw0) dari db/damncrud.sql, sehingga test CRUD di worker
+    berbeda tidak saling berebut baris yang sama.
+
+    Hanya aktif jika DB_ISOLATION=1; selain itu memakai database default
+    dan mengembalikan None.
+    """
+    if not database.isolation_enabled():
+        yield None
+        return
+
+    workerinput = getattr(request.config, 'workerinput', {})
+    worker_id = workerinput.get('workerid', 'master')
+    name = database.provision_worker_database(worker_id)
+    print(f"\nDatabase worker {worker_id}: {name}")
+
+    yield name
+
+    if os.environ.get('DB_KEEP', '0') != '1':
+        database.drop_worker_database(name)
+
+
+@pytest.fixture(scope="session")
+def seed_snapshot(worker_database, request):
+    """
+    Fixture session yang menyimpan snapshot tabel contacts & users
+    (sekali per worker) untuk restore cepat setelah test yang mengubah data.
+    """
+    snapshot = database.SeedSnapshot(worker_database)
+    snapshot.capture()
+    stats = request.config._suite_stats.setdefault(
+        'db_restore', {'restores': 0, 'rows': 0, 'seconds': 0.0}
+    )
+    snapshot.stats = stats
+
+    yield snapshot
+
+    snapshot.drop()
+
+
+@pytest.fixture(autouse=True)
+def restore_database(request):
+    """
+    Fixture yang me-restore baris contacts/users yang diubah oleh test
+    bertanda create/update/delete, sehingga setiap test mulai dari data
+    yang identik. Hanya aktif jika DB_RESTORE=1 (default ikut DB_ISOLATION),
+    kecuali putaran benchmark (BENCHMARK=1): setiap warmup/putaran selalu
+    di-restore agar putaran berikutnya mengukur tabel yang sama, bukan
+    tabel yang sudah kehilangan baris hasil TC-024 sebelumnya.
+    """
+    mutating = any(request.node.get_closest_marker(name) for name in ('create', 'update', 'delete'))
+    benchmark_round = bench.enabled() and request.node.get_closest_marker('benchmark')
+    if not (mutating and (database.restore_enabled() or benchmark_round)):
+        yield
+        return
+
+    snapshot = request.getfixturevalue('seed_snapshot')
+
+    yield
+
+    start = time.perf_counter()
+    rows = snapshot.restore()
+    snapshot.stats['restores'] += 1
+    snapshot.stats['rows'] += rows
+    snapshot.stats['seconds'] += time.perf_counter() - start
+
+
+@pytest.fixture
+def contacts_dataset(request):
+    """
+    Fixture yang menambahkan kontak sintetis ke tabel contacts untuk scale test.
+    Ukuran diberikan lewat parametrize indirect, berupa int atau dict:
+
+        @pytest.mark.parametrize("contacts_dataset", [10000], indirect=True)
+        @pytest.mark.parametrize("contacts_dataset", [{"size": 50000, "seed": 7}], indirect=True)
+
+    Setelah test, tabel dikembalikan ke data seed.
+    """
+    param = getattr(request, 'param', 1000)
+    options = param if isinstance(param, dict) else {'size': param}
+    size = options['size']
+    seed = options.get('seed', seed_contacts.DEFAULT_SEED)
+    method = options.get('method', 'insert')
+
+    snapshot = request.getfixturevalue('seed_snapshot') if database.restore_enabled() else None
+    result = seed_contacts.seed_contacts(size, seed=seed, method=method, replace=True)
+    result.update({'size': size, 'seed': seed})
+
+    yield result
+
+    if snapshot is not None:
+        snapshot.restore_full()
+    else:
+        connection = database.connect(result['database'])
+        try:
+            seed_contacts.clear_synthetic(connection)
+        finally:
+            connection.close()
+
+
+@pytest.fixture
+def benchmark(request):
+    """
+    Fixture pencatat durasi fase (lihat benchmark.py). Saat BENCHMARK=1,
+    test bertanda 'benchmark' diparametrize per putaran; sampel putaran
+    non-warmup dikumpulkan ke statistik suite untuk dibandingkan dengan
+    baseline di akhir run.
+    """
+    _, warmup = getattr(request, 'param', (0, False))
+    recorder = bench.Benchmark(request.node.nodeid.split('[')[0], warmup=warmup)
+
+    yield recorder
+
+    if bench.enabled() and not warmup and request.node.get_closest_marker('benchmark'):
+        samples = request.config._suite_stats.setdefault('benchmark', {})
+        for phase, values in recorder.samples.items():
+            samples.setdefault(recorder.name, {}).setdefault(phase, []).extend(values)
+
+
 # =============================================================================
 # UTILITY FIXTURES
 # =============================================================================
@@ -95,38 +607,46 @@ def credentials():
     Fixture untuk mendapatkan kredensial login.
     """
     return {
-        'username': os.environ.get('TEST_USERNAME', 'admin'),
-        'password': os.environ.get('TEST_PASSWORD', 'admin123')
+        'username': USERNAME,
+        'password': PASSWORD,
     }
 
 
 # =============================================================================
-# SCREENSHOT ON FAILURE (untuk debugging)
+# ARTIFACT ON FAILURE (untuk debugging)
 # =============================================================================
 
-@pytest.hookimpl(tryfirst=True, hookwrapper=True)
-def pytest_runtest_makereport(item):
+def capture_failure_artifact(item):
     """
-    Hook untuk mengambil screenshot saat test gagal.
+    Ambil screenshot, DOM dan URL saat test gagal.
+    Penulisan ke disk dilakukan thread background (artifacts.py).
     """
-    outcome = yield
-    rep = outcome.get_result()
-    
-    if rep.when == 'call' and rep.failed:
-        # Cek apakah ada driver fixture
-        if 'driver' in item.funcargs or 'logged_in_driver' in item.funcargs:
-            driver = item.funcargs.get('driver') or item.funcargs.get('logged_in_driver')
-            if driver:
-                try:
-                    # Buat folder screenshots jika belum ada
-                    screenshot_dir = 'screenshots'
-                    if not os.path.exists(screenshot_dir):
-                        os.makedirs(screenshot_dir)
-                    
-                    # Simpan screenshot
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    screenshot_path = f"{screenshot_dir}/{item.name}_{timestamp}.png"
-                    driver.save_screenshot(screenshot_path)
-                    print(f"\n📸 Screenshot saved: {screenshot_path}")
-                except Exception as e:
-                    print(f"\n⚠️ Failed to save screenshot: {str(e)}")
+    driver = item.funcargs.get('driver') or item.funcargs.get('logged_in_driver')
+    if driver:
+        try:
+            run_dir = artifacts.capture(driver, item.nodeid)
+            print(f"\n📸 Artifact queued: {run_dir}")
+        except Exception as e:
+            print(f"\n⚠️ Failed to capture artifact: {str(e)}")
+
+
+# =============================================================================
+# PAGE METRICS (Navigation Timing per halaman)
+# =============================================================================
+
+def attach_page_metrics(item, report):
+    """
+    Lampirkan metrik halaman yang dicatat PageMetricsListener (fixture
+    driver) ke user property JUnit, extra pytest-html dan statistik suite.
+    """
+    if not hasattr(item, 'page_metrics'):
+        return
+    raw_driver, listener = item.page_metrics
+    listener.capture(raw_driver)  # halaman terakhir yang masih terbuka
+    page_records = listener.pages
+
+    for index, metrics in enumerate(page_records, start=1):
+        item.user_properties.append((f"page{index}_{metrics['page']}", page_metrics.format_page(metrics)))
+    if html_extras is not None and page_records:
+        report.extras = getattr(report, 'extras', []) + [html_extras.json(page_records, name="Page Metrics")]
+    item.config._suite_stats.setdefault('page_metrics', []).extend(page_records)
@@ -0,0 +1,314 @@
+"""
+=============================================================================
+DATABASE - Isolasi Database per Worker pytest-xdist
+=============================================================================
+File: database.py
+Setiap worker pytest-xdist mendapat schema MySQL/MariaDB sendiri
+(mis. damncrud_gw0, damncrud_gw1) yang dibuat dari db/damncrud.sql.
+Aplikasi PHP diarahkan ke schema tersebut lewat header X-DamnCRUD-DB
+(client HTTP) atau cookie damncrud_db (browser), yang dibaca oleh
+pdo_connect() di functions.php.
+
+Sisi PHP hanya menerima override jika server dijalankan dengan
+environment variable DAMNCRUD_DB_OVERRIDE=1.
+
+Selain itu, SeedSnapshot menyimpan salinan tabel contacts & users sekali
+per session, lalu setelah test yang mengubah data hanya baris yang berubah
+yang dikembalikan (change tracking lewat trigger).
+
+Konfigurasi (environment variable):
+- DB_ISOLATION : 1 untuk mengaktifkan isolasi per worker
+- DB_KEEP      : 1 agar schema worker tidak di-drop di akhir session
+- DB_RESTORE   : 1 untuk restore data setelah test create/update/delete
+                 (default mengikuti DB_ISOLATION). Dengan pytest -n wajib
+                 bersama DB_ISOLATION=1: snapshot, trigger dan
+                 AUTO_INCREMENT milik schema tidak bisa dibagi antar worker
+- DB_HOST, DB_PORT, DB_USER, DB_PASS : koneksi MySQL (default sama
+  dengan functions.php)
+=============================================================================
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+import pymysql
+
+
+DB_HOST = os.environ.get("DB_HOST", "localhost")
+DB_PORT = int(os.environ.get("DB_PORT", "3306"))
+DB_USER = os.environ.get("DB_USER", "root")
+DB_PASS = os.environ.get("DB_PASS", "")
+
+DEFAULT_DATABASE = "damncrud"
+SQL_DUMP = Path(__file__).resolve().parent.parent / "db" / "damncrud.sql"
+
+# Nama cookie / header yang dibaca pdo_connect() di functions.php
+DB_COOKIE = "damncrud_db"
+DB_HEADER = "X-DamnCRUD-DB"
+
+# Schema yang sedang dipakai proses (worker) ini, None = database default
+_active_database = None
+
+
+# =============================================================================
+# CONFIG
+# =============================================================================
+
+def isolation_enabled():
+    """True jika isolasi database per worker diaktifkan (DB_ISOLATION=1)."""
+    return os.environ.get("DB_ISOLATION", "0") == "1"
+
+
+def restore_enabled():
+    """True jika data di-restore setelah test yang mengubah data."""
+    return os.environ.get("DB_RESTORE", "1" if isolation_enabled() else "0") == "1"
+
+
+def worker_database_name(worker_id):
+    """Nama schema untuk worker tertentu, mis. 'gw0' -> 'damncrud_gw0'."""
+    return f"{DEFAULT_DATABASE}_{worker_id}"
+
+
+def active_database():
+    """Schema yang dipakai worker ini, atau None jika memakai database default."""
+    return _active_database
+
+
+def reset_active_database():
+    """Kembali ke database default (awal session pytest baru)."""
+    global _active_database
+    _active_database = None
+
+
+# =============================================================================
+# CONNECTION & SQL
+# =============================================================================
+
+def connect(database=None, **kwargs):
+    """Buka koneksi PyMySQL (autocommit) ke server MySQL/MariaDB."""
+    return pymysql.connect(
+        host=DB_HOST, port=DB_PORT, user=DB_USER, password=DB_PASS,
+        database=database, autocommit=True, charset="utf8mb4", **kwargs
+    )
+
+
+def split_sql(text):
+    """
+    Pecah isi file SQL dump menjadi daftar statement.
+    Komentar baris (--) dibuang; titik koma di dalam string diabaikan.
+    """
+    lines = [line for line in text.splitlines() if not line.lstrip().startswith("--")]
+    text = "\n".join(lines)
+
+    statements = []
+    current = []
+    quote = None
+    previous = ""
+    for char in text:
+        if quote:
+            if char == quote and previous != "\\":
+                quote = None
+        elif char in ("'", '"', "`"):
+            quote = char
+        elif char == ";":
+            statement = "".join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+            previous = char
+            continue
+        current.append(char)
+        previous = char
+
+    statement = "".join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+
+def load_dump(connection, database, dump_path=SQL_DUMP):
+    """
+    Buat ulang schema `database` dari file dump damncrud.sql.
+    Nama schema `damncrud` di dalam dump diganti dengan `database`.
+    """
+    sql = Path(dump_path).read_text(encoding="utf-8")
+    sql = sql.replace(f"`{DEFAULT_DATABASE}`", f"`{database}`")
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP DATABASE IF EXISTS `{database}`")
+        for statement in split_sql(sql):
+            cursor.execute(statement)
+
+
+# =============================================================================
+# WORKER PROVISIONING
+# =============================================================================
+
+def provision_worker_database(worker_id):
+    """
+    Buat schema untuk worker dari db/damncrud.sql dan tandai sebagai
+    schema aktif proses ini. Mengembalikan nama schema.
+    """
+    global _active_database
+    name = worker_database_name(worker_id)
+    connection = connect()
+    try:
+        load_dump(connection, name)
+    finally:
+        connection.close()
+    _active_database = name
+    return name
+
+
+def drop_worker_database(name):
+    """Hapus schema worker di akhir session."""
+    global _active_database
+    connection = connect()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP DATABASE IF EXISTS `{name}`")
+    finally:
+        connection.close()
+    if _active_database == name:
+        _active_database = None
+
+
+# =============================================================================
+# SEED SNAPSHOT & RESTORE
+# =============================================================================
+
+# Tabel yang di-snapshot beserta primary key-nya
+SNAPSHOT_TABLES = {"contacts": "id", "users": "id_user"}
+CHANGES_TABLE = "_test_changes"
+
+# Variabel session MySQL: jika diset, trigger tidak mencatat perubahan
+# (dipakai saat restore agar DELETE/INSERT restore tidak tercatat ulang)
+_RESTORING_FLAG = "@damncrud_restoring"
+
+
+@contextmanager
+def untracked(connection):
+    """
+    Cursor yang perubahannya tidak dicatat trigger change tracking,
+    mis. untuk restore atau seeding data massal.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"SET {_RESTORING_FLAG} = 1")
+        try:
+            yield cursor
+        finally:
+            cursor.execute(f"SET {_RESTORING_FLAG} = NULL")
+
+
+class SeedSnapshot:
+    """
+    Snapshot data seed dan restore per baris.
+
+    capture() membuat salinan `<tabel>__seed` dan trigger AFTER INSERT/
+    UPDATE/DELETE yang mencatat primary key baris yang berubah ke tabel
+    _test_changes. restore() hanya mengembalikan baris yang tercatat,
+    sehingga biayanya sebanding dengan jumlah baris yang diubah test,
+    bukan ukuran tabel.
+    """
+
+    def __init__(self, database=None, tables=SNAPSHOT_TABLES):
+        self.database = database or active_database() or DEFAULT_DATABASE
+        self.tables = dict(tables)
+        self.connection = None
+        self._auto_increment = {}
+
+    # -------------------------------------------------------------------------
+    # SETUP / TEARDOWN
+    # -------------------------------------------------------------------------
+
+    def capture(self):
+        """Simpan salinan tabel seed dan pasang trigger change tracking."""
+        self.connection = connect(self.database)
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS `{CHANGES_TABLE}` "
+                f"(tbl VARCHAR(64) NOT NULL, row_id INT NOT NULL)"
+            )
+            cursor.execute(f"DELETE FROM `{CHANGES_TABLE}`")
+
+            for table, key in self.tables.items():
+                seed = f"{table}__seed"
+                cursor.execute(f"DROP TABLE IF EXISTS `{seed}`")
+                cursor.execute(f"CREATE TABLE `{seed}` LIKE `{table}`")
+                cursor.execute(f"INSERT INTO `{seed}` SELECT * FROM `{table}`")
+                cursor.execute(f"SELECT COALESCE(MAX(`{key}`), 0) + 1 FROM `{seed}`")
+                self._auto_increment[table] = cursor.fetchone()[0]
+
+                for event, rows in (("INSERT", ("NEW",)),
+                                    ("UPDATE", ("OLD", "NEW")),
+                                    ("DELETE", ("OLD",))):
+                    trigger = f"{table}__track_{event.lower()}"
+                    select = " UNION ALL ".join(
+                        f"SELECT '{table}', {row}.`{key}` FROM DUAL WHERE {_RESTORING_FLAG} IS NULL"
+                        for row in rows
+                    )
+                    cursor.execute(f"DROP TRIGGER IF EXISTS `{trigger}`")
+                    cursor.execute(
+                        f"CREATE TRIGGER `{trigger}` AFTER {event} ON `{table}` FOR EACH ROW "
+                        f"INSERT INTO `{CHANGES_TABLE}` (tbl, row_id) {select}"
+                    )
+
+    def drop(self):
+        """Hapus trigger, tabel seed dan tabel perubahan."""
+        if self.connection is None:
+            return
+        with self.connection.cursor() as cursor:
+            for table in self.tables:
+                for event in ("insert", "update", "delete"):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS `{table}__track_{event}`")
+                cursor.execute(f"DROP TABLE IF EXISTS `{table}__seed`")
+            cursor.execute(f"DROP TABLE IF EXISTS `{CHANGES_TABLE}`")
+        self.connection.close()
+        self.connection = None
+
+    # -------------------------------------------------------------------------
+    # RESTORE
+    # -------------------------------------------------------------------------
+
+    def restore(self):
+        """
+        Kembalikan baris yang berubah sejak restore terakhir ke data seed.
+        Mengembalikan jumlah baris yang di-restore.
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"SELECT DISTINCT tbl, row_id FROM `{CHANGES_TABLE}`")
+            changed = {}
+            for table, row_id in cursor.fetchall():
+                changed.setdefault(table, []).append(row_id)
+            if not changed:
+                return 0
+
+        with untracked(self.connection) as cursor:
+            for table, row_ids in changed.items():
+                key = self.tables[table]
+                placeholders = ", ".join(["%s"] * len(row_ids))
+                cursor.execute(
+                    f"DELETE FROM `{table}` WHERE `{key}` IN ({placeholders})", row_ids
+                )
+                cursor.execute(
+                    f"INSERT INTO `{table}` SELECT * FROM `{table}__seed` "
+                    f"WHERE `{key}` IN ({placeholders})", row_ids
+                )
+                cursor.execute(
+                    f"ALTER TABLE `{table}` AUTO_INCREMENT = {self._auto_increment[table]}"
+                )
+            cursor.execute(f"DELETE FROM `{CHANGES_TABLE}`")
+
+        return sum(len(row_ids) for row_ids in changed.values())
+
+    def restore_full(self):
+        """
+        Kembalikan seluruh isi tabel ke data seed (TRUNCATE + INSERT ... SELECT).
+        Dipakai setelah perubahan massal, mis. seeding data sintetis.
+        """
+        with untracked(self.connection) as cursor:
+            for table in self.tables:
+                cursor.execute(f"TRUNCATE TABLE `{table}`")
+                cursor.execute(f"INSERT INTO `{table}` SELECT * FROM `{table}__seed`")
+            cursor.execute(f"DELETE FROM `{CHANGES_TABLE}`")
@@ -0,0 +1,91 @@
+"""
+=============================================================================
+DURATION SCHEDULER - LPT Scheduling untuk pytest-xdist
+=============================================================================
+File: duration_scheduler.py
+Pengganti LoadScheduling bawaan xdist (dipasang lewat hook
+pytest_xdist_make_scheduler di conftest.py). Jika file riwayat durasi
+(durations.py) berisi test dari collection ini, test dikirim satu per
+satu dalam urutan collection: conftest.py sudah mengurutkan test per tier
+(HTTP, browser, budget) lalu di dalam tier dari prediksi terlama
+(Longest-Processing-Time-first). Setiap worker hanya memegang PREFETCH
+test; sisanya tetap di controller dan diberikan ke worker yang selesai
+lebih dulu, sehingga prediksi yang meleset atau test tanpa riwayat
+dikoreksi saat run, dan test milik worker yang crash dipindahkan ke
+worker lain (remove_node bawaan LoadScheduling).
+
+Tanpa riwayat, perilakunya sama persis dengan LoadScheduling.
+
+Modul ini butuh pytest-xdist, sehingga hanya di-import oleh hook xdist.
+=============================================================================
+"""
+
+from xdist.scheduler import LoadScheduling
+
+import durations
+
+
+# Test yang dipegang setiap worker: satu berjalan, satu berikutnya (worker
+# xdist butuh test berikutnya untuk menentukan teardown fixture)
+PREFETCH = 2
+
+
+class DurationScheduling(LoadScheduling):
+    """LoadScheduling yang membagi test satu per satu dalam urutan LPT per tier."""
+
+    def __init__(self, config, log=None):
+        super().__init__(config, log)
+        self.lpt = False
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        # Distribusi awal sudah terjadi (node baru bergabung): isi ulang semua node
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        collection = list(self.node2collection.values())[0]
+        predicted, known = durations.predict(collection, durations.load_history())
+        if not known:
+            return super().schedule()
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.lpt = True
+        self.collection = collection
+        self.pending[:] = range(len(collection))
+        nodes = self.nodes
+
+        # Rencana statis hanya untuk laporan utilisasi (prediksi vs aktual);
+        # pembagian sebenarnya dinamis di check_schedule
+        _, loads = durations.lpt_plan(predicted, len(nodes))
+        self.config._duration_plan = {
+            "loads": {node.gateway.id: load for node, load in zip(nodes, loads)},
+            "known": known,
+            "tests": len(collection),
+        }
+        self.log("LPT dispatch:", len(collection), "tests,", known, "with history")
+
+        # Bergiliran agar test terlama di awal tersebar ke semua worker
+        for _ in range(PREFETCH):
+            for node in nodes:
+                self._send_tests(node, 1)
+        if not self.pending:
+            for node in nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration=0):
+        """Isi antrean worker kembali sampai PREFETCH test dari urutan LPT."""
+        if not self.lpt:
+            return super().check_schedule(node, duration)
+        if node.shutting_down:
+            return
+        if self.pending:
+            missing = PREFETCH - len(self.node2pending[node])
+            if missing > 0:
+                self._send_tests(node, missing)
+        else:
+            node.shutdown()
+        self.log("num items waiting for node:", len(self.pending))
@@ -0,0 +1,200 @@
+"""
+=============================================================================
+DURATIONS - Riwayat Durasi Test & Rencana Penjadwalan LPT
+=============================================================================
+File: durations.py
+Durasi setiap test (setup + call + teardown) dicatat di controller dan
+disimpan ke file riwayat lokal. Setup test pertama di setiap worker tidak
+dihitung: fase itu ikut membayar fixture session (browser pertama, login,
+schema database) yang bukan biaya test tersebut. Run berikutnya dengan pytest-xdist memakai
+riwayat ini untuk menjadwalkan test Longest-Processing-Time-first: di
+dalam setiap tier, test terlama dikirim lebih dulu ke worker yang bebas,
+sehingga test lambat (mis. TC-024) tidak lagi tertinggal di akhir pada
+satu worker sementara worker lain menganggur. Scheduler-nya ada di
+duration_scheduler.py.
+
+Di akhir run dicetak utilisasi tiap worker: prediksi (dari rencana LPT)
+dan aktual (waktu sibuk / makespan).
+
+Konfigurasi (environment variable):
+- DURATION_HISTORY    : path file riwayat (default .durations.json di folder ini)
+- DURATION_SCHEDULING : 0 untuk kembali ke distribusi load bawaan xdist
+- DURATION_SAMPLES    : jumlah durasi terakhir yang disimpan per test (default 5)
+
+CARA MENJALANKAN:
+- Sama seperti biasa : pytest test_pytest.py -n auto
+  (run pertama mengisi riwayat, run berikutnya memakai jadwal LPT)
+=============================================================================
+"""
+
+import heapq
+import json
+import os
+import statistics
+from pathlib import Path
+
+
+HISTORY_PATH = Path(os.environ.get(
+    "DURATION_HISTORY", Path(__file__).resolve().parent / ".durations.json"
+))
+
+# Prediksi untuk test tanpa riwayat jika belum ada riwayat sama sekali
+DEFAULT_SECONDS = 5.0
+
+
+# =============================================================================
+# CONFIG
+# =============================================================================
+
+def enabled():
+    """True jika penjadwalan berbasis durasi aktif (default aktif)."""
+    return os.environ.get("DURATION_SCHEDULING", "1") != "0"
+
+
+def max_samples():
+    return int(os.environ.get("DURATION_SAMPLES", "5"))
+
+
+# =============================================================================
+# HISTORY
+# =============================================================================
+
+def load_history(path=HISTORY_PATH):
+    """{nodeid: [durasi, ...]} dari file riwayat, kosong jika belum ada."""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8")).get("tests", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def update_history(durations, path=HISTORY_PATH):
+    """Tambahkan durasi run ini ke riwayat (hanya N sampel terakhir per test)."""
+    history = load_history(path)
+    for nodeid, seconds in durations.items():
+        samples = history.get(nodeid, []) + [round(seconds, 4)]
+        history[nodeid] = samples[-max_samples():]
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"tests": history}, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+    return history
+
+
+def predict(nodeids, history):
+    """
+    Prediksi durasi per nodeid: median riwayat test tersebut. Test baru
+    memakai median semua test yang punya riwayat.
+    """
+    known = {nodeid: statistics.median(history[nodeid]) for nodeid in nodeids if history.get(nodeid)}
+    fallback = statistics.median(known.values()) if known else DEFAULT_SECONDS
+    return {nodeid: known.get(nodeid, fallback) for nodeid in nodeids}, len(known)
+
+
+# =============================================================================
+# LPT PLAN
+# =============================================================================
+
+def lpt_plan(predicted, workers):
+    """
+    Bagi test ke `workers` dengan aturan LPT: urutkan dari yang terlama,
+    berikan ke worker dengan beban terkecil saat itu.
+    Mengembalikan (daftar nodeid per worker, total prediksi per worker).
+    """
+    heap = [(0.0, worker) for worker in range(workers)]
+    assignments = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    for nodeid in sorted(predicted, key=lambda nodeid: (-predicted[nodeid], nodeid)):
+        load, worker = heapq.heappop(heap)
+        assignments[worker].append(nodeid)
+        loads[worker] = load + predicted[nodeid]
+        heapq.heappush(heap, (loads[worker], worker))
+    return assignments, loads
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+
+def utilization(busy, makespan):
+    """{worker: (detik sibuk, persen dari makespan)}"""
+    return {
+        worker: (seconds, seconds / makespan * 100 if makespan else 0.0)
+        for worker, seconds in busy.items()
+    }
+
+
+def format_utilization(actual_busy, actual_makespan, plan=None):
+    """Baris laporan utilisasi worker: prediksi (jika ada rencana LPT) vs aktual."""
+    lines = []
+    actual = utilization(actual_busy, actual_makespan)
+    predicted = utilization(plan["loads"], max(plan["loads"].values())) if plan else {}
+    for worker in sorted(set(actual) | set(predicted)):
+        parts = [f"{worker:<6}"]
+        if plan:
+            seconds, percent = predicted.get(worker, (0.0, 0.0))
+            parts.append(f"predicted={seconds:7.1f}s {percent:5.1f}%")
+        seconds, percent = actual.get(worker, (0.0, 0.0))
+        parts.append(f"actual={seconds:7.1f}s {percent:5.1f}%")
+        lines.append("  ".join(parts))
+    if plan:
+        lines.append(
+            f"Makespan predicted={max(plan['loads'].values()):.1f}s actual={actual_makespan:.1f}s  "
+            f"({plan['known']}/{plan['tests']} test punya riwayat)"
+        )
+    else:
+        lines.append(f"Makespan actual={actual_makespan:.1f}s  (distribusi load bawaan xdist)")
+    return lines
+
+
+# =============================================================================
+# PLUGIN (controller)
+# =============================================================================
+
+class DurationRecorder:
+    """
+    Plugin pytest di controller: kumpulkan durasi per test dan waktu sibuk
+    per worker dari report, simpan riwayat, cetak utilisasi worker.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.durations = {}
+        self.skipped = set()
+        self.busy = {}
+        self.warmed = set()
+        self.started = None
+        self.stopped = None
+
+    def pytest_runtest_logreport(self, report):
+        node = getattr(report, "node", None)  # diisi xdist di controller
+        worker = node.gateway.id if node is not None else "main"
+        seconds = report.duration
+        if report.when == "setup" and worker not in self.warmed:
+            # Setup pertama di worker ini = fixture session, bukan biaya test
+            self.warmed.add(worker)
+            seconds = 0.0
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + seconds
+        self.busy[worker] = self.busy.get(worker, 0.0) + report.duration
+        if report.skipped:
+            self.skipped.add(report.nodeid)
+        self.started = report.start if self.started is None else min(self.started, report.start)
+        self.stopped = report.stop if self.stopped is None else max(self.stopped, report.stop)
+
+    def pytest_sessionfinish(self, session):
+        durations = {
+            nodeid: seconds for nodeid, seconds in self.durations.items() if nodeid not in self.skipped
+        }
+        if durations:
+            update_history(durations)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        plan = getattr(self.config, "_duration_plan", None)
+        if self.started is None:
+            return  # tidak ada report test (mis. semua di-deselect dengan -m)
+        if len(self.busy) < 2 and not plan:
+            return
+        terminalreporter.section("Worker Utilization")
+        for line in format_utilization(self.busy, self.stopped - self.started, plan):
+            terminalreporter.write_line(line)
+
@@ -0,0 +1,124 @@
+"""
+=============================================================================
+HEALTH - Health Gate Sebelum Test Dimulai
+=============================================================================
+File: health.py
+Tiga pengecekan HTTP murah (tanpa browser) yang dijalankan sekali di awal
+session oleh conftest.py:
+1. login.php bisa dibuka (PHP server hidup di BASE_URL)
+2. Login HTTP berhasil (MySQL hidup, kredensial benar)
+3. index.php dengan session tersebut menampilkan tabel #employee
+
+Jika salah satu gagal, run dihentikan dalam beberapa detik dengan diagnosis
+yang jelas, bukan setiap test meluncurkan Chrome lalu timeout.
+
+Konfigurasi (environment variable):
+- HEALTH_GATE    : 0 untuk melewati health gate
+- HEALTH_TIMEOUT : timeout per request dalam detik (default 3)
+=============================================================================
+"""
+
+import os
+import time
+
+import requests
+
+from http_client import WRONG_CREDENTIALS, DamnCRUDClient, redirect_target
+
+
+DB_ERROR = "Failed to connect to database!"
+
+
+class HealthCheckError(Exception):
+    """Salah satu pengecekan health gate gagal."""
+
+
+def enabled():
+    return os.environ.get("HEALTH_GATE", "1") != "0"
+
+
+def timeout():
+    return float(os.environ.get("HEALTH_TIMEOUT", "3"))
+
+
+# =============================================================================
+# CHECKS
+# =============================================================================
+
+def _check_login_page(client):
+    response = client.get("login.php")
+    if response.status_code != 200:
+        raise HealthCheckError(f"login.php mengembalikan status {response.status_code}")
+    if DB_ERROR in response.text:
+        raise HealthCheckError("PHP tidak bisa terhubung ke MySQL (cek service MySQL)")
+    if 'id="inputUsername"' not in response.text:
+        raise HealthCheckError("login.php terbuka tapi form login tidak ada (BASE_URL salah?)")
+
+
+def _check_login(client, username, password):
+    response = client.login(username, password)
+    if DB_ERROR in response.text:
+        raise HealthCheckError("Login gagal: PHP tidak bisa terhubung ke MySQL (cek service MySQL)")
+    if WRONG_CREDENTIALS in response.text:
+        raise HealthCheckError(f"Login gagal: kredensial '{username}' ditolak (cek TEST_USERNAME/TEST_PASSWORD)")
+    if redirect_target(response) != "index.php":
+        raise HealthCheckError(f"Login tidak redirect ke index.php (status {response.status_code})")
+    if not client.session_id:
+        raise HealthCheckError("login.php tidak mengirim cookie session")
+
+
+def _check_dashboard(client):
+    response, contacts = client.index()
+    if redirect_target(response) == "login.php":
+        raise HealthCheckError("index.php me-redirect ke login.php: session PHP tidak tersimpan")
+    if DB_ERROR in response.text:
+        raise HealthCheckError("index.php tidak bisa terhubung ke MySQL (cek service MySQL)")
+    if response.status_code != 200 or 'id="employee"' not in response.text:
+        raise HealthCheckError(f"index.php tidak menampilkan tabel #employee (status {response.status_code})")
+    return len(contacts)
+
+
+def run_checks(base_url, username, password):
+    """
+    Jalankan semua pengecekan berurutan dan berhenti di yang pertama gagal.
+    Mengembalikan daftar (nama, ok, detik, detail).
+    """
+    client = DamnCRUDClient(base_url, timeout=timeout())
+    checks = (
+        ("login.php", lambda: _check_login_page(client)),
+        ("http login", lambda: _check_login(client, username, password)),
+        ("index.php", lambda: _check_dashboard(client)),
+    )
+    results = []
+    try:
+        for name, check in checks:
+            start = time.perf_counter()
+            try:
+                detail = check()
+            except HealthCheckError as exc:
+                results.append((name, False, time.perf_counter() - start, str(exc)))
+                break
+            except requests.ConnectionError:
+                detail = f"Tidak bisa terhubung ke {base_url} (PHP server tidak berjalan?)"
+                results.append((name, False, time.perf_counter() - start, detail))
+                break
+            except requests.Timeout:
+                detail = f"Tidak ada respons dalam {timeout():.0f}s dari {base_url}"
+                results.append((name, False, time.perf_counter() - start, detail))
+                break
+            if detail is not None:
+                detail = f"{detail} kontak"
+            results.append((name, True, time.perf_counter() - start, detail))
+    finally:
+        client.close()
+    return results
+
+
+def format_results(base_url, results):
+    """Baris laporan health gate."""
+    lines = [f"Health gate {base_url}"]
+    for name, ok, seconds, detail in results:
+        status = "OK  " if ok else "FAIL"
+        suffix = f"  {detail}" if detail else ""
+        lines.append(f"  [{status}] {name:<10} {seconds * 1000:6.0f}ms{suffix}")
+    return lines
@@ -0,0 +1,439 @@
+"""
+=============================================================================
+HISTORY - Riwayat Run Test (SQLite): Tren Durasi, Drift p95 & Flakiness
+=============================================================================
+File: history.py
+Menyimpan hasil setiap run (outcome dan durasi setup/call/teardown per
+test) ke database SQLite lokal, dengan kunci commit dan environment.
+Sumber data:
+- results.jsonl (results.py), otomatis di akhir setiap run pytest
+- JUnit XML (test-results.xml), lewat perintah `ingest --junit`
+
+Query yang tersedia:
+- trend : durasi satu test dari run ke run
+- drift : p95 durasi N run terakhir dibanding p95 run sebelumnya, per test
+- flaky : skor flakiness per test = perpindahan pass <-> fail antar run
+          pada commit yang sama, dibagi jumlah pasangan run berurutan
+
+Nama test disimpan sekali di tabel `tests`, hasil per run memakai id
+integer dan index (test_id, run_id), sehingga append satu run adalah satu
+transaksi dan query tetap cepat pada puluhan ribu run.
+
+Konfigurasi (environment variable):
+- HISTORY_DB     : path database (default .history.db di folder ini)
+- HISTORY_RECORD : 0 agar run pytest tidak dicatat
+- HISTORY_ENV    : nama environment (default "ci" di GitHub Actions, selain itu "local")
+
+CARA MENJALANKAN:
+- Catat manual : python history.py ingest results.jsonl
+- JUnit XML    : python history.py ingest --junit test-results.xml
+- Tren durasi  : python history.py trend TC024
+- Drift p95    : python history.py drift --window 20
+- Flakiness    : python history.py flaky --runs 500
+=============================================================================
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import subprocess
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+
+from benchmark import percentile
+from results import combined_outcome
+
+
+DB_PATH = Path(os.environ.get("HISTORY_DB", Path(__file__).resolve().parent / ".history.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY,
+    started     TEXT NOT NULL,
+    commit_sha  TEXT NOT NULL,
+    branch      TEXT,
+    environment TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    workers     INTEGER,
+    duration    REAL,
+    exitstatus  INTEGER,
+    UNIQUE (started, commit_sha, environment, source)
+);
+CREATE TABLE IF NOT EXISTS tests (
+    id     INTEGER PRIMARY KEY,
+    nodeid TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id   INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    test_id  INTEGER NOT NULL REFERENCES tests (id),
+    outcome  TEXT NOT NULL,
+    setup    REAL,
+    call     REAL,
+    teardown REAL,
+    worker   TEXT,
+    reruns   INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (test_id, run_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_run ON results (run_id);
+CREATE INDEX IF NOT EXISTS runs_commit ON runs (commit_sha, environment);
+"""
+
+
+# =============================================================================
+# CONFIG
+# =============================================================================
+
+def enabled():
+    """True jika run pytest dicatat ke riwayat (default aktif)."""
+    return os.environ.get("HISTORY_RECORD", "1") != "0"
+
+
+def environment():
+    return os.environ.get("HISTORY_ENV") or ("ci" if os.environ.get("GITHUB_ACTIONS") else "local")
+
+
+def _git(*args):
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, timeout=5,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def current_commit():
+    return os.environ.get("GITHUB_SHA") or _git("rev-parse", "HEAD") or "unknown"
+
+
+def current_branch():
+    return os.environ.get("GITHUB_REF_NAME") or _git("rev-parse", "--abbrev-ref", "HEAD")
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+def connect(path=DB_PATH):
+    """Buka (dan buat jika perlu) database riwayat."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(SCHEMA)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(results)")}
+    if "reruns" not in columns:  # database dari versi sebelum adaptive rerun
+        conn.execute("ALTER TABLE results ADD COLUMN reruns INTEGER NOT NULL DEFAULT 0")
+    return conn
+
+
+def _test_ids(conn, nodeids):
+    conn.executemany("INSERT OR IGNORE INTO tests (nodeid) VALUES (?)", [(nodeid,) for nodeid in nodeids])
+    ids = {}
+    for nodeid in nodeids:
+        (ids[nodeid],) = conn.execute("SELECT id FROM tests WHERE nodeid = ?", (nodeid,)).fetchone()
+    return ids
+
+
+def record_run(conn, run, tests):
+    """
+    Simpan satu run dalam satu transaksi.
+    run   : {started, commit, branch, environment, source, workers, duration, exitstatus}
+    tests : {nodeid: {outcome, setup, call, teardown, worker, reruns}}
+    Mengembalikan id run, atau None jika run yang sama sudah tercatat.
+    """
+    with conn:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO runs (started, commit_sha, branch, environment, source, "
+            "workers, duration, exitstatus) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (run["started"], run["commit"], run.get("branch"), run["environment"], run["source"],
+             run.get("workers"), run.get("duration"), run.get("exitstatus")),
+        )
+        if not cursor.rowcount:
+            return None
+        run_id = cursor.lastrowid
+        ids = _test_ids(conn, list(tests))
+        conn.executemany(
+            "INSERT INTO results (run_id, test_id, outcome, setup, call, teardown, worker, reruns) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (run_id, ids[nodeid], test["outcome"], test.get("setup"), test.get("call"),
+                 test.get("teardown"), test.get("worker"), test.get("reruns", 0))
+                for nodeid, test in tests.items()
+            ],
+        )
+    return run_id
+
+
+def _run_info(source, started, commit=None, env=None):
+    return {
+        "started": started, "commit": commit or current_commit(), "branch": current_branch(),
+        "environment": env or environment(), "source": source,
+    }
+
+
+def parse_results(path):
+    """
+    Baca results.jsonl menjadi (info run, {nodeid: hasil test}).
+    Durasi dan outcome diambil dari percobaan terakhir; percobaan yang
+    diulang pytest-rerunfailures dihitung di `reruns`. Test yang hanya punya
+    record rerun (mis. worker crash sebelum percobaan terakhir selesai)
+    dicatat dengan outcome "rerun".
+    """
+    run, tests, phases = {}, {}, {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            if record["event"] == "session_start":
+                run = {"started": record["time"], "workers": record["workers"]}
+            elif record["event"] == "session_finish":
+                run.update(duration=record["duration"], exitstatus=record["exitstatus"])
+            elif record["event"] == "phase":
+                test = tests.setdefault(record["test"], {"worker": record["worker"], "reruns": 0})
+                if record["outcome"] == "rerun":
+                    test["reruns"] += 1
+                    continue
+                test[record["phase"]] = record["duration"]
+                phases.setdefault(record["test"], {})[record["phase"]] = record
+    for nodeid, test in tests.items():
+        test["outcome"] = combined_outcome(phases[nodeid]).lower() if nodeid in phases else "rerun"
+    return run, tests
+
+
+def _junit_nodeid(classname, name):
+    """'test_pytest.TestDamnCRUD' + 'test_x' -> 'test_pytest.py::TestDamnCRUD::test_x'"""
+    parts = classname.split(".")
+    split = next((index for index, part in enumerate(parts) if part.startswith("Test")), len(parts))
+    module = "/".join(parts[:split]) + ".py"
+    return "::".join([module, *parts[split:], name])
+
+
+def parse_junit(path):
+    """Baca JUnit XML pytest. Hanya durasi total per test (disimpan sebagai call)."""
+    root = ET.parse(path).getroot()
+    suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+    run = {"started": None, "duration": 0.0, "exitstatus": 0}
+    tests = {}
+    for suite in suites:
+        run["started"] = run["started"] or suite.get("timestamp")
+        run["duration"] += float(suite.get("time", 0))
+        for case in suite.iter("testcase"):
+            children = {child.tag for child in case}
+            if "failure" in children:
+                outcome = "failed"
+            elif "error" in children:
+                outcome = "error"
+            elif "skipped" in children:
+                outcome = "skipped"
+            else:
+                outcome = "passed"
+            if outcome in ("failed", "error"):
+                run["exitstatus"] = 1
+            nodeid = _junit_nodeid(case.get("classname", ""), case.get("name"))
+            tests[nodeid] = {"outcome": outcome, "call": float(case.get("time", 0))}
+    run["started"] = run["started"] or datetime.now().isoformat(timespec="seconds")
+    return run, tests
+
+
+def ingest_results(path, commit=None, env=None, db_path=DB_PATH):
+    """Catat results.jsonl ke riwayat. Mengembalikan id run (None jika duplikat/kosong)."""
+    run, tests = parse_results(path)
+    if not tests:
+        return None
+    info = _run_info("results", run["started"], commit, env)
+    info.update(run)
+    conn = connect(db_path)
+    try:
+        return record_run(conn, info, tests)
+    finally:
+        conn.close()
+
+
+def ingest_junit(path, commit=None, env=None, db_path=DB_PATH):
+    """Catat JUnit XML ke riwayat. Mengembalikan id run (None jika duplikat/kosong)."""
+    run, tests = parse_junit(path)
+    if not tests:
+        return None
+    info = _run_info("junit", run["started"], commit, env)
+    info.update(run)
+    conn = connect(db_path)
+    try:
+        return record_run(conn, info, tests)
+    finally:
+        conn.close()
+
+
+# =============================================================================
+# QUERIES
+# =============================================================================
+
+# Durasi total = setup + call + teardown (fase yang tidak ada dihitung 0)
+_TOTAL = "(IFNULL(r.setup, 0) + IFNULL(r.call, 0) + IFNULL(r.teardown, 0))"
+
+
+def _env_filter(env):
+    return ("AND u.environment = ?", [env]) if env else ("", [])
+
+
+def _latest(conn, test_id, columns, outcomes, limit, env=None):
+    """`limit` hasil terbaru satu test (index (test_id, run_id), tanpa scan tabel)."""
+    where, params = _env_filter(env)
+    marks = ", ".join("?" * len(outcomes))
+    return conn.execute(f"""
+        SELECT {columns} FROM results r JOIN runs u ON u.id = r.run_id
+        WHERE r.test_id = ? AND r.outcome IN ({marks}) {where}
+        ORDER BY r.run_id DESC LIMIT ?
+    """, [test_id, *outcomes, *params, limit]).fetchall()
+
+
+def duration_trend(conn, pattern, env=None, limit=20):
+    """
+    Durasi test yang nodeid-nya mengandung `pattern` di `limit` run terakhir.
+    {nodeid: [(started, commit, outcome, total, call), ...]} urut dari yang lama.
+    """
+    tests = conn.execute(
+        "SELECT id, nodeid FROM tests WHERE nodeid LIKE ? ORDER BY nodeid", (f"%{pattern}%",)
+    ).fetchall()
+    columns = f"u.started, u.commit_sha, r.outcome, {_TOTAL}, r.call"
+    return {
+        nodeid: _latest(conn, test_id, columns, ("passed", "failed", "error"), limit, env)[::-1]
+        for test_id, nodeid in tests
+    }
+
+
+def p95_drift(conn, window=20, baseline=100, env=None, min_samples=5):
+    """
+    p95 durasi `window` run lulus terakhir dibanding p95 `baseline` run lulus
+    sebelumnya. {nodeid: {recent_p95, baseline_p95, drift}} dengan drift
+    relatif (0.2 = +20%). Test dengan sampel kurang dari `min_samples` di
+    salah satu jendela dilewati.
+    """
+    drift = {}
+    for test_id, nodeid in conn.execute("SELECT id, nodeid FROM tests").fetchall():
+        totals = [row[0] for row in _latest(conn, test_id, _TOTAL, ("passed",), window + baseline, env)]
+        recent, older = totals[:window], totals[window:]
+        if len(recent) < min_samples or len(older) < min_samples:
+            continue
+        recent_p95, baseline_p95 = percentile(recent, 95), percentile(older, 95)
+        drift[nodeid] = {
+            "recent_p95": recent_p95, "baseline_p95": baseline_p95,
+            "drift": recent_p95 / baseline_p95 - 1 if baseline_p95 else 0.0,
+        }
+    return drift
+
+
+def flakiness(conn, runs=500, env=None):
+    """
+    Skor flakiness per test dari `runs` run terakhir. Hanya run pass/fail
+    (error dihitung fail) pada commit yang sama yang dibandingkan; test yang
+    lulus setelah rerun dalam satu run juga dihitung sebagai satu flip.
+    {nodeid: {runs, failures, reruns, pairs, flips, score, fail_rate}};
+    score = flips / pairs, fail_rate = percobaan gagal / semua percobaan.
+    """
+    where, params = _env_filter(env)
+    rows = conn.execute(f"""
+        SELECT nodeid, COUNT(*), SUM(failed), SUM(reruns),
+               COUNT(previous) + SUM(reruns > 0),
+               IFNULL(SUM(failed != previous), 0) + SUM(reruns > 0 AND NOT failed) FROM (
+            SELECT t.nodeid, r.outcome != 'passed' AS failed, r.reruns,
+                   LAG(r.outcome != 'passed') OVER (
+                       PARTITION BY r.test_id, u.commit_sha, u.environment ORDER BY r.run_id
+                   ) AS previous
+            FROM results r JOIN tests t ON t.id = r.test_id JOIN runs u ON u.id = r.run_id
+            WHERE r.outcome != 'skipped' AND r.run_id > (SELECT IFNULL(MAX(id), 0) - ? FROM runs) {where}
+        ) GROUP BY nodeid
+    """, [runs, *params]).fetchall()
+    return {
+        nodeid: {
+            "runs": count, "failures": failures, "reruns": reruns, "pairs": pairs, "flips": flips,
+            "score": flips / pairs if pairs else 0.0,
+            "fail_rate": (failures + reruns) / (count + reruns),
+        }
+        for nodeid, count, failures, reruns, pairs, flips in rows
+    }
+
+
+def recent_runs(conn, limit=10):
+    return conn.execute("""
+        SELECT u.id, u.started, u.commit_sha, u.environment, u.source, u.duration, u.exitstatus,
+               (SELECT COUNT(*) FROM results r WHERE r.run_id = u.id)
+        FROM runs u ORDER BY u.id DESC LIMIT ?
+    """, (limit,)).fetchall()
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _short(nodeid):
+    return nodeid.split("::")[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Riwayat run test DamnCRUD (SQLite)")
+    parser.add_argument("--db", default=DB_PATH, help=f"database riwayat (default {DB_PATH})")
+    parser.add_argument("--env", help="filter/label environment")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="catat results.jsonl atau JUnit XML")
+    ingest.add_argument("results", nargs="?", help="file results.jsonl")
+    ingest.add_argument("--junit", help="file JUnit XML (mis. test-results.xml)")
+    ingest.add_argument("--commit", help="commit SHA (default GITHUB_SHA / git HEAD)")
+
+    trend = commands.add_parser("trend", help="durasi satu test dari run ke run")
+    trend.add_argument("pattern", help="bagian dari nodeid, mis. TC024")
+    trend.add_argument("--limit", type=int, default=20)
+
+    drift = commands.add_parser("drift", help="drift p95 per test")
+    drift.add_argument("--window", type=int, default=20, help="jumlah run terbaru (default 20)")
+    drift.add_argument("--baseline", type=int, default=100, help="jumlah run pembanding (default 100)")
+
+    flaky = commands.add_parser("flaky", help="skor flakiness per test")
+    flaky.add_argument("--runs", type=int, default=500, help="jumlah run terakhir (default 500)")
+
+    runs = commands.add_parser("runs", help="run terakhir yang tercatat")
+    runs.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.command == "ingest":
+        if not args.results and not args.junit:
+            parser.error("ingest butuh file results.jsonl atau --junit")
+        for source, ingest_file in ((args.results, ingest_results), (args.junit, ingest_junit)):
+            if source:
+                run_id = ingest_file(source, commit=args.commit, env=args.env, db_path=args.db)
+                print(f"{source}: " + (f"run #{run_id} dicatat" if run_id else "sudah tercatat atau kosong"))
+        return
+
+    conn = connect(args.db)
+    if args.command == "trend":
+        for nodeid, points in duration_trend(conn, args.pattern, args.env, args.limit).items():
+            print(nodeid)
+            for started, commit, outcome, total, call in points:
+                call_text = f"call={call:.2f}s" if call is not None else ""
+                print(f"  {started}  {commit[:8]}  {outcome:<7} total={total:.2f}s {call_text}")
+    elif args.command == "drift":
+        rows = sorted(p95_drift(conn, args.window, args.baseline, args.env).items(),
+                      key=lambda item: -item[1]["drift"])
+        for nodeid, item in rows:
+            print(f"{_short(nodeid):<55} p95 {item['baseline_p95']:7.2f}s -> {item['recent_p95']:7.2f}s "
+                  f"({item['drift']:+.0%})")
+    elif args.command == "flaky":
+        rows = sorted(flakiness(conn, args.runs, args.env).items(), key=lambda item: -item[1]["score"])
+        for nodeid, item in rows:
+            if item["flips"]:
+                print(f"{_short(nodeid):<55} score={item['score']:.2f} flips={item['flips']} "
+                      f"failures={item['failures']}/{item['runs']} reruns={item['reruns']}")
+    elif args.command == "runs":
+        for run_id, started, commit, env, source, duration, exitstatus, count in recent_runs(conn, args.limit):
+            duration_text = f"{duration:.1f}s" if duration is not None else "-"
+            print(f"#{run_id:<5} {started}  {commit[:8]}  {env:<6} {source:<7} tests={count:<4} "
+                  f"{duration_text:>8} exit={exitstatus}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
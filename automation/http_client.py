@@ -0,0 +1,202 @@
+"""
+=============================================================================
+HTTP CLIENT - Browserless Client untuk Endpoint DamnCRUD
+=============================================================================
+File: http_client.py
+Client berbasis requests.Session (connection pooling / keep-alive) untuk
+mengakses login.php, index.php, create.php, update.php, delete.php dan
+profil.php tanpa browser. HTML yang dikembalikan di-parse dengan
+html.parser bawaan Python.
+
+Digunakan oleh HTTP test tier (test_http.py) dan login HTTP (auth.py).
+=============================================================================
+"""
+
+import os
+from html.parser import HTMLParser
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from database import DB_HEADER, active_database
+
+
+SESSION_COOKIE = "PHPSESSID"
+CONTACT_FIELDS = ("id", "name", "email", "phone", "title", "created")
+WRONG_CREDENTIALS = "Damn, wrong credentials!!"
+
+# Akun test (README: admin / nimda666!), satu sumber untuk semua suite,
+# fixture credentials dan health gate; bisa diganti lewat environment
+USERNAME = os.environ.get("TEST_USERNAME", "admin")
+PASSWORD = os.environ.get("TEST_PASSWORD", "nimda666!")
+
+
+# =============================================================================
+# HTML PARSERS
+# =============================================================================
+
+class ContactsTableParser(HTMLParser):
+    """
+    Ambil baris <tbody> dari tabel #employee di index.php
+    sebagai list of dict (id, name, email, phone, title, created).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.contacts = []
+        self._in_table = False
+        self._in_body = False
+        self._cells = None
+        self._text = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table" and dict(attrs).get("id") == "employee":
+            self._in_table = True
+        elif self._in_table and tag == "tbody":
+            self._in_body = True
+        elif self._in_body and tag == "tr":
+            self._cells = []
+        elif self._cells is not None and tag == "td":
+            self._text = []
+
+    def handle_endtag(self, tag):
+        if tag == "td" and self._text is not None:
+            self._cells.append("".join(self._text).strip())
+            self._text = None
+        elif tag == "tr" and self._cells is not None:
+            if len(self._cells) >= len(CONTACT_FIELDS):
+                self.contacts.append(dict(zip(CONTACT_FIELDS, self._cells)))
+            self._cells = None
+        elif tag == "tbody":
+            self._in_body = False
+        elif tag == "table":
+            self._in_table = False
+
+    def handle_data(self, data):
+        if self._text is not None:
+            self._text.append(data)
+
+
+class InputValuesParser(HTMLParser):
+    """Ambil atribut value dari setiap <input> yang punya id."""
+
+    def __init__(self):
+        super().__init__()
+        self.values = {}
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "input" and attrs.get("id"):
+            self.values[attrs["id"]] = attrs.get("value") or ""
+
+
+def parse_contacts(html):
+    """Parse tabel #employee dari HTML index.php."""
+    parser = ContactsTableParser()
+    parser.feed(html)
+    return parser.contacts
+
+
+def parse_input_values(html):
+    """Parse nilai semua <input id=...> dari sebuah halaman form."""
+    parser = InputValuesParser()
+    parser.feed(html)
+    return parser.values
+
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+class DamnCRUDClient:
+    """
+    Client HTTP untuk DamnCRUD. Redirect tidak diikuti otomatis agar test
+    bisa memverifikasi header Location (mis. create.php -> index.php).
+
+    Jika isolasi database per worker aktif, setiap request membawa header
+    X-DamnCRUD-DB berisi schema worker (lihat database.py).
+    """
+
+    def __init__(self, base_url, timeout=5, pool_size=4, database=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        database = database or active_database()
+        if database:
+            self.session.headers[DB_HEADER] = database
+
+    # -------------------------------------------------------------------------
+    # LOW LEVEL
+    # -------------------------------------------------------------------------
+
+    def get(self, path, **kwargs):
+        kwargs.setdefault("allow_redirects", False)
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(f"{self.base_url}/{path}", **kwargs)
+
+    def post(self, path, data=None, **kwargs):
+        kwargs.setdefault("allow_redirects", False)
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.post(f"{self.base_url}/{path}", data=data, **kwargs)
+
+    @property
+    def session_id(self):
+        return self.session.cookies.get(SESSION_COOKIE)
+
+    def close(self):
+        self.session.close()
+
+    # -------------------------------------------------------------------------
+    # ENDPOINTS
+    # -------------------------------------------------------------------------
+
+    def login(self, username, password):
+        """POST login.php. Berhasil jika response redirect ke index.php."""
+        return self.post("login.php", data={"username": username, "password": password})
+
+    def logout(self):
+        """Hapus cookie session di sisi client."""
+        self.session.cookies.clear()
+
+    def index(self):
+        """GET index.php, kembalikan (response, contacts)."""
+        response = self.get("index.php")
+        return response, parse_contacts(response.text)
+
+    def create(self, name, email, phone, title):
+        """POST create.php untuk menambah kontak baru."""
+        return self.post("create.php", data={
+            "name": name, "email": email, "phone": phone, "title": title,
+        })
+
+    def contact_form(self, contact_id):
+        """GET update.php?id=N, kembalikan (response, nilai input form)."""
+        response = self.get("update.php", params={"id": contact_id})
+        return response, parse_input_values(response.text)
+
+    def update(self, contact_id, name, email, phone, title):
+        """POST update.php?id=N untuk mengubah kontak."""
+        return self.post("update.php", params={"id": contact_id}, data={
+            "name": name, "email": email, "phone": phone, "title": title,
+        })
+
+    def delete(self, contact_id):
+        """GET delete.php?id=N untuk menghapus kontak."""
+        return self.get("delete.php", params={"id": contact_id})
+
+    def profile(self):
+        """GET profil.php, kembalikan (response, nilai input form)."""
+        response = self.get("profil.php")
+        return response, parse_input_values(response.text)
+
+
+def redirect_target(response):
+    """Nama halaman tujuan redirect (mis. 'index.php'), atau None."""
+    location = response.headers.get("Location")
+    if not location:
+        return None
+    return location.split("?", 1)[0].rsplit("/", 1)[-1].strip()
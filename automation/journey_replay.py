@@ -0,0 +1,273 @@
+"""
+=============================================================================
+JOURNEY REPLAY - Concurrent Browser User-Journey Load DamnCRUD
+=============================================================================
+File: journey_replay.py
+Memutar ulang journey UI nyata (TC-013 create, TC-018 update, TC-010
+search, TC-028 profile) dengan N browser headless sekaligus. Setiap
+browser adalah satu user simulasi yang menjalankan journey secara
+berurutan (closed model) berdasarkan bobot --mix sampai durasi habis.
+
+Langkah UI diambil dari step helper di test_pytest.py, jadi journey yang
+diukur sama dengan yang diuji. Laporan memakai format yang sama dengan
+load_test.py (throughput, error rate, p50/p95/p99 per jendela waktu),
+sehingga angka berbasis browser bisa dibandingkan dengan angka HTTP.
+
+Latency = durasi end-to-end satu journey (dari langkah pertama sampai
+verifikasi terakhir). Journey yang gagal (assertion, timeout, error
+WebDriver) dicatat sebagai error dan browser dikembalikan ke dashboard.
+
+Setiap user login dengan session PHP sendiri (login HTTP + inject cookie),
+karena PHP mengunci file session per request. Kontak yang dibuat/diubah
+memakai email @load.example.com dan dihapus di akhir run.
+
+CARA MENJALANKAN:
+- Default : python journey_replay.py --users 4 --duration 120
+- Mix     : python journey_replay.py --mix create=30,update=20,search=30,profile=20
+- Output  : python journey_replay.py --users 8 --output journeys.json
+=============================================================================
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import datetime
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from auth import http_login, select_database, set_browser_cookie
+from http_client import SESSION_COOKIE
+from load_test import LOAD_DOMAIN, cleanup_load_contacts, print_report, seed_load_contacts, summarize
+from pages import EmployeeTable
+from test_pytest import (
+    BASE_URL, PASSWORD, USERNAME, clear_search, create_driver, fill_contact_form,
+    load_dashboard, open_create_form, open_first_edit, open_profile, search_table,
+    submit_contact_form, unique_id,
+)
+
+
+# =============================================================================
+# KONFIGURASI
+# =============================================================================
+DEFAULT_MIX = "create=25,update=25,search=30,profile=20"
+
+
+# =============================================================================
+# JOURNEYS (raise AssertionError jika hasil tidak sesuai)
+# =============================================================================
+
+def journey_create(driver, user):
+    """TC-013: buat kontak lalu cari di tabel."""
+    load_dashboard(driver)
+    open_create_form(driver)
+    uid = unique_id()
+    data = {
+        "name": f"Journey U{user} {uid}",
+        "email": f"journey{user}-{uid}@{LOAD_DOMAIN}",
+        "phone": f"0812{uid}",
+        "title": "Journey",
+    }
+    fill_contact_form(driver, data)
+    submit_contact_form(driver)
+    load_dashboard(driver)
+    search_table(driver, data["name"])
+    assert EmployeeTable(driver).read().find(name=data["name"]), f"Kontak '{data['name']}' tidak muncul di tabel"
+
+
+def journey_update(driver, user):
+    """TC-018: ubah kontak milik load test (bukan data asli)."""
+    load_dashboard(driver)
+    search_table(driver, LOAD_DOMAIN)
+    open_first_edit(driver)
+    uid = unique_id()
+    fill_contact_form(driver, {
+        "name": f"Journey Updated U{user} {uid}",
+        "email": f"updated{user}-{uid}@{LOAD_DOMAIN}",
+    })
+    submit_contact_form(driver)
+    assert "index.php" in driver.current_url, "Tidak redirect ke dashboard setelah update"
+
+
+def journey_search(driver, user):
+    """TC-010: cari keyword lalu kosongkan search."""
+    load_dashboard(driver)
+    search_table(driver, "John")
+    clear_search(driver)
+
+
+def journey_profile(driver, user):
+    """TC-028: buka halaman profil dari dashboard."""
+    load_dashboard(driver, datatable=False)
+    open_profile(driver)
+    username = driver.find_element(By.ID, "username").get_attribute("value")
+    assert username == USERNAME, f"Username tidak sesuai: {username}"
+
+
+JOURNEYS = {
+    "create": journey_create,
+    "update": journey_update,
+    "search": journey_search,
+    "profile": journey_profile,
+}
+
+
+def parse_mix(text):
+    """'create=30,search=70' -> {'create': 30.0, 'search': 70.0}"""
+    mix = {}
+    for part in text.split(","):
+        name, weight = part.split("=")
+        if name.strip() not in JOURNEYS:
+            raise ValueError(f"Journey tidak dikenal: {name}")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+# =============================================================================
+# SIMULATED USERS
+# =============================================================================
+
+def login_browser(driver):
+    """Login dengan session PHP milik browser ini sendiri."""
+    select_database(driver, BASE_URL)
+    session_id = http_login(BASE_URL, USERNAME, PASSWORD)
+    set_browser_cookie(driver, BASE_URL, SESSION_COOKIE, session_id)
+
+
+def _quit(driver):
+    """Tutup browser; abaikan jika session sudah mati."""
+    try:
+        driver.quit()
+    except WebDriverException:
+        pass
+
+
+class JourneyReplay:
+    """
+    N user simulasi, masing-masing satu browser di thread sendiri.
+    Semua browser diluncurkan dan login dulu, baru jendela pengukuran dimulai.
+    """
+
+    def __init__(self, users, duration, mix, think_time=0.0, seed=1):
+        self.users = users
+        self.duration = duration
+        self.journeys = list(mix)
+        self.weights = [mix[name] for name in self.journeys]
+        self.think_time = think_time
+        self.seed = seed
+        self.results = []
+        self._lock = threading.Lock()
+
+    def _record(self, journey, started_at, began, error):
+        finished = time.perf_counter()
+        with self._lock:
+            self.results.append({
+                "endpoint": journey,
+                "at": finished - started_at,
+                "latency": finished - began,
+                "error": error,
+            })
+
+    def _user(self, user, driver, start_event, state):
+        """Loop satu user; browser-nya ditutup di sini begitu thread selesai."""
+        rng = random.Random(self.seed + user)
+        try:
+            start_event.wait()
+            started_at = state["started_at"]
+            while time.perf_counter() - started_at < self.duration:
+                journey = rng.choices(self.journeys, self.weights)[0]
+                began = time.perf_counter()
+                error = None
+                try:
+                    JOURNEYS[journey](driver, user)
+                except Exception as exc:  # mis. TimeoutError/IndexError dari helper: tetap dicatat gagal
+                    error = type(exc).__name__
+                self._record(journey, started_at, began, error)
+                if error:
+                    try:
+                        load_dashboard(driver, datatable=False)  # pulihkan state browser
+                    except Exception:
+                        pass
+                if self.think_time:
+                    time.sleep(rng.uniform(0, 2 * self.think_time))
+        finally:
+            _quit(driver)
+
+    def run(self):
+        """Luncurkan browser, jalankan semua user sampai durasi habis, tutup browser."""
+        drivers = []
+        try:
+            for _ in range(self.users):
+                driver = create_driver()
+                drivers.append(driver)
+                login_browser(driver)
+
+            start_event = threading.Event()
+            state = {}
+            threads = [
+                threading.Thread(target=self._user, args=(user, driver, start_event, state), daemon=True)
+                for user, driver in enumerate(drivers)
+            ]
+            for thread in threads:
+                thread.start()
+            state["started_at"] = time.perf_counter()
+            start_event.set()
+            for thread in threads:
+                thread.join()
+        finally:
+            # Thread user sudah menutup browser-nya; ini untuk gagal launch/login atau Ctrl+C
+            for driver in drivers:
+                _quit(driver)
+        return self.results
+
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay journey browser paralel untuk DamnCRUD")
+    parser.add_argument("--users", type=int, default=4, help="jumlah browser/user simulasi (default 4)")
+    parser.add_argument("--duration", type=float, default=120, help="durasi beban dalam detik (default 120)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"bobot journey (default {DEFAULT_MIX})")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="rata-rata jeda antar journey per user (detik)")
+    parser.add_argument("--interval", type=float, default=30, help="lebar jendela laporan (detik)")
+    parser.add_argument("--seed", type=int, default=1, help="seed pemilihan journey")
+    parser.add_argument("--output", default=None, help="simpan hasil ke file JSON")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    if "update" in mix:
+        print(f"▶ Seed {args.users} kontak untuk journey update...")
+        seed_load_contacts(args.users)
+
+    print(f"▶ {args.users} user browser selama {args.duration}s, mix {mix}")
+    replay = JourneyReplay(args.users, args.duration, mix, think_time=args.think_time, seed=args.seed)
+    try:
+        results = replay.run()
+    finally:
+        print(f"\n✓ {cleanup_load_contacts()} kontak load test dihapus")
+
+    if not results:
+        print("Tidak ada journey yang selesai")
+        return
+
+    rows = summarize(results, args.interval)
+    print_report(rows, dropped=0)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "base_url": BASE_URL,
+                "executed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "users": args.users, "duration": args.duration, "think_time": args.think_time,
+                "mix": mix, "rows": rows,
+            }, f, indent=2)
+        print(f"✓ Hasil disimpan ke {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+"""
+=============================================================================
+LOAD TEST - Open-Model HTTP Load Generator DamnCRUD
+=============================================================================
+File: load_test.py
+Membangkitkan beban ke login.php, index.php, create.php, update.php dan
+delete.php dengan laju kedatangan tetap (open model): request baru tetap
+dikirim sesuai jadwal walaupun request sebelumnya belum selesai, sehingga
+antrean saat server overload terlihat di latency.
+
+Latency dihitung dari waktu kedatangan terjadwal (bukan saat request benar-
+benar dikirim), jadi keterlambatan di sisi client ikut terukur.
+
+Persiapan & cleanup memakai DamnCRUDClient (http_client.py):
+- Sebelum beban: login N session dan buat kontak @load.example.com yang
+  dipakai operasi update/delete
+- Setelah beban: hapus semua kontak @load.example.com
+
+Hanya butuh stack lokal (php -S + MySQL), tanpa service eksternal.
+
+CARA MENJALANKAN:
+- Default : python load_test.py --rate 20 --duration 60
+- Mix     : python load_test.py --mix index=60,create=15,update=15,delete=5,login=5
+- Output  : python load_test.py --rate 50 --output load.json
+=============================================================================
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import time
+from datetime import datetime
+
+import aiohttp
+
+from benchmark import percentile
+from database import DB_HEADER
+from http_client import PASSWORD, SESSION_COOKIE, USERNAME, DamnCRUDClient, redirect_target
+
+
+# =============================================================================
+# KONFIGURASI
+# =============================================================================
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:81/DamnCRUD")
+
+LOAD_DOMAIN = "load.example.com"
+DEFAULT_MIX = "index=50,create=20,update=15,delete=10,login=5"
+ENDPOINTS = ("login", "index", "create", "update", "delete")
+
+
+def parse_mix(text):
+    """'index=50,create=20' -> {'index': 50.0, 'create': 20.0}"""
+    mix = {}
+    for part in text.split(","):
+        name, weight = part.split("=")
+        if name.strip() not in ENDPOINTS:
+            raise ValueError(f"Endpoint tidak dikenal: {name}")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+# =============================================================================
+# SETUP & CLEANUP (sinkron, di luar jendela pengukuran)
+# =============================================================================
+
+def login_sessions(count, database=None):
+    """Login `count` session terpisah, kembalikan daftar PHPSESSID."""
+    session_ids = []
+    for _ in range(count):
+        client = DamnCRUDClient(BASE_URL, database=database)
+        response = client.login(USERNAME, PASSWORD)
+        if redirect_target(response) != "index.php":
+            raise RuntimeError("Login gagal, cek USERNAME/PASSWORD dan BASE_URL")
+        session_ids.append(client.session_id)
+        client.close()
+    return session_ids
+
+
+def load_contact_ids(client):
+    """Id kontak milik load test (email @load.example.com)."""
+    _, contacts = client.index()
+    return [int(c["id"]) for c in contacts if c["email"].endswith(f"@{LOAD_DOMAIN}")]
+
+
+def seed_load_contacts(count, database=None):
+    """Buat `count` kontak untuk operasi update/delete, kembalikan id-nya."""
+    client = DamnCRUDClient(BASE_URL, timeout=30, database=database)
+    client.login(USERNAME, PASSWORD)
+    try:
+        for n in range(count):
+            client.create(f"Load Seed {n}", f"seed{n}@{LOAD_DOMAIN}", "0800000000", "Load")
+        return load_contact_ids(client)
+    finally:
+        client.close()
+
+
+def cleanup_load_contacts(database=None):
+    """Hapus semua kontak @load.example.com. Mengembalikan jumlahnya."""
+    client = DamnCRUDClient(BASE_URL, timeout=30, database=database)
+    client.login(USERNAME, PASSWORD)
+    try:
+        ids = load_contact_ids(client)
+        for contact_id in ids:
+            client.delete(contact_id)
+        return len(ids)
+    finally:
+        client.close()
+
+
+# =============================================================================
+# LOAD GENERATOR
+# =============================================================================
+
+def _cookie(session_id):
+    """Header Cookie untuk session login (cookie jar aiohttp tidak dipakai)."""
+    return {"Cookie": f"{SESSION_COOKIE}={session_id}"}
+
+
+class LoadGenerator:
+    """
+    Generator beban open-model. Kedatangan dijadwalkan dengan proses Poisson
+    (atau konstan) pada `rate` request/detik selama `duration` detik.
+    """
+
+    def __init__(self, rate, duration, mix, session_ids, contact_ids, timeout=30,
+                 arrival="poisson", max_inflight=1000, seed=1, database=None):
+        self.rate = rate
+        self.duration = duration
+        self.endpoints = list(mix)
+        self.weights = [mix[name] for name in self.endpoints]
+        self.session_ids = session_ids
+        self.contact_ids = list(contact_ids)
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.arrival = arrival
+        self.max_inflight = max_inflight
+        self.rng = random.Random(seed)
+        self.headers = {DB_HEADER: database} if database else {}
+        self.results = []
+        self.dropped = 0
+        self._sequence = itertools.count()
+
+    # -------------------------------------------------------------------------
+    # OPERATIONS (mengembalikan True jika response sesuai harapan)
+    # -------------------------------------------------------------------------
+
+    async def op_login(self, http, session_id):
+        data = {"username": USERNAME, "password": PASSWORD}
+        async with http.post(f"{BASE_URL}/login.php", data=data, allow_redirects=False) as response:
+            await response.read()
+            return redirect_target(response) == "index.php"
+
+    async def op_index(self, http, session_id):
+        async with http.get(f"{BASE_URL}/index.php", headers=_cookie(session_id),
+                            allow_redirects=False) as response:
+            body = await response.text()
+            return response.status == 200 and 'id="employee"' in body
+
+    async def op_create(self, http, session_id):
+        n = next(self._sequence)
+        data = {"name": f"Load User {n}", "email": f"user{n}@{LOAD_DOMAIN}",
+                "phone": "0811111111", "title": "Load"}
+        async with http.post(f"{BASE_URL}/create.php", data=data, headers=_cookie(session_id),
+                             allow_redirects=False) as response:
+            await response.read()
+            return redirect_target(response) == "index.php"
+
+    async def op_update(self, http, session_id):
+        if not self.contact_ids:
+            return None
+        contact_id = self.rng.choice(self.contact_ids)
+        n = next(self._sequence)
+        data = {"name": f"Load Updated {n}", "email": f"updated{n}@{LOAD_DOMAIN}",
+                "phone": "0822222222", "title": "Load"}
+        async with http.post(f"{BASE_URL}/update.php", params={"id": contact_id}, data=data,
+                             headers=_cookie(session_id), allow_redirects=False) as response:
+            await response.read()
+            return redirect_target(response) == "index.php"
+
+    async def op_delete(self, http, session_id):
+        if not self.contact_ids:
+            return None
+        contact_id = self.contact_ids.pop(self.rng.randrange(len(self.contact_ids)))
+        async with http.get(f"{BASE_URL}/delete.php", params={"id": contact_id},
+                            headers=_cookie(session_id), allow_redirects=False) as response:
+            await response.read()
+            return redirect_target(response) == "index.php"
+
+    # -------------------------------------------------------------------------
+    # SCHEDULER
+    # -------------------------------------------------------------------------
+
+    async def _execute(self, http, endpoint, session_id, scheduled, started_at):
+        operation = getattr(self, f"op_{endpoint}")
+        error = None
+        try:
+            ok = await operation(http, session_id)
+            if ok is None:
+                return  # tidak ada kontak tersisa untuk update/delete
+            if not ok:
+                error = "unexpected response"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            error = type(exc).__name__
+        finished = time.perf_counter()
+        self.results.append({
+            "endpoint": endpoint,
+            "at": finished - started_at,
+            "latency": finished - scheduled,
+            "error": error,
+        })
+
+    def _next_gap(self):
+        if self.arrival == "constant":
+            return 1 / self.rate
+        return self.rng.expovariate(self.rate)
+
+    async def run(self):
+        """Jalankan beban sampai `duration` habis dan semua request selesai."""
+        # Cookie session diset per request; satu connection pool untuk semua session
+        connector = aiohttp.TCPConnector(limit=self.max_inflight)
+        async with aiohttp.ClientSession(connector=connector, timeout=self.timeout, headers=self.headers,
+                                         cookie_jar=aiohttp.DummyCookieJar()) as http:
+            started_at = time.perf_counter()
+            scheduled = started_at
+            sessions = itertools.cycle(self.session_ids)
+            tasks = set()
+
+            while scheduled - started_at < self.duration:
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                if len(tasks) >= self.max_inflight:
+                    self.dropped += 1
+                else:
+                    endpoint = self.rng.choices(self.endpoints, self.weights)[0]
+                    task = asyncio.create_task(
+                        self._execute(http, endpoint, next(sessions), scheduled, started_at)
+                    )
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                scheduled += self._next_gap()
+
+            if tasks:
+                await asyncio.gather(*tasks)
+        return self.results
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+
+def summarize(results, interval):
+    """
+    Ringkas hasil per jendela waktu dan per endpoint:
+    throughput (req/s), error rate, p50/p95/p99 latency (ms).
+    """
+    buckets = {}
+    for result in results:
+        window = int(result["at"] // interval) * interval
+        buckets.setdefault((window, result["endpoint"]), []).append(result)
+        buckets.setdefault(("total", result["endpoint"]), []).append(result)
+
+    rows = []
+    for (window, endpoint), items in buckets.items():
+        latencies = [item["latency"] * 1000 for item in items]
+        errors = sum(1 for item in items if item["error"])
+        span = interval if window != "total" else max(r["at"] for r in results) or 1
+        rows.append({
+            "window": window,
+            "endpoint": endpoint,
+            "requests": len(items),
+            "throughput": round(len(items) / span, 2),
+            "error_rate": round(errors / len(items), 4),
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p95_ms": round(percentile(latencies, 95), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+        })
+    rows.sort(key=lambda row: (row["window"] == "total", row["window"] if row["window"] != "total" else 0,
+                               row["endpoint"]))
+    return rows
+
+
+def print_report(rows, dropped):
+    header = (f"{'Window':>7} | {'Endpoint':<8} | {'Req':>6} | {'Req/s':>7} | {'Err %':>6} | "
+              f"{'p50 ms':>8} | {'p95 ms':>8} | {'p99 ms':>8}")
+    print("\n" + "=" * len(header))
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        window = "TOTAL" if row["window"] == "total" else f"{row['window']}s"
+        print(f"{window:>7} | {row['endpoint']:<8} | {row['requests']:>6} | {row['throughput']:>7} | "
+              f"{row['error_rate'] * 100:>6.1f} | {row['p50_ms']:>8} | {row['p95_ms']:>8} | {row['p99_ms']:>8}")
+    print("=" * len(header))
+    if dropped:
+        print(f"⚠️ {dropped} kedatangan di-drop karena --max-inflight client tercapai")
+
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Open-model load generator untuk DamnCRUD")
+    parser.add_argument("--rate", type=float, default=10, help="kedatangan per detik (default 10)")
+    parser.add_argument("--duration", type=float, default=60, help="durasi beban dalam detik (default 60)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"bobot endpoint (default {DEFAULT_MIX})")
+    parser.add_argument("--arrival", choices=("poisson", "constant"), default="poisson",
+                        help="distribusi jarak antar kedatangan")
+    parser.add_argument("--sessions", type=int, default=20,
+                        help="jumlah session login (PHP mengunci file session per request)")
+    parser.add_argument("--seed-contacts", type=int, default=200,
+                        help="kontak yang dibuat untuk operasi update/delete")
+    parser.add_argument("--interval", type=float, default=5, help="lebar jendela laporan (detik)")
+    parser.add_argument("--timeout", type=float, default=30, help="timeout per request (detik)")
+    parser.add_argument("--max-inflight", type=int, default=1000, help="batas request terbuka di client")
+    parser.add_argument("--database", default=None, help="schema tujuan (butuh DAMNCRUD_DB_OVERRIDE=1)")
+    parser.add_argument("--output", default=None, help="simpan hasil ke file JSON")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    print(f"▶ Login {args.sessions} session & seed {args.seed_contacts} kontak...")
+    session_ids = login_sessions(args.sessions, args.database)
+    contact_ids = seed_load_contacts(args.seed_contacts, args.database)
+
+    print(f"▶ Beban {args.rate} req/s ({args.arrival}) selama {args.duration}s, mix {mix}")
+    generator = LoadGenerator(
+        args.rate, args.duration, mix, session_ids, contact_ids, timeout=args.timeout,
+        arrival=args.arrival, max_inflight=args.max_inflight, database=args.database,
+    )
+    try:
+        results = asyncio.run(generator.run())
+    finally:
+        print(f"\n✓ {cleanup_load_contacts(args.database)} kontak load test dihapus")
+
+    rows = summarize(results, args.interval)
+    print_report(rows, generator.dropped)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "base_url": BASE_URL,
+                "executed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "rate": args.rate, "duration": args.duration, "arrival": args.arrival,
+                "mix": mix, "dropped": generator.dropped, "rows": rows,
+            }, f, indent=2)
+        print(f"✓ Hasil disimpan ke {args.output}")
+
+
+if __name__ == "__main__":
+    main()
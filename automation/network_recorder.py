@@ -0,0 +1,268 @@
+"""
+=============================================================================
+NETWORK RECORDER - Page Weight, Request Count & HAR Export
+=============================================================================
+File: network_recorder.py
+Recorder opt-in untuk driver Selenium yang membaca event CDP Network
+(Network.requestWillBeSent, responseReceived, loadingFinished, ...) dari
+performance log Chrome. Untuk setiap halaman yang direkam dicatat:
+- jumlah request
+- total bytes yang ditransfer dan ukuran HTML dokumen utama
+- resource terbesar
+
+Hasil bisa diekspor ke HAR (HTTP Archive 1.2) dan dibandingkan dengan
+budget, mis. "index.php dengan 1k kontak < 512 KB HTML".
+
+Performance log harus diaktifkan saat browser diluncurkan, sehingga
+recorder memakai driver khusus (lihat enable_performance_log()), bukan
+browser dari pool.
+
+CONTOH:
+    recorder = NetworkRecorder(driver)
+    with recorder.capture("index.php") as page:
+        driver.get(f"{BASE_URL}/index.php")
+    assert_budget(page, max_html_kb=512, max_requests=10)
+    export_har(recorder.pages, "har/index.har")
+=============================================================================
+"""
+
+import json
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+# =============================================================================
+# DRIVER SETUP
+# =============================================================================
+
+def enable_performance_log(options):
+    """Aktifkan performance log (event CDP Network) pada ChromeOptions."""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+# =============================================================================
+# PAGE CAPTURE
+# =============================================================================
+
+class PageCapture:
+    """Semua request yang terjadi selama satu halaman direkam."""
+
+    def __init__(self, name):
+        self.name = name
+        self.started = datetime.now(timezone.utc)
+        self.entries = []
+
+    @property
+    def request_count(self):
+        return len(self.entries)
+
+    @property
+    def total_bytes(self):
+        return sum(entry["transfer_bytes"] for entry in self.entries)
+
+    @property
+    def document(self):
+        """Entry dokumen HTML utama (respons Document non-redirect terakhir)."""
+        documents = [
+            entry for entry in self.entries
+            if entry["type"] == "Document" and not 300 <= (entry["status"] or 0) < 400
+        ]
+        return documents[-1] if documents else None
+
+    @property
+    def html_bytes(self):
+        document = self.document
+        return document["transfer_bytes"] if document else 0
+
+    def largest(self, count=5):
+        """Resource terbesar (berdasarkan bytes transfer)."""
+        return sorted(self.entries, key=lambda entry: entry["transfer_bytes"], reverse=True)[:count]
+
+    def summary(self):
+        return {
+            "page": self.name,
+            "requests": self.request_count,
+            "total_bytes": self.total_bytes,
+            "html_bytes": self.html_bytes,
+            "largest": [(entry["url"], entry["transfer_bytes"]) for entry in self.largest(3)],
+        }
+
+
+# =============================================================================
+# RECORDER
+# =============================================================================
+
+class NetworkRecorder:
+    """
+    Bangun daftar request dari performance log driver.
+    Setiap pemanggilan capture() mengambil event yang terjadi di dalam blok.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = []
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self._drain()
+
+    def _drain(self):
+        """Ambil (dan kosongkan) event Network dari performance log."""
+        events = []
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            if message["method"].startswith("Network."):
+                events.append(message)
+        return events
+
+    @contextmanager
+    def capture(self, name):
+        """Rekam semua request yang terjadi selama blok sebagai satu halaman."""
+        self._drain()
+        page = PageCapture(name)
+        yield page
+        page.entries = build_entries(self._drain())
+        self.pages.append(page)
+
+
+def build_entries(events):
+    """
+    Gabungkan event Network per requestId menjadi entry request.
+    Redirect (requestWillBeSent dengan redirectResponse) menjadi entry sendiri.
+    """
+    open_requests = {}
+    entries = []
+
+    def new_entry(params):
+        request = params["request"]
+        return {
+            "url": request["url"],
+            "method": request["method"],
+            "type": params.get("type", "Other"),
+            "started": params.get("wallTime"),
+            "timestamp": params["timestamp"],
+            "status": None,
+            "mime_type": "",
+            "transfer_bytes": 0,
+            "body_bytes": 0,
+            "duration_ms": 0.0,
+            "failed": None,
+        }
+
+    for event in events:
+        method, params = event["method"], event["params"]
+        request_id = params.get("requestId")
+
+        if method == "Network.requestWillBeSent":
+            previous = open_requests.pop(request_id, None)
+            redirect = params.get("redirectResponse")
+            if previous is not None and redirect:
+                previous["status"] = redirect["status"]
+                previous["mime_type"] = redirect.get("mimeType", "")
+                previous["transfer_bytes"] = int(redirect.get("encodedDataLength", 0))
+                previous["duration_ms"] = round((params["timestamp"] - previous["timestamp"]) * 1000, 1)
+                entries.append(previous)
+            open_requests[request_id] = new_entry(params)
+
+        elif request_id in open_requests:
+            entry = open_requests[request_id]
+            if method == "Network.responseReceived":
+                entry["status"] = params["response"]["status"]
+                entry["mime_type"] = params["response"].get("mimeType", "")
+                entry["type"] = params.get("type", entry["type"])
+            elif method == "Network.dataReceived":
+                entry["body_bytes"] += params.get("dataLength", 0)
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                entry["transfer_bytes"] = int(params.get("encodedDataLength", 0))
+                entry["duration_ms"] = round((params["timestamp"] - entry["timestamp"]) * 1000, 1)
+                entry["failed"] = params.get("errorText")
+                entries.append(open_requests.pop(request_id))
+
+    # Request yang belum selesai saat blok berakhir tetap dihitung
+    entries.extend(open_requests.values())
+    return entries
+
+
+# =============================================================================
+# BUDGETS
+# =============================================================================
+
+def check_budget(page, max_requests=None, max_total_kb=None, max_html_kb=None):
+    """Daftar pelanggaran budget untuk satu halaman (kosong jika lolos)."""
+    violations = []
+    if max_requests is not None and page.request_count > max_requests:
+        violations.append(f"{page.request_count} requests > {max_requests}")
+    if max_total_kb is not None and page.total_bytes > max_total_kb * 1024:
+        violations.append(f"total {page.total_bytes / 1024:.1f} KB > {max_total_kb} KB")
+    if max_html_kb is not None and page.html_bytes > max_html_kb * 1024:
+        violations.append(f"HTML {page.html_bytes / 1024:.1f} KB > {max_html_kb} KB")
+    return violations
+
+
+def assert_budget(page, **limits):
+    """AssertionError berisi pelanggaran dan resource terbesar jika budget terlampaui."""
+    violations = check_budget(page, **limits)
+    if violations:
+        largest = "\n".join(
+            f"  {entry['transfer_bytes'] / 1024:8.1f} KB  {entry['url']}" for entry in page.largest()
+        )
+        raise AssertionError(
+            f"Budget {page.name} terlampaui: {', '.join(violations)}\nResource terbesar:\n{largest}"
+        )
+
+
+# =============================================================================
+# HAR EXPORT
+# =============================================================================
+
+def _iso(wall_time, fallback):
+    if wall_time is None:
+        return fallback.isoformat()
+    return datetime.fromtimestamp(wall_time, timezone.utc).isoformat()
+
+
+def to_har(pages):
+    """Konversi daftar PageCapture ke dict HAR 1.2."""
+    har_pages, har_entries = [], []
+    for index, page in enumerate(pages, start=1):
+        page_id = f"page_{index}"
+        har_pages.append({
+            "id": page_id,
+            "title": page.name,
+            "startedDateTime": page.started.isoformat(),
+            "pageTimings": {},
+        })
+        for entry in page.entries:
+            har_entries.append({
+                "pageref": page_id,
+                "startedDateTime": _iso(entry["started"], page.started),
+                "time": entry["duration_ms"],
+                "request": {
+                    "method": entry["method"], "url": entry["url"], "httpVersion": "",
+                    "cookies": [], "headers": [], "queryString": [],
+                    "headersSize": -1, "bodySize": -1,
+                },
+                "response": {
+                    "status": entry["status"] or 0, "statusText": "", "httpVersion": "",
+                    "cookies": [], "headers": [], "redirectURL": "",
+                    "content": {"size": entry["body_bytes"], "mimeType": entry["mime_type"]},
+                    "headersSize": -1, "bodySize": entry["transfer_bytes"],
+                },
+                "cache": {},
+                "timings": {"send": 0, "wait": entry["duration_ms"], "receive": 0},
+                "_resourceType": entry["type"],
+            })
+    return {"log": {
+        "version": "1.2",
+        "creator": {"name": "DamnCRUD network_recorder", "version": "1.0"},
+        "pages": har_pages,
+        "entries": har_entries,
+    }}
+
+
+def export_har(pages, path):
+    """Tulis HAR ke file; folder dibuat jika belum ada."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(to_har(pages), indent=2), encoding="utf-8")
+    return path
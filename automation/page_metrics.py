@@ -0,0 +1,159 @@
+"""
+=============================================================================
+PAGE METRICS - Navigation Timing & Paint per Page Load
+=============================================================================
+File: page_metrics.py
+Mencatat Navigation Timing (performance.getEntriesByType('navigation')),
+first-contentful-paint dan jumlah resource untuk setiap halaman yang
+dibuka test, tanpa request tambahan ke server.
+
+Driver dibungkus EventFiringWebDriver dengan PageMetricsListener. Metrik
+halaman diambil tepat sebelum halaman ditinggalkan (driver.get() atau
+klik yang bisa memicu navigasi/submit form) dan sekali lagi di akhir
+test. Satu halaman dicatat sekali (dedup berdasarkan performance.timeOrigin).
+Navigasi lewat execute_script tidak memicu listener; pemanggilnya
+(mis. pages.ContactForm.submit) memanggil capture_current() sendiri.
+
+Hasil dilampirkan ke report pytest sebagai user property (JUnit XML) dan
+extra JSON (pytest-html), serta diringkas per halaman di akhir run.
+=============================================================================
+"""
+
+import json
+import statistics
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.events import AbstractEventListener, EventFiringWebDriver
+
+
+# Semua waktu relatif terhadap awal navigasi (ms)
+_COLLECT_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav) { return null; }
+var fcp = performance.getEntriesByName('first-contentful-paint')[0];
+return {
+    url: location.href,
+    time_origin: performance.timeOrigin,
+    type: nav.type,
+    redirects: nav.redirectCount,
+    ttfb_ms: nav.responseStart,
+    response_ms: nav.responseEnd - nav.responseStart,
+    dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+    load_ms: nav.loadEventEnd,
+    transfer_bytes: nav.transferSize,
+    fcp_ms: fcp ? fcp.startTime : null,
+    resources: performance.getEntriesByType('resource').length
+};
+"""
+
+_TIMING_FIELDS = ("ttfb_ms", "response_ms", "dom_content_loaded_ms", "load_ms", "fcp_ms")
+
+
+# =============================================================================
+# LISTENER
+# =============================================================================
+
+class PageMetricsListener(AbstractEventListener):
+    """
+    Listener EventFiringWebDriver yang mengumpulkan metrik setiap halaman
+    ke self.pages (urut sesuai waktu dibuka).
+    """
+
+    def __init__(self):
+        self._pages = {}
+
+    @property
+    def pages(self):
+        return list(self._pages.values())
+
+    def capture(self, driver):
+        """Ambil metrik halaman yang sedang terbuka (driver asli, bukan wrapper)."""
+        try:
+            metrics = driver.execute_script(_COLLECT_JS)
+        except WebDriverException:
+            # Mis. alert confirm() masih terbuka atau browser sudah tertutup
+            return None
+        if not metrics or not metrics["url"].startswith("http"):
+            return None
+
+        metrics["page"] = urlsplit(metrics["url"]).path.rsplit("/", 1)[-1] or "/"
+        for field in _TIMING_FIELDS:
+            if metrics[field] is not None:
+                metrics[field] = round(metrics[field], 1)
+
+        # Halaman yang sama bisa tertangkap berkali-kali (mis. klik tanpa
+        # navigasi); simpan versi terakhir karena load/fcp mungkin baru lengkap
+        self._pages[metrics["time_origin"]] = metrics
+        return metrics
+
+    def before_navigate_to(self, url, driver):
+        self.capture(driver)
+
+    def before_navigate_back(self, driver):
+        self.capture(driver)
+
+    def before_navigate_forward(self, driver):
+        self.capture(driver)
+
+    def before_click(self, element, driver):
+        self.capture(driver)
+
+
+def wrap_driver(driver):
+    """
+    Bungkus driver dengan EventFiringWebDriver + PageMetricsListener.
+    Mengembalikan (driver_terbungkus, listener).
+    """
+    listener = PageMetricsListener()
+    return EventFiringWebDriver(driver, listener), listener
+
+
+def capture_current(driver):
+    """
+    Ambil metrik halaman saat ini jika driver dibungkus wrap_driver().
+    Untuk navigasi yang tidak lewat get()/click(), mis. submit form lewat
+    execute_script (pages.ContactForm.submit), yang tidak memicu listener.
+    """
+    listener = getattr(driver, "_listener", None)
+    if isinstance(listener, PageMetricsListener):
+        listener.capture(driver.wrapped_driver)
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+
+def format_page(metrics):
+    """Ringkasan satu halaman untuk user property JUnit."""
+    return json.dumps(
+        {key: value for key, value in metrics.items() if key not in ("url", "time_origin")},
+        sort_keys=True,
+    )
+
+
+def summarize(records):
+    """
+    Ringkas metrik per halaman: {page: {count, ttfb_ms, load_ms, fcp_ms}}
+    dengan nilai median.
+    """
+    pages = {}
+    for record in records:
+        pages.setdefault(record["page"], []).append(record)
+
+    summary = {}
+    for page, items in pages.items():
+        summary[page] = {"count": len(items)}
+        for field in ("ttfb_ms", "load_ms", "fcp_ms"):
+            values = [item[field] for item in items if item.get(field)]
+            summary[page][field] = round(statistics.median(values), 1) if values else None
+    return summary
+
+
+def format_summary(page, item):
+    """Satu baris ringkasan halaman untuk terminal summary."""
+    timings = " ".join(
+        f"{field[:-3]}={item[field]}ms" if item[field] is not None else f"{field[:-3]}=-"
+        for field in ("ttfb_ms", "load_ms", "fcp_ms")
+    )
+    return f"{page:<14} loads={item['count']:<4} {timings} (median)"
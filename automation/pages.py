@@ -0,0 +1,268 @@
+"""
+=============================================================================
+PAGES - Page Object Tabel Kontak #employee & Form Kontak
+=============================================================================
+File: pages.py
+
+EmployeeTable
+-------------
+Membaca tabel kontak di index.php dalam SATU round trip WebDriver.
+Sebelumnya test membaca tabel dengan find_elements/find_element per baris
+dan per sel (atau mengambil seluruh page_source), sehingga biaya membaca
+tabel besar naik seiring jumlah baris. EmployeeTable.read() menjalankan
+satu execute_script yang mengembalikan semua baris sebagai record
+terstruktur plus info DataTables (total, jumlah hasil filter, halaman).
+
+Scope baris:
+- "page"     : baris yang sedang tampil (halaman DataTables aktif)
+- "filtered" : semua baris yang lolos search aktif, lintas halaman
+
+Contoh:
+    table = EmployeeTable(driver).read()
+    table.total                      # jumlah kontak (recordsTotal)
+    table.rows[0]["name"]            # kolom sesuai header tabel
+    table.find(name="John Doe")      # record pertama yang cocok, atau None
+
+ContactForm
+-----------
+Mengisi form create.php / update.php. Mode default (batched) men-set semua
+field sekaligus dan memicu event input + change dalam satu execute_script,
+lalu submit lewat form.requestSubmit() (validasi `required` tetap jalan).
+Mode realistic_typing=True memakai clear() + send_keys() per field untuk
+test yang memang butuh input per keystroke.
+
+Setiap pengisian form dicatat di FORM_LOG dan diringkas di akhir run.
+Dengan FORM_FILL_COMPARE=1, pengisian batched juga diketik ulang per
+keystroke lebih dulu sehingga penghematan per form terukur berpasangan.
+
+Contoh:
+    form = ContactForm(driver)
+    form.fill({"name": "John", "email": "john@example.com"})
+    form.submit()
+=============================================================================
+"""
+
+import os
+import statistics
+import time
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from page_metrics import capture_current
+from waits import DEFAULT_TABLE
+
+
+# =============================================================================
+# JAVASCRIPT
+# =============================================================================
+
+# Record per baris: kolom dinamai dari header (# -> id), `text` gabungan sel,
+# `links` teks link -> href (edit/delete). Info diisi jika DataTable aktif.
+_READ_TABLE_JS = """
+var table = document.querySelector(arguments[0]), scope = arguments[1];
+if (!table) { return null; }
+var headers = Array.prototype.map.call(table.querySelectorAll('thead th'), function (th) {
+    var name = th.textContent.trim().toLowerCase();
+    return name === '#' ? 'id' : name;
+});
+var isDataTable = !!(window.jQuery && jQuery.fn.dataTable && jQuery.fn.dataTable.isDataTable(table));
+var api = isDataTable ? jQuery(table).DataTable() : null;
+var nodes = api && scope === 'filtered'
+    ? api.rows({search: 'applied', order: 'applied'}).nodes().toArray()
+    : Array.prototype.slice.call(table.querySelectorAll('tbody tr'));
+var rows = [];
+nodes.forEach(function (tr) {
+    if (tr.querySelector('td.dataTables_empty')) { return; }
+    var record = {links: {}}, texts = [];
+    Array.prototype.forEach.call(tr.cells, function (td, i) {
+        var text = td.textContent.trim();
+        texts.push(text);
+        if (headers[i]) { record[headers[i]] = text; }
+        Array.prototype.forEach.call(td.querySelectorAll('a'), function (a) {
+            record.links[a.textContent.trim()] = a.href;
+        });
+    });
+    record.text = texts.join(' ');
+    rows.push(record);
+});
+var info = null;
+if (api) {
+    var page = api.page.info();
+    info = {
+        total: page.recordsTotal, filtered: page.recordsDisplay,
+        start: page.start, end: page.end, page: page.page, pages: page.pages,
+        length: page.length, search: api.search()
+    };
+}
+return {rows: rows, info: info};
+"""
+
+
+# Set value lewat setter native lalu picu event seperti input user.
+# Mengembalikan id field yang tidak ditemukan.
+_FILL_FORM_JS = """
+var values = arguments[0], missing = [];
+var setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+Object.keys(values).forEach(function (id) {
+    var input = document.getElementById(id);
+    if (!input) { missing.push(id); return; }
+    input.focus();
+    setter.call(input, values[id]);
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+    input.blur();
+});
+return missing;
+"""
+
+# Submit form yang berisi field `arguments[0]` lewat tombol submit-nya
+_SUBMIT_FORM_JS = """
+var input = document.getElementById(arguments[0]);
+if (!input || !input.form) { return false; }
+var form = input.form, button = form.querySelector('[type=submit]');
+if (form.requestSubmit) { form.requestSubmit(button); } else { button.click(); }
+return true;
+"""
+
+FORM_FIELDS = ("name", "email", "phone", "title")
+
+# Catatan setiap pengisian form di proses (worker) ini
+FORM_LOG = []
+
+
+def _compare_requested():
+    return os.environ.get("FORM_FILL_COMPARE", "").lower() in ("1", "true", "yes")
+
+
+# =============================================================================
+# PAGE OBJECTS
+# =============================================================================
+
+class TableSnapshot:
+    """Isi tabel pada satu saat: daftar record baris dan info DataTables."""
+
+    def __init__(self, rows, info):
+        self.rows = rows
+        self.info = info
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def total(self):
+        """Jumlah seluruh kontak (tanpa filter)."""
+        return self.info["total"] if self.info else len(self.rows)
+
+    @property
+    def filtered(self):
+        """Jumlah kontak yang lolos search aktif."""
+        return self.info["filtered"] if self.info else len(self.rows)
+
+    def column(self, name):
+        return [row.get(name) for row in self.rows]
+
+    def find(self, **fields):
+        """Record pertama yang semua field-nya sama persis, atau None."""
+        for row in self.rows:
+            if all(row.get(key) == value for key, value in fields.items()):
+                return row
+        return None
+
+    def contains(self, text):
+        """True jika ada baris yang teksnya mengandung `text`."""
+        return any(text in row["text"] for row in self.rows)
+
+
+class EmployeeTable:
+    """Page object tabel kontak (#employee) di index.php."""
+
+    def __init__(self, driver, selector=DEFAULT_TABLE):
+        self.driver = driver
+        self.selector = selector
+
+    def read(self, scope="page"):
+        """Ambil semua baris `scope` dan info DataTables dalam satu execute_script."""
+        data = self.driver.execute_script(_READ_TABLE_JS, self.selector, scope)
+        if data is None:
+            raise NoSuchElementException(f"Tabel {self.selector} tidak ditemukan")
+        return TableSnapshot(data["rows"], data["info"])
+
+    def rows(self, scope="page"):
+        return self.read(scope).rows
+
+    def info(self):
+        return self.read().info
+
+
+class ContactForm:
+    """Page object form kontak di create.php dan update.php."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def _type(self, data):
+        for field, value in data.items():
+            element = self.driver.find_element(By.ID, field)
+            element.clear()
+            element.send_keys(value)
+
+    def _set(self, data):
+        missing = self.driver.execute_script(_FILL_FORM_JS, data)
+        if missing:
+            raise NoSuchElementException(f"Field form tidak ditemukan: {', '.join(missing)}")
+
+    def _timed(self, mode, action, data):
+        start = time.perf_counter()
+        action(data)
+        FORM_LOG.append({"mode": mode, "fields": len(data), "seconds": time.perf_counter() - start})
+
+    def fill(self, data, realistic_typing=False):
+        """
+        Isi field form (id field = key data). Nilai lama selalu diganti.
+        realistic_typing=True mengetik per keystroke (clear + send_keys).
+        """
+        if realistic_typing:
+            self._timed("keystroke", self._type, data)
+            return
+        if _compare_requested():
+            self._timed("keystroke", self._type, data)
+        self._timed("batched", self._set, data)
+
+    def submit(self, field=FORM_FIELDS[0]):
+        """Submit form (satu execute_script); tunggu redirect di pemanggil."""
+        # execute_script tidak memicu before_click: catat create/update.php dulu
+        capture_current(self.driver)
+        if not self.driver.execute_script(_SUBMIT_FORM_JS, field):
+            raise NoSuchElementException(f"Form dengan field #{field} tidak ditemukan")
+
+
+def summarize_fills(records):
+    """Jumlah dan rata-rata durasi pengisian form per mode, plus estimasi penghematan."""
+    summary = {}
+    for mode in ("keystroke", "batched"):
+        values = [record["seconds"] for record in records if record["mode"] == mode]
+        if values:
+            summary[mode] = {"count": len(values), "mean": statistics.mean(values), "total": sum(values)}
+    if len(summary) == 2:
+        saving = summary["keystroke"]["mean"] - summary["batched"]["mean"]
+        summary["saving"] = {"per_form": saving, "total": saving * summary["batched"]["count"]}
+    return summary
+
+
+def format_fills(records):
+    """Baris laporan pengisian form untuk terminal summary."""
+    summary = summarize_fills(records)
+    lines = [
+        f"{mode:<10} forms={summary[mode]['count']:<4} mean={summary[mode]['mean'] * 1000:.0f}ms "
+        f"total={summary[mode]['total']:.2f}s"
+        for mode in ("keystroke", "batched") if mode in summary
+    ]
+    if "saving" in summary:
+        lines.append(
+            f"Hemat per form: {summary['saving']['per_form'] * 1000:.0f}ms  "
+            f"total {summary['saving']['total']:.2f}s untuk {summary['batched']['count']} form batched"
+        )
+    else:
+        lines.append("Jalankan dengan FORM_FILL_COMPARE=1 untuk mengukur penghematan per form")
+    return lines
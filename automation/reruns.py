@@ -0,0 +1,177 @@
+"""
+=============================================================================
+RERUNS - Adaptive Rerun Berdasarkan Riwayat Flakiness
+=============================================================================
+File: reruns.py
+Pengganti `--reruns 2` untuk semua test. Hanya test yang menurut riwayat
+run (history.py) flaky yang diberi marker `flaky` pytest-rerunfailures,
+dengan budget rerun per test:
+
+    reruns = jumlah terkecil sehingga fail_rate ** (reruns + 1) <= RERUN_TARGET
+
+fail_rate = percobaan gagal / semua percobaan test tersebut di riwayat.
+Test yang gagal konsisten (tanpa flip pass <-> fail pada commit yang sama)
+tidak diberi rerun, sehingga langsung gagal tanpa biaya tambahan.
+
+Di akhir run, section "Reruns" menampilkan test yang di-rerun, waktu yang
+dihabiskan untuk percobaan ulang, dan hasil akhirnya.
+
+Konfigurasi (environment variable):
+- RERUN_POLICY    : 0 untuk menonaktifkan (tidak ada rerun otomatis)
+- RERUN_MIN_SCORE : skor flakiness minimum (default 0.05)
+- RERUN_MIN_FLIPS : jumlah flip minimum di riwayat (default 2)
+- RERUN_MAX       : budget rerun maksimum per test (default 3)
+- RERUN_TARGET    : peluang gagal palsu yang masih diterima (default 0.01)
+- RERUN_DELAY     : jeda antar percobaan dalam detik (default 1)
+- RERUN_RUNS      : jumlah run riwayat yang dipakai (default 500)
+=============================================================================
+"""
+
+import math
+import os
+
+import pytest
+
+import history
+
+
+# =============================================================================
+# CONFIG
+# =============================================================================
+
+def enabled():
+    return os.environ.get("RERUN_POLICY", "1") != "0"
+
+
+def min_score():
+    return float(os.environ.get("RERUN_MIN_SCORE", "0.05"))
+
+
+def min_flips():
+    return int(os.environ.get("RERUN_MIN_FLIPS", "2"))
+
+
+def max_reruns():
+    return int(os.environ.get("RERUN_MAX", "3"))
+
+
+def target():
+    return float(os.environ.get("RERUN_TARGET", "0.01"))
+
+
+def delay():
+    return float(os.environ.get("RERUN_DELAY", "1"))
+
+
+def history_runs():
+    return int(os.environ.get("RERUN_RUNS", "500"))
+
+
+# =============================================================================
+# POLICY
+# =============================================================================
+
+def rerun_budget(fail_rate, goal=None, limit=None):
+    """Jumlah rerun agar peluang semua percobaan gagal <= goal (1..limit)."""
+    goal = target() if goal is None else goal
+    limit = max_reruns() if limit is None else limit
+    if fail_rate <= 0:
+        return 1
+    if fail_rate >= 1:
+        return limit
+    needed = math.ceil(math.log(goal) / math.log(fail_rate)) - 1
+    return max(1, min(limit, needed))
+
+
+def plan(scores):
+    """{nodeid: reruns} untuk test yang flaky menurut skor history.flakiness()."""
+    return {
+        nodeid: rerun_budget(item["fail_rate"])
+        for nodeid, item in scores.items()
+        if item["flips"] >= min_flips() and item["score"] >= min_score()
+    }
+
+
+def load_plan(nodeids, db_path=None):
+    """Rencana rerun untuk `nodeids` dari database riwayat (kosong jika belum ada)."""
+    db_path = db_path or history.DB_PATH
+    if not os.path.exists(db_path):
+        return {}
+    conn = history.connect(db_path)
+    try:
+        scores = history.flakiness(conn, history_runs(), history.environment())
+    finally:
+        conn.close()
+    wanted = set(nodeids)
+    return {nodeid: reruns for nodeid, reruns in plan(scores).items() if nodeid in wanted}
+
+
+def apply(config, items):
+    """
+    Tandai test flaky dengan marker `flaky` (pytest-rerunfailures).
+    Test yang sudah punya marker `flaky` sendiri tidak diubah.
+    Mengembalikan rencana {nodeid: reruns}.
+    """
+    if not enabled() or not config.pluginmanager.hasplugin("rerunfailures"):
+        return {}
+    policy = load_plan([item.nodeid for item in items])
+    seconds = delay()
+    for item in items:
+        if item.nodeid in policy and item.get_closest_marker("flaky") is None:
+            item.add_marker(pytest.mark.flaky(reruns=policy[item.nodeid], reruns_delay=seconds))
+    return policy
+
+
+# =============================================================================
+# REPORTING (controller)
+# =============================================================================
+
+class RerunReport:
+    """
+    Plugin pytest di controller: hitung waktu yang dihabiskan percobaan
+    ulang (fase percobaan yang gagal + jeda) dan hasil akhir per test.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.attempts = {}   # nodeid -> {nomor percobaan: detik}
+        self.reruns = {}     # nodeid -> jumlah percobaan yang diulang
+        self.outcomes = {}   # nodeid -> outcome akhir
+        self.total = 0.0
+
+    def pytest_runtest_logreport(self, report):
+        attempt = getattr(report, "rerun", 0)
+        seconds = self.attempts.setdefault(report.nodeid, {})
+        seconds[attempt] = seconds.get(attempt, 0.0) + report.duration
+        self.total += report.duration
+        if report.outcome == "rerun":
+            self.reruns[report.nodeid] = self.reruns.get(report.nodeid, 0) + 1
+        elif report.when == "call" or report.failed:
+            self.outcomes[report.nodeid] = "failed" if report.failed else report.outcome
+
+    def cost(self, nodeid):
+        """Detik fase yang tercatat dari semua percobaan kecuali yang terakhir."""
+        attempts = self.attempts[nodeid]
+        final = max(attempts)
+        return sum(seconds for attempt, seconds in attempts.items() if attempt != final)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        policy = dict(self.config._suite_stats.get("rerun_policy", []))
+        if not self.reruns and not policy:
+            return
+        terminalreporter.section("Reruns")
+        wait = delay()
+        spent = 0.0
+        for nodeid, count in sorted(self.reruns.items()):
+            seconds = self.cost(nodeid) + count * wait
+            spent += seconds
+            budget = policy.get(nodeid, "-")
+            terminalreporter.write_line(
+                f"{nodeid.split('::')[-1]:<55} reruns={count}/{budget} {seconds:6.1f}s "
+                f"-> {self.outcomes.get(nodeid, 'unknown')}"
+            )
+        share = spent / self.total * 100 if self.total else 0.0
+        terminalreporter.write_line(
+            f"Rerun: {sum(self.reruns.values())} percobaan pada {len(self.reruns)} test, "
+            f"{spent:.1f}s ({share:.1f}% dari waktu test); {len(policy)} test flaky diberi budget rerun"
+        )
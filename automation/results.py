@@ -0,0 +1,288 @@
+"""
+=============================================================================
+RESULTS - Streaming Hasil Test per Fase (JSONL) & Live Tail
+=============================================================================
+File: results.py
+Setiap fase test (setup, call, teardown) ditulis sebagai satu baris JSON ke
+results.jsonl begitu fase tersebut selesai, dari semua worker xdist.
+Penulisan dilakukan di controller (report worker sudah diteruskan xdist),
+sehingga hanya ada satu penulis dan satu file.
+
+Isi record fase:
+    {"event": "phase", "test": nodeid, "phase": "setup", "outcome": "passed",
+     "duration": 2.41, "worker": "gw1", "start": ..., "stop": ...,
+     "fixtures": {"browser_pool": 1.92, "logged_in_driver": 0.38}, "rerun": 0}
+
+`fixtures` = biaya setup fixture yang terjadi di fase tersebut (waktu
+sendiri, tanpa fixture yang di-request di dalamnya), mis. peluncuran
+browser (browser_pool) dan login (logged_in_driver). Fixture session
+muncul di test pertama yang memakainya di worker tersebut.
+
+Baris pertama (`session_start`) dan terakhir (`session_finish`) menandai
+run; jumlah test dikirim lewat `collected` begitu collection selesai.
+Percobaan yang diulang pytest-rerunfailures ditulis dengan outcome "rerun".
+
+Konfigurasi (environment variable):
+- RESULTS_STREAM : 0 untuk menonaktifkan
+- RESULTS_PATH   : file output (default results.jsonl)
+
+CARA MENJALANKAN (live tail di terminal lain):
+- Ikuti run      : python results.py --follow
+- Baca file saja : python results.py results.jsonl
+=============================================================================
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+
+
+PHASES = ("setup", "call", "teardown")
+
+# Biaya setup fixture yang belum dilampirkan ke report (per proses)
+_fixture_stack = []
+_fixture_setup = {}
+
+
+def enabled():
+    return os.environ.get("RESULTS_STREAM", "1") != "0"
+
+
+def results_path():
+    return os.environ.get("RESULTS_PATH", "results.jsonl")
+
+
+# =============================================================================
+# FIXTURE TIMING (setiap proses)
+# =============================================================================
+
+@contextmanager
+def fixture_timer(name):
+    """
+    Ukur setup satu fixture. Waktu fixture yang di-request di dalamnya
+    dikurangkan, sehingga total semua fixture ~ durasi fase setup.
+    """
+    _fixture_stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        nested = _fixture_stack.pop()
+        _fixture_setup[name] = _fixture_setup.get(name, 0.0) + elapsed - nested
+        if _fixture_stack:
+            _fixture_stack[-1] += elapsed
+
+
+def pop_fixture_setup():
+    """Biaya fixture sejak fase sebelumnya, dibulatkan; kosongkan catatan."""
+    timings = {name: round(seconds, 4) for name, seconds in _fixture_setup.items()}
+    _fixture_setup.clear()
+    return timings
+
+
+# =============================================================================
+# PLUGIN (controller)
+# =============================================================================
+
+class ResultsStream:
+    """Plugin pytest di controller: tulis record JSONL per fase test."""
+
+    def __init__(self, config, path=None):
+        self.config = config
+        self.path = path or results_path()
+        self.file = None
+        self.started = None
+        self.collected_sent = False
+
+    def _write(self, record):
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def pytest_sessionstart(self, session):
+        self.started = time.time()
+        self.file = open(self.path, "w", encoding="utf-8")
+        self._write({
+            "event": "session_start", "time": datetime.now().isoformat(timespec="seconds"),
+            "workers": getattr(self.config.option, "numprocesses", None) or 0,
+        })
+
+    def pytest_collection_finish(self, session):
+        # Tanpa xdist; dengan xdist session.items di controller kosong
+        if session.items:
+            self._write({"event": "collected", "tests": len(session.items)})
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_node_collection_finished(self, node, ids):
+        # Semua worker mengoleksi test yang sama; cukup kirim sekali
+        if not self.collected_sent:
+            self.collected_sent = True
+            self._write({"event": "collected", "tests": len(ids)})
+
+    def pytest_runtest_logreport(self, report):
+        node = getattr(report, "node", None)  # diisi xdist di controller
+        self._write({
+            "event": "phase", "test": report.nodeid, "phase": report.when,
+            "outcome": report.outcome, "duration": round(report.duration, 4),
+            "worker": node.gateway.id if node is not None else "main",
+            "start": report.start, "stop": report.stop,
+            "fixtures": getattr(report, "fixture_setup", {}),
+            "rerun": getattr(report, "rerun", 0),  # nomor percobaan (pytest-rerunfailures)
+        })
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self.file is None:  # dihentikan sebelum sessionstart plugin ini (health gate)
+            return
+        self._write({
+            "event": "session_finish", "exitstatus": int(exitstatus),
+            "duration": round(time.time() - self.started, 2),
+        })
+        self.file.close()
+
+
+# =============================================================================
+# LIVE TAIL
+# =============================================================================
+
+def read_records(path, follow=False, interval=0.5):
+    """
+    Baca record dari file JSONL. Dengan follow=True, tunggu file dibuat,
+    ikuti baris baru, dan berhenti setelah record session_finish.
+    """
+    while follow and not os.path.exists(path):
+        time.sleep(interval)
+    with open(path, encoding="utf-8") as f:
+        buffer = ""
+        while True:
+            line = f.readline()
+            if line:
+                buffer += line
+                if not buffer.endswith("\n"):
+                    continue  # baris belum selesai ditulis
+                record = json.loads(buffer)
+                buffer = ""
+                yield record
+                if follow and record["event"] == "session_finish":
+                    return
+                continue
+            if not follow:
+                return
+            if os.path.getsize(path) < f.tell():
+                f.seek(0)  # file ditulis ulang oleh run baru
+                buffer = ""
+            time.sleep(interval)
+
+
+def combined_outcome(phases):
+    """Outcome gabungan satu test dari record fase-fasenya."""
+    outcomes = {phase: record["outcome"] for phase, record in phases.items()}
+    if outcomes.get("call") == "failed":
+        return "FAILED"
+    if "failed" in outcomes.values():
+        return "ERROR"
+    if "skipped" in outcomes.values():
+        return "SKIPPED"
+    return "PASSED"
+
+
+def format_phases(phases):
+    parts = []
+    for phase in PHASES:
+        record = phases.get(phase)
+        if record is None:
+            continue
+        text = f"{phase} {record['duration']:.2f}s"
+        fixtures = sorted(record["fixtures"].items(), key=lambda item: -item[1])
+        costly = [f"{name} {seconds:.2f}s" for name, seconds in fixtures if seconds >= 0.01]
+        if costly:
+            text += f" ({', '.join(costly)})"
+        parts.append(text)
+    return "  ".join(parts)
+
+
+class Progress:
+    """Ringkasan run yang dibangun dari record: progress per test dan total."""
+
+    def __init__(self):
+        self.total = None
+        self.pending = {}
+        self.outcomes = Counter()
+        self.phase_seconds = Counter()
+        self.fixture_seconds = Counter()
+        self.reruns = Counter()
+        self.finish = None
+
+    def feed(self, record):
+        """Proses satu record; kembalikan baris progress jika ada test yang selesai."""
+        event = record["event"]
+        if event == "session_start":
+            self.__init__()
+        elif event == "collected":
+            self.total = record["tests"]
+        elif event == "session_finish":
+            self.finish = record
+        elif event == "phase":
+            phases = self.pending.setdefault(record["test"], {})
+            phases[record["phase"]] = record
+            self.phase_seconds[record["phase"]] += record["duration"]
+            self.fixture_seconds.update(record["fixtures"])
+            if record["outcome"] == "rerun":
+                self.reruns[record["test"]] += 1
+            elif record["phase"] == "teardown":
+                return self._complete(record["test"], record["worker"])
+        return None
+
+    def _complete(self, test, worker):
+        phases = self.pending.pop(test)
+        outcome = combined_outcome(phases)
+        self.outcomes[outcome] += 1
+        done = sum(self.outcomes.values())
+        width = len(str(self.total or done))
+        counter = f"{done:>{width}}/{self.total}" if self.total else f"{done}"
+        reruns = f" (rerun x{self.reruns[test]})" if self.reruns[test] else ""
+        return f"[{counter}] {worker:<5} {outcome:<7} {test}{reruns}\n    {format_phases(phases)}"
+
+    def summary(self):
+        lines = ["  ".join(f"{outcome.lower()}={count}" for outcome, count in sorted(self.outcomes.items()))]
+        lines.append("  ".join(f"{phase}={self.phase_seconds[phase]:.1f}s" for phase in PHASES))
+        if self.reruns:
+            lines.append(f"Rerun: {sum(self.reruns.values())} percobaan pada {len(self.reruns)} test")
+        costly = [(name, seconds) for name, seconds in self.fixture_seconds.most_common(5) if seconds >= 0.01]
+        if costly:
+            top = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in costly)
+            lines.append(f"Setup fixture terbesar: {top}")
+        if self.finish:
+            lines.append(f"Selesai dalam {self.finish['duration']:.1f}s (exit {self.finish['exitstatus']})")
+        elif self.pending:
+            lines.append(f"{len(self.pending)} test masih berjalan")
+        return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tampilkan progress dan timing fase dari results.jsonl")
+    parser.add_argument("path", nargs="?", default=results_path(), help="file JSONL (default results.jsonl)")
+    parser.add_argument("--follow", "-f", action="store_true", help="ikuti run yang sedang berjalan")
+    args = parser.parse_args()
+
+    if not args.follow and not os.path.exists(args.path):
+        sys.exit(f"File {args.path} tidak ditemukan")
+    progress = Progress()
+    try:
+        for record in read_records(args.path, follow=args.follow):
+            line = progress.feed(record)
+            if line:
+                print(line, flush=True)
+    except KeyboardInterrupt:
+        pass
+    print("\n" + "\n".join(progress.summary()))
+
+
+if __name__ == "__main__":
+    main()
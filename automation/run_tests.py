@@ -1,77 +1,188 @@
 """
-Script untuk menjalankan Automation Test DamnCRUD
-Jalankan dengan: python run_tests.py
+=============================================================================
+RUN TESTS - Runner Automation Test DamnCRUD (per Tier)
+=============================================================================
+File: run_tests.py
+Menjalankan suite pytest per tier dengan pytest.main di proses ini, jadi
+startup interpreter dan import (Selenium, pytest, plugin) dibayar sekali.
+Setiap tier adalah satu session pytest; di akhir dicetak ringkasan waktu
+dan hasil per tier. State level modul (log, statistik, cache login
+PHPSESSID, schema database aktif) di-reset oleh pytest_configure di
+conftest.py setiap session, jadi hasil tier sama dengan pytest tersendiri.
+Cache yang hanya bergantung pada mesin (path ChromeDriver, isi asset CDN)
+sengaja tetap dipakai bersama.
+
+Tier (urutan dari yang termurah):
+- http    : test_http.py, tanpa browser (paralel)
+- browser : test_pytest.py, Selenium (paralel)
+- budget  : test_page_budgets.py, page weight via CDP (serial)
+- bench   : test_pytest.py -m benchmark dengan BENCHMARK=1 (serial)
+
+Tier serial tidak memakai --workers karena hasil ukurnya dipengaruhi
+beban CPU dari browser lain.
+
+--shard i/n membagi test secara deterministik (hash nodeid, lihat
+TEST_SHARD di conftest.py) sehingga n job CI masing-masing menjalankan
+sebagian test tanpa tumpang tindih.
+
+CARA MENJALANKAN:
+- Default (http, browser, budget) : python run_tests.py
+- Satu tier                       : python run_tests.py --tier http
+- Paralel & shard                 : python run_tests.py --workers 4 --shard 1/3
+- Marker                          : python run_tests.py --tier browser --markers "create or update"
+- Lihat browser                   : python run_tests.py --tier browser --no-headless --workers 0
+- Opsi pytest tambahan            : python run_tests.py -- --html=report.html -x
+=============================================================================
 """
 
+import argparse
+import os
 import subprocess
 import sys
-import os
+import time
+
+import pytest
+
+
+# =============================================================================
+# KONFIGURASI
+# =============================================================================
+# tier: (file test, marker tier, paralel, environment tambahan)
+TIERS = {
+    "http": ("test_http.py", "http", True, {}),
+    "browser": ("test_pytest.py", None, True, {}),
+    "budget": ("test_page_budgets.py", "budget", False, {}),
+    "bench": ("test_pytest.py", "benchmark", False, {"BENCHMARK": "1"}),
+}
+DEFAULT_TIERS = ("http", "browser", "budget")
+
+
+def parse_shard(value):
+    """Validasi '2/3' (shard ke-2 dari 3)."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"format shard harus i/n, bukan {value!r}")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard {value} di luar 1..{count}")
+    return f"{index}/{count}"
+
+
+# =============================================================================
+# PLUGIN (dipasang lewat pytest.main(plugins=...), hanya di proses ini)
+# =============================================================================
+
+class TierResult:
+    """Hitung outcome akhir per test dari report (termasuk dari worker xdist)."""
+
+    def __init__(self):
+        self.outcomes = {}
+
+    def pytest_runtest_logreport(self, report):
+        if report.outcome == "rerun":
+            return
+        if report.failed:
+            self.outcomes[report.nodeid] = "error" if report.when != "call" else "failed"
+        elif report.when == "call" or (report.skipped and report.nodeid not in self.outcomes):
+            self.outcomes[report.nodeid] = report.outcome
+
+    def counts(self):
+        counts = {}
+        for outcome in self.outcomes.values():
+            counts[outcome] = counts.get(outcome, 0) + 1
+        return counts
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+def pytest_args(tier, args):
+    """Argumen pytest.main untuk satu tier."""
+    test_file, marker, parallel, _ = TIERS[tier]
+    expression = " and ".join(f"({part})" for part in (marker, args.markers) if part)
+    command = [test_file]
+    if expression:
+        command += ["-m", expression]
+    if parallel and args.workers != "0":
+        command += ["-n", args.workers]
+    return command + list(args.pytest_args)
+
+
+def run_tier(tier, args):
+    """Jalankan satu tier; kembalikan (exit code, detik, outcome per jenis)."""
+    _, _, _, extra_env = TIERS[tier]
+    command = pytest_args(tier, args)
+    plugins = [TierResult()]
+
+    print("=" * 60)
+    print(f"TIER {tier.upper()}: pytest {' '.join(command)}")
+    print("=" * 60)
+    saved = {name: os.environ.get(name) for name in extra_env}
+    os.environ.update(extra_env)
+    start = time.perf_counter()
+    try:
+        exit_code = pytest.main(command, plugins=plugins)
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+    return int(exit_code), time.perf_counter() - start, plugins[0].counts()
+
+
+def print_summary(results, total_seconds):
+    print("\n" + "=" * 60)
+    print("RINGKASAN PER TIER")
+    print("=" * 60)
+    for tier, (exit_code, seconds, counts) in results.items():
+        outcomes = "  ".join(f"{outcome}={count}" for outcome, count in sorted(counts.items())) or "tidak ada test"
+        status = "OK" if exit_code in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED) else f"exit {exit_code}"
+        print(f"{tier:<8} {seconds:7.1f}s  {status:<8} {outcomes}")
+    print(f"{'total':<8} {total_seconds:7.1f}s")
 
-def install_requirements():
-    """Install dependencies dari requirements.txt"""
-    print("="*60)
-    print("INSTALLING REQUIREMENTS...")
-    print("="*60)
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-    print("\n")
-
-def run_all_tests():
-    """Jalankan semua test cases"""
-    print("="*60)
-    print("RUNNING ALL TEST CASES")
-    print("="*60)
-    subprocess.call([sys.executable, "test_damncrud.py"])
-
-def run_single_test(test_name):
-    """Jalankan test case tertentu"""
-    print(f"="*60)
-    print(f"RUNNING TEST: {test_name}")
-    print(f"="*60)
-    subprocess.call([
-        sys.executable, "-m", "pytest", 
-        f"test_damncrud.py::DamnCRUDTest::{test_name}", 
-        "-v"
-    ])
 
 def main():
-    print("""
-    ╔══════════════════════════════════════════════════════════╗
-    ║     AUTOMATION TEST RUNNER - DamnCRUD Application        ║
-    ╠══════════════════════════════════════════════════════════╣
-    ║  1. Install Requirements                                  ║
-    ║  2. Run All Tests                                        ║
-    ║  3. Run TC-013: Create Contact                           ║
-    ║  4. Run TC-018: Update Contact                           ║
-    ║  5. Run TC-024: Delete Contact                           ║
-    ║  6. Run TC-010: Search DataTables                        ║
-    ║  7. Run TC-028: View Profile                             ║
-    ║  0. Exit                                                 ║
-    ╚══════════════════════════════════════════════════════════╝
-    """)
-    
-    choice = input("Pilih opsi (0-7): ")
-    
-    if choice == "1":
-        install_requirements()
-    elif choice == "2":
-        run_all_tests()
-    elif choice == "3":
-        run_single_test("test_TC013_create_contact_valid_data")
-    elif choice == "4":
-        run_single_test("test_TC018_update_contact_valid_data")
-    elif choice == "5":
-        run_single_test("test_TC024_delete_contact_with_confirmation")
-    elif choice == "6":
-        run_single_test("test_TC010_search_datatables")
-    elif choice == "7":
-        run_single_test("test_TC028_view_profile_page")
-    elif choice == "0":
-        print("Goodbye!")
-        sys.exit(0)
-    else:
-        print("Pilihan tidak valid!")
+    parser = argparse.ArgumentParser(description="Jalankan automation test DamnCRUD per tier")
+    parser.add_argument("--tier", action="append", choices=list(TIERS),
+                        help=f"tier yang dijalankan, bisa diulang (default {' '.join(DEFAULT_TIERS)})")
+    parser.add_argument("--workers", default="auto",
+                        help="jumlah worker xdist untuk tier paralel: N, auto, atau 0 (default auto)")
+    parser.add_argument("--shard", type=parse_shard, help="jalankan sebagian test, mis. 1/3")
+    parser.add_argument("--markers", help="ekspresi marker tambahan, mis. 'create or update'")
+    parser.add_argument("--headless", action=argparse.BooleanOptionalAction, default=None,
+                        help="paksa Chrome headless/headed (default per suite)")
+    parser.add_argument("--keep-going", action="store_true", help="lanjutkan tier berikutnya walau ada yang gagal")
+    parser.add_argument("--install", action="store_true", help="install requirements.txt lalu keluar")
+    parser.add_argument("pytest_args", nargs="*", help="opsi pytest tambahan setelah --")
+    args = parser.parse_args()
+
+    if args.install:
+        sys.exit(subprocess.call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]))
+    # Lewat environment agar ikut ke worker xdist
+    if args.headless is not None:
+        os.environ["HEADLESS"] = "1" if args.headless else "0"
+    if args.shard:
+        os.environ["TEST_SHARD"] = args.shard
+
+    results = {}
+    start = time.perf_counter()
+    for tier in dict.fromkeys(args.tier or DEFAULT_TIERS):
+        results[tier] = run_tier(tier, args)
+        exit_code = results[tier][0]
+        if exit_code == pytest.ExitCode.INTERRUPTED:
+            break  # health gate gagal atau Ctrl+C: tier lain juga tidak akan jalan
+        if exit_code not in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED) and not args.keep_going:
+            break
+    print_summary(results, time.perf_counter() - start)
+
+    failed = [code for code, _, _ in results.values()
+              if code not in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED)]
+    sys.exit(failed[0] if failed else 0)
+
 
 if __name__ == "__main__":
-    # Pindah ke direktori script
+    # Pindah ke direktori script (pytest.ini, conftest.py, file test)
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
     main()
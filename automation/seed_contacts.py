@@ -0,0 +1,208 @@
+"""
+=============================================================================
+SEED CONTACTS - Generator Data Kontak Sintetis untuk Scale Testing
+=============================================================================
+File: seed_contacts.py
+Membuat kontak palsu yang deterministik (seed yang sama = data yang sama)
+secara streaming, lalu memuatnya ke tabel contacts dengan multi-row INSERT
+per batch atau LOAD DATA LOCAL INFILE. Dataset tidak pernah disimpan utuh
+di memori, sehingga 10k sampai 1M baris tetap ringan.
+
+Semua kontak sintetis memakai domain email @seed.example.com agar mudah
+dibedakan dari data asli damncrud.sql.
+
+CARA MENJALANKAN:
+- CLI     : python seed_contacts.py --rows 100000
+- Infile  : python seed_contacts.py --rows 1000000 --method infile
+- Hapus   : python seed_contacts.py --clear
+- Pytest  : @pytest.mark.parametrize("contacts_dataset", [10000], indirect=True)
+=============================================================================
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from itertools import islice
+
+import database
+
+
+SEED_DOMAIN = "seed.example.com"
+DEFAULT_SEED = 42
+DEFAULT_BATCH_SIZE = 1000
+
+FIRST_NAMES = (
+    "John", "David", "Sam", "Colin", "Ricky", "Arnold", "Toni", "Donald", "Joe",
+    "Angela", "James", "Daniel", "Siti", "Budi", "Dewi", "Agus", "Rina", "Andi",
+    "Maria", "Linda", "Kevin", "Sarah", "Putri", "Rizky", "Nina", "Hendra",
+)
+LAST_NAMES = (
+    "Does", "Deacon", "White", "Chaplin", "Waltz", "Hall", "Adams", "Perry",
+    "McKinney", "Horst", "Jameson", "Santoso", "Wijaya", "Pratama", "Lestari",
+    "Saputra", "Hidayat", "Kurniawan", "Nugroho", "Setiawan", "Halim", "Tan",
+)
+TITLES = (
+    "Employee", "Manager", "Assistant", "Supervisor", "Director", "Security",
+    "Judge", "QA Engineer", "Developer", "Analyst", "Consultant", "Intern",
+)
+
+CONTACT_COLUMNS = ("name", "email", "phone", "title", "created")
+BASE_CREATED = datetime(2020, 1, 1, 8, 0, 0)
+
+
+# =============================================================================
+# GENERATOR
+# =============================================================================
+
+def generate_contacts(count, seed=DEFAULT_SEED):
+    """
+    Generator kontak sintetis (name, email, phone, title, created).
+    Deterministik: seed dan count yang sama selalu menghasilkan data yang sama.
+    """
+    rng = random.Random(seed)
+    for n in range(count):
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        created = BASE_CREATED + timedelta(minutes=n, seconds=rng.randrange(60))
+        yield (
+            f"{first} {last}",
+            f"{first.lower()}.{last.lower()}.{n}@{SEED_DOMAIN}",
+            f"08{rng.randrange(10**9, 10**10)}",
+            rng.choice(TITLES),
+            created.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+
+def batched(iterable, size):
+    """Pecah iterable menjadi list berukuran `size` (terakhir bisa lebih kecil)."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+# =============================================================================
+# LOADERS
+# =============================================================================
+
+def insert_batches(connection, rows, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Muat kontak dengan multi-row INSERT. PyMySQL executemany menggabungkan
+    satu batch menjadi satu statement INSERT ... VALUES (...), (...).
+    """
+    sql = f"INSERT INTO contacts ({', '.join(CONTACT_COLUMNS)}) VALUES (%s, %s, %s, %s, %s)"
+    total = 0
+    with database.untracked(connection) as cursor:
+        for batch in batched(rows, batch_size):
+            cursor.executemany(sql, batch)
+            total += len(batch)
+    return total
+
+
+def _escape_infile(value):
+    """Escape nilai untuk format default LOAD DATA (tab-separated)."""
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def load_infile(connection, rows):
+    """
+    Muat kontak dengan LOAD DATA LOCAL INFILE. Baris ditulis streaming ke
+    file sementara (bukan ke memori). Koneksi harus dibuka dengan
+    local_infile=True dan server harus mengizinkan local_infile.
+    """
+    total = 0
+    with tempfile.NamedTemporaryFile("w", suffix=".tsv", delete=False, encoding="utf-8") as f:
+        path = f.name
+        for row in rows:
+            f.write("\t".join(_escape_infile(value) for value in row) + "\n")
+            total += 1
+    try:
+        with database.untracked(connection) as cursor:
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE contacts "
+                f"CHARACTER SET utf8mb4 ({', '.join(CONTACT_COLUMNS)})",
+                (path,),
+            )
+    finally:
+        os.remove(path)
+    return total
+
+
+def clear_synthetic(connection):
+    """Hapus semua kontak sintetis (email @seed.example.com)."""
+    with database.untracked(connection) as cursor:
+        return cursor.execute("DELETE FROM contacts WHERE email LIKE %s", (f"%@{SEED_DOMAIN}",))
+
+
+def seed_contacts(size, seed=DEFAULT_SEED, method="insert", replace=False,
+                  database_name=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Tambahkan `size` kontak sintetis ke tabel contacts.
+    Mengembalikan dict berisi jumlah baris, durasi dan kecepatan.
+    """
+    database_name = database_name or database.active_database() or database.DEFAULT_DATABASE
+    connection = database.connect(database_name, local_infile=(method == "infile"))
+    try:
+        if replace:
+            clear_synthetic(connection)
+
+        start = time.perf_counter()
+        rows = generate_contacts(size, seed)
+        if method == "infile":
+            total = load_infile(connection, rows)
+        else:
+            total = insert_batches(connection, rows, batch_size)
+        seconds = time.perf_counter() - start
+    finally:
+        connection.close()
+
+    return {
+        "database": database_name,
+        "rows": total,
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(total / seconds) if seconds else None,
+    }
+
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed kontak sintetis ke tabel contacts DamnCRUD")
+    parser.add_argument("--rows", type=int, default=10000, help="jumlah kontak (default 10000)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="random seed (default 42)")
+    parser.add_argument("--method", choices=("insert", "infile"), default="insert",
+                        help="multi-row INSERT atau LOAD DATA LOCAL INFILE")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="baris per INSERT (method insert)")
+    parser.add_argument("--database", default=None, help="schema tujuan (default damncrud)")
+    parser.add_argument("--replace", action="store_true",
+                        help="hapus kontak sintetis lama sebelum seeding")
+    parser.add_argument("--clear", action="store_true",
+                        help="hanya hapus kontak sintetis, tanpa seeding")
+    args = parser.parse_args()
+
+    if args.clear:
+        connection = database.connect(args.database or database.DEFAULT_DATABASE)
+        try:
+            print(f"✓ {clear_synthetic(connection)} kontak sintetis dihapus")
+        finally:
+            connection.close()
+        return
+
+    result = seed_contacts(
+        args.rows, seed=args.seed, method=args.method, replace=args.replace,
+        database_name=args.database, batch_size=args.batch_size,
+    )
+    print(f"✓ {result['rows']} kontak dimuat ke {result['database']} "
+          f"dalam {result['seconds']}s ({result['rows_per_second']} rows/s, {args.method})")
+
+
+if __name__ == "__main__":
+    main()
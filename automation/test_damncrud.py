@@ -17,17 +17,21 @@ TEST CASES YANG DIAUTOMASI:
 =============================================================================
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoAlertPresentException
-import time
 import unittest
 
+import cdn_cache
+import database
+from browser import STARTUP_LOG, chrome_options, create_chrome, format_startup, resolve_profile
+from auth import drop_session, inject_login, login_via_ui
+from http_client import PASSWORD, USERNAME
+from pages import FORM_LOG, ContactForm, EmployeeTable, format_fills
+from waits import datatable_redraw, wait_for_datatable, wait_for_page_change
+
 
 class DamnCRUDTest(unittest.TestCase):
     """
@@ -38,22 +42,22 @@ class DamnCRUDTest(unittest.TestCase):
     # KONFIGURASI
     # =========================================================================
     BASE_URL = "http://localhost:81/DamnCRUD"  # Sesuaikan dengan port XAMPP Anda
-    USERNAME = "admin"
-    PASSWORD = "admin123"
+    
+    # Test yang menguji alur login lewat form UI (TC-028 memeriksa username
+    # yang login). Test lain login dengan inject cookie session (lebih cepat).
+    UI_LOGIN_TESTS = ("test_TC028_view_profile_page",)
     
     @classmethod
     def setUpClass(cls):
         """
         Setup yang dijalankan sekali sebelum semua test
         """
-        # Chrome Options
-        chrome_options = Options()
-        # chrome_options.add_argument("--headless")  # Uncomment untuk mode headless
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--disable-notifications")
+        # Profil debug (headed, maximized); CHROME_PROFILE / HEADLESS=1 untuk CI
+        profile = resolve_profile(default="debug")
         
         # Inisialisasi WebDriver
-        cls.driver = webdriver.Chrome(options=chrome_options)
+        cls.driver = create_chrome(chrome_options(profile), first_url=f"{cls.BASE_URL}/login.php", profile=profile,
+                                   setup=cdn_cache.install)
         cls.driver.implicitly_wait(10)
         cls.wait = WebDriverWait(cls.driver, 10)
         
@@ -63,13 +67,20 @@ class DamnCRUDTest(unittest.TestCase):
         Cleanup yang dijalankan sekali setelah semua test
         """
         cls.driver.quit()
+        for line in format_startup(STARTUP_LOG):
+            print(line)
+        for line in format_fills(FORM_LOG):
+            print(line)
     
     def setUp(self):
         """
         Setup yang dijalankan sebelum setiap test
         """
         # Login sebelum setiap test
-        self.login()
+        if self._testMethodName in self.UI_LOGIN_TESTS:
+            self.login()
+        else:
+            self.login_with_session()
     
     def tearDown(self):
         """
@@ -84,7 +95,7 @@ class DamnCRUDTest(unittest.TestCase):
     
     def login(self):
         """
-        Helper method untuk login ke sistem
+        Helper method untuk login ke sistem lewat form UI
         
         LANGKAH-LANGKAH:
         1. Buka halaman login
@@ -93,33 +104,22 @@ class DamnCRUDTest(unittest.TestCase):
         4. Klik tombol login
         5. Verifikasi redirect ke dashboard
         """
-        self.driver.get(f"{self.BASE_URL}/login.php")
-        
-        # Input username
-        username_field = self.driver.find_element(By.ID, "inputUsername")
-        username_field.clear()
-        username_field.send_keys(self.USERNAME)
-        
-        # Input password
-        password_field = self.driver.find_element(By.ID, "inputPassword")
-        password_field.clear()
-        password_field.send_keys(self.PASSWORD)
-        
-        # Klik tombol login
-        login_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-        login_button.click()
+        login_via_ui(self.driver, self.BASE_URL, USERNAME, PASSWORD)
+    
+    def login_with_session(self):
+        """
+        Helper method untuk login dengan inject cookie PHPSESSID
         
-        # Tunggu sampai redirect ke dashboard
-        self.wait.until(EC.url_contains("index.php"))
+        Login HTTP ke login.php hanya dilakukan sekali, session id
+        di-cache dan dipakai ulang oleh test berikutnya.
+        """
+        inject_login(self.driver, self.BASE_URL, USERNAME, PASSWORD)
     
     def logout(self):
         """
-        Helper method untuk logout dari sistem
+        Helper method untuk logout dari sistem (hapus cookie session)
         """
-        try:
-            self.driver.get(f"{self.BASE_URL}/logout.php")
-        except:
-            pass
+        drop_session(self.driver)
     
     # =========================================================================
     # TEST CASE TC-013: CREATE CONTACT DENGAN DATA VALID
@@ -180,29 +180,10 @@ class DamnCRUDTest(unittest.TestCase):
             "title": "QA Engineer"
         }
         
-        # Input Name
-        name_field = self.driver.find_element(By.ID, "name")
-        name_field.clear()
-        name_field.send_keys(test_data["name"])
-        print(f"   ✓ Name diisi: {test_data['name']}")
-        
-        # Input Email
-        email_field = self.driver.find_element(By.ID, "email")
-        email_field.clear()
-        email_field.send_keys(test_data["email"])
-        print(f"   ✓ Email diisi: {test_data['email']}")
-        
-        # Input Phone
-        phone_field = self.driver.find_element(By.ID, "phone")
-        phone_field.clear()
-        phone_field.send_keys(test_data["phone"])
-        print(f"   ✓ Phone diisi: {test_data['phone']}")
-        
-        # Input Title
-        title_field = self.driver.find_element(By.ID, "title")
-        title_field.clear()
-        title_field.send_keys(test_data["title"])
-        print(f"   ✓ Title diisi: {test_data['title']}")
+        # Diketik per keystroke seperti user (test ini menjaga jalur input asli)
+        ContactForm(self.driver).fill(test_data, realistic_typing=True)
+        for field, value in test_data.items():
+            print(f"   ✓ {field.capitalize()} diisi: {value}")
         
         # Step 3: Submit form
         print("\nStep 3: Submit form")
@@ -219,9 +200,9 @@ class DamnCRUDTest(unittest.TestCase):
         print("   ✓ Redirect ke dashboard berhasil")
         
         # Verifikasi data muncul di tabel
-        time.sleep(1)  # Tunggu DataTables load
-        page_source = self.driver.page_source
-        self.assertIn(test_data["name"], page_source)
+        wait_for_datatable(self.driver)  # Tunggu DataTables load
+        table = EmployeeTable(self.driver).read(scope="filtered")
+        self.assertIsNotNone(table.find(name=test_data["name"]))
         print(f"   ✓ Data '{test_data['name']}' muncul di tabel")
         
         print("\n" + "-"*70)
@@ -295,23 +276,16 @@ class DamnCRUDTest(unittest.TestCase):
             "email": "updated@example.com"
         }
         
-        # Update Name
-        name_field = self.driver.find_element(By.ID, "name")
-        name_field.clear()
-        name_field.send_keys(update_data["name"])
+        # Name dan Email diisi sekaligus dalam satu execute_script
+        form = ContactForm(self.driver)
+        form.fill(update_data)
         print(f"   ✓ Name diubah menjadi: {update_data['name']}")
-        
-        # Update Email
-        email_field = self.driver.find_element(By.ID, "email")
-        email_field.clear()
-        email_field.send_keys(update_data["email"])
         print(f"   ✓ Email diubah menjadi: {update_data['email']}")
         
         # Step 4: Submit form
         print("\nStep 4: Submit form update")
-        update_button = self.driver.find_element(By.CSS_SELECTOR, "input[type='submit']")
-        update_button.click()
-        print("   ✓ Tombol Update diklik")
+        form.submit()
+        print("   ✓ Form Update di-submit")
         
         # Step 5: Verifikasi hasil
         print("\nStep 5: Verifikasi hasil")
@@ -322,9 +296,9 @@ class DamnCRUDTest(unittest.TestCase):
         print("   ✓ Redirect ke dashboard berhasil")
         
         # Verifikasi perubahan data
-        time.sleep(1)
-        page_source = self.driver.page_source
-        self.assertIn(update_data["name"], page_source)
+        wait_for_datatable(self.driver)
+        table = EmployeeTable(self.driver).read(scope="filtered")
+        self.assertIsNotNone(table.find(name=update_data["name"]))
         print(f"   ✓ Data '{update_data['name']}' terlihat di tabel")
         
         print("\n" + "-"*70)
@@ -355,8 +329,8 @@ class DamnCRUDTest(unittest.TestCase):
                 - Klik "OK" pada alert konfirmasi
         
         Step 4: Verifikasi hasil
-                - Verifikasi kontak terhapus dari tabel
-                - Verifikasi jumlah kontak berkurang
+                - Verifikasi id kontak tidak ada lagi di tabel
+                - Verifikasi jumlah kontak berkurang (hanya jika DB_ISOLATION=1)
         -----------------------------------------------------------------------
         
         EXPECTED RESULT:
@@ -371,11 +345,11 @@ class DamnCRUDTest(unittest.TestCase):
         # Step 1: Navigasi ke dashboard & hitung kontak
         print("\nStep 1: Navigasi ke dashboard")
         self.driver.get(f"{self.BASE_URL}/index.php")
-        self.wait.until(EC.presence_of_element_located((By.ID, "employee")))
+        wait_for_datatable(self.driver)
         
         # Hitung jumlah kontak sebelum delete
-        delete_buttons_before = self.driver.find_elements(By.LINK_TEXT, "delete")
-        count_before = len(delete_buttons_before)
+        table_before = EmployeeTable(self.driver).read()
+        count_before = table_before.total
         print(f"   ✓ Jumlah kontak sebelum delete: {count_before}")
         
         self.assertTrue(count_before > 0, "Tidak ada kontak untuk dihapus")
@@ -383,13 +357,13 @@ class DamnCRUDTest(unittest.TestCase):
         # Step 2: Klik tombol Delete
         print("\nStep 2: Klik tombol Delete pada kontak")
         
-        # Ambil nama kontak yang akan dihapus (dari baris pertama)
-        first_row = self.driver.find_element(By.CSS_SELECTOR, "#employee tbody tr:first-child")
-        contact_name = first_row.find_element(By.CSS_SELECTOR, "td:nth-child(2)").text
-        print(f"   ✓ Kontak yang akan dihapus: {contact_name}")
+        # Ambil id & nama kontak yang akan dihapus (dari baris pertama)
+        deleted = table_before.rows[0]
+        contact_name = deleted["name"]
+        print(f"   ✓ Kontak yang akan dihapus: #{deleted['id']} {contact_name}")
         
         # Klik tombol delete
-        delete_button = first_row.find_element(By.LINK_TEXT, "delete")
+        delete_button = self.driver.find_element(By.CSS_SELECTOR, "#employee tbody tr:first-child a.btn-danger")
         delete_button.click()
         print("   ✓ Tombol Delete diklik")
         
@@ -409,18 +383,22 @@ class DamnCRUDTest(unittest.TestCase):
         print("\nStep 4: Verifikasi hasil")
         
         # Tunggu redirect dan refresh
-        time.sleep(2)
+        wait_for_page_change(self.driver, delete_button)
         self.driver.get(f"{self.BASE_URL}/index.php")
-        self.wait.until(EC.presence_of_element_located((By.ID, "employee")))
+        wait_for_datatable(self.driver)
         
-        # Hitung jumlah kontak setelah delete
-        delete_buttons_after = self.driver.find_elements(By.LINK_TEXT, "delete")
-        count_after = len(delete_buttons_after)
-        print(f"   ✓ Jumlah kontak setelah delete: {count_after}")
+        # Verifikasi kontak dengan id tersebut tidak ada di seluruh tabel
+        table_after = EmployeeTable(self.driver).read(scope="filtered")
+        self.assertIsNone(table_after.find(id=deleted["id"]),
+                          f"Kontak #{deleted['id']} '{contact_name}' masih ada setelah delete")
+        print(f"   ✓ Kontak #{deleted['id']} tidak ada lagi di tabel")
         
-        # Verifikasi jumlah berkurang
-        self.assertEqual(count_after, count_before - 1, "Jumlah kontak tidak berkurang")
-        print("   ✓ Jumlah kontak berkurang 1")
+        # Jumlah total hanya pasti jika schema tidak dipakai worker lain
+        count_after = table_after.total
+        print(f"   ✓ Jumlah kontak setelah delete: {count_after}")
+        if database.isolation_enabled():
+            self.assertEqual(count_after, count_before - 1, "Jumlah kontak tidak berkurang")
+            print("   ✓ Jumlah kontak berkurang 1")
         
         print("\n" + "-"*70)
         print("HASIL: TEST CASE TC-024 - PASSED ✓")
@@ -466,12 +444,12 @@ class DamnCRUDTest(unittest.TestCase):
         # Step 1: Navigasi ke dashboard
         print("\nStep 1: Navigasi ke dashboard")
         self.driver.get(f"{self.BASE_URL}/index.php")
-        self.wait.until(EC.presence_of_element_located((By.ID, "employee")))
+        wait_for_datatable(self.driver)
         print("   ✓ Dashboard berhasil dibuka")
         
         # Hitung total data sebelum search
-        rows_before = self.driver.find_elements(By.CSS_SELECTOR, "#employee tbody tr")
-        count_before = len(rows_before)
+        table = EmployeeTable(self.driver)
+        count_before = table.info()["total"]
         print(f"   ✓ Total data sebelum search: {count_before}")
         
         # Step 2: Lakukan pencarian
@@ -480,40 +458,39 @@ class DamnCRUDTest(unittest.TestCase):
         
         # Cari search box DataTables
         search_box = self.driver.find_element(By.CSS_SELECTOR, "#employee_filter input")
-        search_box.clear()
-        search_box.send_keys(search_keyword)
-        print(f"   ✓ Keyword '{search_keyword}' dimasukkan ke search box")
         
-        # Tunggu filter bekerja
-        time.sleep(1)
+        # Tunggu filter bekerja (redraw DataTables dengan keyword ini)
+        with datatable_redraw(self.driver, search=search_keyword):
+            search_box.clear()
+            search_box.send_keys(search_keyword)
+        print(f"   ✓ Keyword '{search_keyword}' dimasukkan ke search box")
         
         # Step 3: Verifikasi hasil pencarian
         print("\nStep 3: Verifikasi hasil pencarian")
         
         # Hitung data setelah search
-        rows_after = self.driver.find_elements(By.CSS_SELECTOR, "#employee tbody tr")
+        filtered = table.read(scope="filtered")
         
         # Verifikasi setiap baris mengandung keyword
-        for row in rows_after:
-            row_text = row.text.lower()
-            if "no matching records" not in row_text:
-                self.assertIn(search_keyword.lower(), row_text, 
-                             f"Baris tidak mengandung keyword: {row_text}")
+        for row in filtered.rows:
+            row_text = row["text"].lower()
+            self.assertIn(search_keyword.lower(), row_text, 
+                         f"Baris tidak mengandung keyword: {row_text}")
         
-        count_after = len(rows_after)
+        count_after = filtered.filtered
         print(f"   ✓ Jumlah data setelah filter: {count_after}")
         print(f"   ✓ Semua data yang ditampilkan mengandung '{search_keyword}'")
         
         # Step 4: Clear pencarian
         print("\nStep 4: Clear pencarian")
-        search_box.clear()
-        search_box.send_keys(Keys.RETURN)
-        time.sleep(1)
+        with datatable_redraw(self.driver, search=""):
+            search_box.clear()
+            search_box.send_keys(Keys.RETURN)
         
         # Verifikasi semua data muncul kembali
-        rows_cleared = self.driver.find_elements(By.CSS_SELECTOR, "#employee tbody tr")
-        count_cleared = len(rows_cleared)
+        count_cleared = table.info()["filtered"]
         print(f"   ✓ Jumlah data setelah clear: {count_cleared}")
+        self.assertEqual(count_cleared, count_before, "Data tidak kembali utuh setelah clear")
         
         print("\n" + "-"*70)
         print("HASIL: TEST CASE TC-010 - PASSED ✓")
@@ -573,7 +550,7 @@ class DamnCRUDTest(unittest.TestCase):
         # Verifikasi username ditampilkan
         username_field = self.driver.find_element(By.ID, "username")
         username_value = username_field.get_attribute("value")
-        self.assertEqual(username_value, self.USERNAME)
+        self.assertEqual(username_value, USERNAME)
         print(f"   ✓ Username '{username_value}' ditampilkan")
         
         # Verifikasi foto profil
@@ -0,0 +1,216 @@
+"""
+=============================================================================
+HTTP TEST TIER - DamnCRUD Application (tanpa browser)
+=============================================================================
+Framework       : Pytest + requests
+Parallel Run    : pytest-xdist
+
+Test perilaku server-side lewat HTTP saja (tanpa Selenium), sehingga
+regresi pada endpoint PHP terdeteksi dalam hitungan milidetik sebelum
+browser dijalankan.
+
+ENDPOINT YANG DIUJI:
+- login.php, index.php, create.php, update.php, delete.php, profil.php
+
+CARA MENJALANKAN:
+- HTTP tier saja : pytest -m http -v
+- Parallel       : pytest test_http.py -n auto -v
+=============================================================================
+"""
+
+import os
+import time
+
+import pytest
+
+from http_client import PASSWORD, USERNAME, WRONG_CREDENTIALS, DamnCRUDClient, redirect_target
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:81/DamnCRUD")
+
+pytestmark = pytest.mark.http
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def http_client():
+    """
+    Fixture client HTTP yang sudah login, satu per worker pytest-xdist.
+    Koneksi di-pool (keep-alive) sehingga setiap request sangat murah.
+    """
+    client = DamnCRUDClient(BASE_URL)
+    response = client.login(USERNAME, PASSWORD)
+    assert redirect_target(response) == "index.php", "Login HTTP gagal"
+
+    yield client
+
+    client.close()
+
+
+@pytest.fixture
+def anonymous_client():
+    """Fixture client HTTP tanpa session login."""
+    client = DamnCRUDClient(BASE_URL)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def new_contact(http_client):
+    """
+    Fixture yang membuat kontak unik lewat create.php dan mengembalikan
+    datanya beserta id. Kontak dihapus setelah test jika masih ada.
+    """
+    unique_id = f"{os.getpid()}{time.time_ns()}"[-10:]
+    data = {
+        "name": f"HTTP User {unique_id}",
+        "email": f"http{unique_id}@example.com",
+        "phone": f"0813{unique_id[-6:]}",
+        "title": "HTTP Tier",
+    }
+    http_client.create(**data)
+
+    _, contacts = http_client.index()
+    matches = [c for c in contacts if c["name"] == data["name"]]
+    assert matches, f"Kontak '{data['name']}' gagal dibuat"
+    data["id"] = matches[-1]["id"]
+
+    yield data
+
+    http_client.delete(data["id"])
+
+
+# =============================================================================
+# TEST CLASS
+# =============================================================================
+
+@pytest.mark.parallel
+class TestDamnCRUDHttp:
+    """
+    Test endpoint DamnCRUD lewat HTTP (tanpa browser).
+    """
+
+    # =========================================================================
+    # LOGIN
+    # =========================================================================
+    def test_HTTP_login_valid_credentials_redirects_to_index(self, anonymous_client):
+        """login.php dengan kredensial valid me-redirect ke index.php"""
+        response = anonymous_client.login(USERNAME, PASSWORD)
+
+        assert redirect_target(response) == "index.php", \
+            f"Login tidak redirect ke index.php: {response.headers.get('Location')}"
+        assert anonymous_client.session_id, "Cookie PHPSESSID tidak diset"
+
+    def test_HTTP_login_wrong_credentials_shows_error(self, anonymous_client):
+        """login.php dengan password salah menampilkan pesan error"""
+        response = anonymous_client.login(USERNAME, "wrong-password")
+
+        assert redirect_target(response) is None, "Login dengan password salah tidak boleh redirect"
+        assert WRONG_CREDENTIALS in response.text, "Pesan kredensial salah tidak muncul"
+
+    # =========================================================================
+    # INDEX
+    # =========================================================================
+    def test_HTTP_index_requires_login(self, anonymous_client):
+        """index.php tanpa session me-redirect ke login.php"""
+        response = anonymous_client.get("index.php")
+
+        assert redirect_target(response) == "login.php"
+
+    def test_HTTP_index_renders_contacts_table(self, http_client):
+        """index.php menampilkan tabel #employee berisi kontak"""
+        response, contacts = http_client.index()
+
+        assert response.status_code == 200
+        assert "Howdy, damn" in response.text, "Dashboard tidak tampil dengan benar"
+        assert contacts, "Tabel #employee kosong"
+        assert all(contact["id"].isdigit() for contact in contacts), "Kolom # bukan id numerik"
+
+    # =========================================================================
+    # CREATE
+    # =========================================================================
+    @pytest.mark.create
+    def test_HTTP_create_inserts_row_and_redirects(self, http_client):
+        """POST create.php menyimpan kontak dan me-redirect ke index.php"""
+        unique_id = f"{os.getpid()}{time.time_ns()}"[-10:]
+        name = f"HTTP Create {unique_id}"
+
+        response = http_client.create(name, f"create{unique_id}@example.com", "081200000000", "QA")
+        assert redirect_target(response) == "index.php", "create.php tidak redirect ke index.php"
+
+        _, contacts = http_client.index()
+        created = [c for c in contacts if c["name"] == name]
+        assert len(created) == 1, f"Kontak '{name}' tidak muncul tepat sekali di tabel"
+
+        http_client.delete(created[0]["id"])
+
+    # =========================================================================
+    # UPDATE
+    # =========================================================================
+    @pytest.mark.update
+    def test_HTTP_update_form_prefilled(self, http_client, new_contact):
+        """update.php?id=N menampilkan form berisi data kontak"""
+        response, values = http_client.contact_form(new_contact["id"])
+
+        assert response.status_code == 200
+        assert values["name"] == new_contact["name"]
+        assert values["email"] == new_contact["email"]
+        assert values["title"] == new_contact["title"]
+
+    @pytest.mark.update
+    def test_HTTP_update_changes_row(self, http_client, new_contact):
+        """POST update.php?id=N mengubah data kontak dan me-redirect ke index.php"""
+        new_name = f"{new_contact['name']} Updated"
+
+        response = http_client.update(
+            new_contact["id"], new_name, new_contact["email"], new_contact["phone"], "Updated"
+        )
+        assert redirect_target(response) == "index.php", "update.php tidak redirect ke index.php"
+
+        _, values = http_client.contact_form(new_contact["id"])
+        assert values["name"] == new_name
+        assert values["title"] == "Updated"
+
+    def test_HTTP_update_without_id(self, http_client):
+        """update.php tanpa parameter id menampilkan pesan error"""
+        response = http_client.get("update.php")
+
+        assert "No ID specified!" in response.text
+
+    # =========================================================================
+    # DELETE
+    # =========================================================================
+    @pytest.mark.delete
+    def test_HTTP_delete_removes_row(self, http_client, new_contact):
+        """delete.php?id=N menghapus kontak dan me-redirect ke index.php"""
+        response = http_client.delete(new_contact["id"])
+        assert redirect_target(response) == "index.php", "delete.php tidak redirect ke index.php"
+
+        _, contacts = http_client.index()
+        assert new_contact["id"] not in [c["id"] for c in contacts], \
+            f"Kontak id={new_contact['id']} masih ada setelah delete"
+
+    @pytest.mark.delete
+    def test_HTTP_delete_requires_login(self, anonymous_client):
+        """delete.php tanpa session me-redirect ke login.php"""
+        response = anonymous_client.delete(1)
+
+        assert redirect_target(response) == "login.php"
+
+    # =========================================================================
+    # PROFILE
+    # =========================================================================
+    @pytest.mark.profile
+    def test_HTTP_profile_shows_username(self, http_client):
+        """profil.php menampilkan username yang sedang login"""
+        response, values = http_client.profile()
+
+        assert response.status_code == 200
+        assert values.get("username") == USERNAME
+        assert 'type="file"' in response.text, "Form upload tidak ada"
@@ -0,0 +1,128 @@
+"""
+=============================================================================
+PAGE BUDGET TEST - Page Weight & Request Count DamnCRUD
+=============================================================================
+Framework       : Pytest + Selenium WebDriver (CDP Network events)
+Parallel Run    : pytest-xdist
+
+Setiap halaman direkam dengan network_recorder.py (jumlah request, total
+bytes, ukuran HTML, resource terbesar) lalu dibandingkan dengan budget.
+Tabel contacts di index.php tidak dipaginasi di server, sehingga
+pertumbuhan payload langsung terlihat sebagai test yang gagal.
+
+HAR setiap test disimpan ke folder har/.
+
+BUDGET (environment variable):
+- BUDGET_INDEX_HTML_KB : HTML index.php dengan 1k kontak (default 1024)
+- BUDGET_MAX_REQUESTS  : request per halaman (default 12)
+- BUDGET_PAGE_TOTAL_KB : total transfer per halaman (default 1024)
+
+CARA MENJALANKAN:
+- Budget saja : pytest test_page_budgets.py -m budget -v
+- Parallel    : pytest test_page_budgets.py -n auto -v
+=============================================================================
+"""
+
+import os
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from auth import inject_login
+from http_client import PASSWORD, USERNAME
+from network_recorder import NetworkRecorder, assert_budget, export_har
+from test_pytest import create_driver
+from waits import wait_for_datatable
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:81/DamnCRUD")
+
+INDEX_HTML_KB = float(os.environ.get("BUDGET_INDEX_HTML_KB", "1024"))
+MAX_REQUESTS = int(os.environ.get("BUDGET_MAX_REQUESTS", "12"))
+PAGE_TOTAL_KB = float(os.environ.get("BUDGET_PAGE_TOTAL_KB", "1024"))
+
+HAR_DIR = "har"
+
+pytestmark = pytest.mark.budget
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def recording_driver():
+    """
+    Fixture driver khusus dengan performance log aktif (tidak diambil dari
+    browser pool, karena log harus diaktifkan saat Chrome diluncurkan).
+    """
+    # Profil faithful: page weight harus termasuk gambar seperti di browser user
+    driver = create_driver(performance_log=True, profile="faithful")
+    inject_login(driver, BASE_URL, USERNAME, PASSWORD)
+
+    yield driver
+
+    driver.quit()
+
+
+@pytest.fixture
+def recorder(recording_driver, request):
+    """
+    Fixture NetworkRecorder. Semua halaman yang direkam test diekspor
+    ke har/<nama_test>.har setelah test selesai.
+    """
+    recorder = NetworkRecorder(recording_driver)
+
+    yield recorder
+
+    if recorder.pages:
+        path = export_har(recorder.pages, f"{HAR_DIR}/{request.node.name}.har")
+        for page in recorder.pages:
+            summary = page.summary()
+            print(f"\n{summary['page']}: {summary['requests']} requests, "
+                  f"{summary['total_bytes'] / 1024:.1f} KB total, "
+                  f"HTML {summary['html_bytes'] / 1024:.1f} KB -> {path}")
+
+
+# =============================================================================
+# TEST CLASS
+# =============================================================================
+
+@pytest.mark.parallel
+class TestDamnCRUDPageBudgets:
+    """
+    Budget ukuran dan jumlah request per halaman.
+    """
+
+    @pytest.mark.parametrize("contacts_dataset", [1000], indirect=True)
+    def test_BUDGET_index_with_1k_contacts(self, recording_driver, recorder, contacts_dataset):
+        """index.php dengan 1k kontak tetap di bawah budget HTML dan request"""
+        with recorder.capture("index.php") as page:
+            recording_driver.get(f"{BASE_URL}/index.php")
+            wait_for_datatable(recording_driver)
+
+        assert page.document is not None, "Dokumen index.php tidak terekam"
+        assert_budget(page, max_html_kb=INDEX_HTML_KB, max_requests=MAX_REQUESTS)
+
+    @pytest.mark.parametrize("path", ["create.php", "profil.php", "vpage.php"])
+    def test_BUDGET_static_pages(self, recording_driver, recorder, path):
+        """create.php, profil.php dan vpage.php tetap di bawah budget"""
+        with recorder.capture(path) as page:
+            recording_driver.get(f"{BASE_URL}/{path}")
+
+        assert page.document is not None, f"Dokumen {path} tidak terekam"
+        assert_budget(page, max_requests=MAX_REQUESTS, max_total_kb=PAGE_TOTAL_KB)
+
+    def test_BUDGET_update_page(self, recording_driver, recorder):
+        """update.php untuk kontak pertama tetap di bawah budget"""
+        recording_driver.get(f"{BASE_URL}/index.php")
+        edit_link = recording_driver.find_element(By.LINK_TEXT, "edit").get_attribute("href")
+
+        with recorder.capture("update.php") as page:
+            recording_driver.get(edit_link)
+
+        assert page.document is not None, "Dokumen update.php tidak terekam"
+        assert_budget(page, max_requests=MAX_REQUESTS, max_total_kb=PAGE_TOTAL_KB)
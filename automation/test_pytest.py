@@ -23,15 +23,24 @@ CARA MENJALANKAN:
 import pytest
 import os
 import time
-from selenium import webdriver
+from contextlib import nullcontext
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoAlertPresentException
 
+from auth import drop_session, inject_login, login_via_ui
+import cdn_cache
+import database
+from browser import chrome_options, create_chrome, resolve_profile
+from browser_pool import BrowserPool
+from http_client import PASSWORD, USERNAME
+from network_recorder import enable_performance_log
+from page_metrics import wrap_driver
+from pages import ContactForm, EmployeeTable
+from waits import datatable_redraw, wait_for_datatable, wait_for_page_change
+
 
 # =============================================================================
 # CONFIGURATION
@@ -39,72 +48,196 @@ from selenium.common.exceptions import TimeoutException, NoAlertPresentException
 # Default: localhost:81/DamnCRUD untuk XAMPP lokal
 # CI: http://localhost:8080 (dari environment variable)
 BASE_URL = os.environ.get("BASE_URL", "http://localhost:81/DamnCRUD")
-USERNAME = "admin"
-PASSWORD = "nimda666!"
+DEFAULT_PROFILE = "fast"  # profil launch Chrome (browser.PROFILES), CHROME_PROFILE untuk mengganti
 
 
 # =============================================================================
 # FIXTURES
 # =============================================================================
 
-@pytest.fixture(scope="function")
-def driver():
-    """
-    Fixture untuk membuat WebDriver instance per test function.
-    Setiap test akan mendapat browser instance sendiri untuk parallel execution.
+def create_driver(performance_log=False, profile=None):
     """
-    chrome_options = Options()
+    Membuat WebDriver Chrome baru dengan profil launch dari browser.py
+    (default fast: headless tanpa gambar; CHROME_PROFILE untuk mengganti).
+    Dipanggil oleh browser pool hanya saat pool butuh browser baru.
     
-    # Headless mode untuk CI/CD
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--disable-notifications")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--disable-infobars")
+    performance_log=True mengaktifkan event CDP Network untuk
+    network_recorder.py (dipakai test_page_budgets.py).
+    """
+    profile = resolve_profile(profile, default=DEFAULT_PROFILE)
+    options = chrome_options(profile)
+    if performance_log:
+        enable_performance_log(options)
     
-    # Inisialisasi driver
-    driver = webdriver.Chrome(options=chrome_options)
+    # Inisialisasi driver (first load login.php ikut diukur di laporan startup);
+    # asset CDN (Bootstrap, jQuery, DataTables) dilayani dari cache lokal
+    # sejak halaman pertama
+    driver = create_chrome(options, first_url=f"{BASE_URL}/login.php", profile=profile,
+                           setup=cdn_cache.install)
     driver.implicitly_wait(10)
+    return driver
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request):
+    """
+    Fixture pool browser per worker pytest-xdist.
+    Setiap worker adalah proses terpisah, sehingga scope session = scope worker.
+    """
+    pool = BrowserPool(create_driver, base_url=BASE_URL)
+    request.config._suite_stats["browser_pool"] = pool.stats
+    
+    yield pool
+    
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def profile_pools(browser_pool):
+    """
+    Pool tambahan per profil launch untuk test bertanda chrome_profile,
+    dibuat saat pertama dibutuhkan. Statistiknya digabung dengan browser_pool.
+    """
+    pools = {}
+    
+    yield pools
+    
+    for pool in pools.values():
+        pool.close()
+
+
+@pytest.fixture(scope="function")
+def driver(browser_pool, request):
+    """
+    Fixture untuk WebDriver instance per test function.
+    Browser diambil dari pool worker dan di-reset setelah test selesai,
+    sehingga setiap test tetap terisolasi tanpa meluncurkan Chrome baru.
+    
+    Test bertanda chrome_profile("faithful") memakai browser dengan profil
+    tersebut (mis. test yang butuh gambar dimuat) dari pool tersendiri.
+    
+    Driver dibungkus PageMetricsListener (page_metrics.py) sehingga
+    Navigation Timing setiap halaman tercatat dan dilampirkan ke report.
+    """
+    pool = browser_pool
+    marker = request.node.get_closest_marker("chrome_profile")
+    if marker:
+        profile = marker.args[0]
+        pools = request.getfixturevalue("profile_pools")
+        if profile not in pools:
+            pools[profile] = BrowserPool(lambda: create_driver(profile=profile), base_url=BASE_URL,
+                                         stats=browser_pool.stats)
+        pool = pools[profile]
+    
+    raw_driver = pool.acquire()
+    driver, listener = wrap_driver(raw_driver)
+    request.node.page_metrics = (raw_driver, listener)
     
     yield driver
     
-    # Cleanup
-    driver.quit()
+    # Cleanup: reset state dan kembalikan ke pool
+    pool.release(raw_driver)
 
 
 @pytest.fixture(scope="function")
-def logged_in_driver(driver):
+def logged_in_driver(driver, request):
     """
     Fixture untuk driver yang sudah login.
     Digunakan oleh test yang membutuhkan autentikasi.
-    """
-    # Login
-    driver.get(f"{BASE_URL}/login.php")
     
-    username_field = driver.find_element(By.ID, "inputUsername")
-    username_field.clear()
-    username_field.send_keys(USERNAME)
+    Secara default login dilakukan dengan inject cookie PHPSESSID hasil
+    login HTTP (sekali per worker). Test dengan marker `ui_login` tetap
+    login lewat form login.php.
     
-    password_field = driver.find_element(By.ID, "inputPassword")
-    password_field.clear()
-    password_field.send_keys(PASSWORD)
-    
-    login_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-    login_button.click()
+    Pada test bertanda `benchmark`, durasi login dicatat sebagai fase "login".
+    """
+    timer = nullcontext()
+    if request.node.get_closest_marker("benchmark"):
+        timer = request.getfixturevalue("benchmark").phase("login")
     
-    # Tunggu redirect ke dashboard
-    WebDriverWait(driver, 10).until(EC.url_contains("index.php"))
+    # Login
+    with timer:
+        if request.node.get_closest_marker("ui_login"):
+            login_via_ui(driver, BASE_URL, USERNAME, PASSWORD)
+        else:
+            inject_login(driver, BASE_URL, USERNAME, PASSWORD)
     
     yield driver
     
-    # Logout setelah test
-    try:
-        driver.get(f"{BASE_URL}/logout.php")
-    except:
-        pass
+    # Logout setelah test: cukup hapus cookie session
+    drop_session(driver)
+
+
+# =============================================================================
+# STEP HELPERS
+# =============================================================================
+# Langkah UI yang dipakai bersama oleh test di bawah dan journey_replay.py,
+# sehingga angka load test berbasis browser memakai alur yang sama persis.
+
+def unique_id():
+    """6 digit terakhir timestamp ms, untuk data unik saat test paralel."""
+    return str(int(time.time() * 1000))[-6:]
+
+
+def load_dashboard(driver, datatable=True):
+    """Buka index.php dan tunggu tabel (DataTables siap jika datatable=True)."""
+    driver.get(f"{BASE_URL}/index.php")
+    if datatable:
+        wait_for_datatable(driver)
+    else:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.ID, "employee"))
+        )
+
+
+def open_create_form(driver):
+    """Klik 'Add New Contact' dan tunggu create.php."""
+    driver.find_element(By.LINK_TEXT, "Add New Contact").click()
+    WebDriverWait(driver, 10).until(EC.url_contains("create.php"))
+
+
+def open_first_edit(driver):
+    """Klik tombol edit pada baris pertama tabel dan tunggu update.php."""
+    edit_buttons = driver.find_elements(By.LINK_TEXT, "edit")
+    assert len(edit_buttons) > 0, "Tidak ada kontak untuk diedit"
+    edit_buttons[0].click()
+    WebDriverWait(driver, 10).until(EC.url_contains("update.php"))
+
+
+def fill_contact_form(driver, data, realistic_typing=False):
+    """
+    Isi field form kontak (id field = key data) dalam satu execute_script.
+    realistic_typing=True mengetik per keystroke (lihat pages.ContactForm).
+    """
+    ContactForm(driver).fill(data, realistic_typing=realistic_typing)
+
+
+def submit_contact_form(driver):
+    """Submit form Save/Update dan tunggu redirect ke index.php."""
+    ContactForm(driver).submit()
+    WebDriverWait(driver, 10).until(EC.url_contains("index.php"))
+
+
+def search_table(driver, keyword):
+    """Ketik keyword di search DataTables dan tunggu tabel selesai difilter."""
+    search_box = driver.find_element(By.CSS_SELECTOR, "#employee_filter input")
+    with datatable_redraw(driver, search=keyword):
+        search_box.clear()
+        search_box.send_keys(keyword)
+
+
+def clear_search(driver):
+    """Kosongkan search DataTables dan tunggu tabel kembali utuh."""
+    search_box = driver.find_element(By.CSS_SELECTOR, "#employee_filter input")
+    with datatable_redraw(driver, search=""):
+        search_box.clear()
+        search_box.send_keys(Keys.RETURN)
+
+
+def open_profile(driver):
+    """Klik menu 'Profil' dan tunggu profil.php."""
+    driver.find_element(By.LINK_TEXT, "Profil").click()
+    WebDriverWait(driver, 10).until(EC.url_contains("profil.php"))
 
 
 # =============================================================================
@@ -122,7 +255,8 @@ class TestDamnCRUD:
     # TC-013: CREATE CONTACT DENGAN DATA VALID
     # =========================================================================
     @pytest.mark.create
-    def test_TC013_create_contact_valid_data(self, logged_in_driver):
+    @pytest.mark.benchmark
+    def test_TC013_create_contact_valid_data(self, logged_in_driver, benchmark):
         """
         TC-013: Verifikasi penambahan kontak baru dengan data valid
         
@@ -136,52 +270,43 @@ class TestDamnCRUD:
         driver = logged_in_driver
         
         # Step 1: Navigasi ke halaman Create
-        create_link = driver.find_element(By.LINK_TEXT, "Add New Contact")
-        create_link.click()
-        
-        WebDriverWait(driver, 10).until(EC.url_contains("create.php"))
+        with benchmark.phase("open_create_form"):
+            open_create_form(driver)
         assert "create.php" in driver.current_url, "Halaman Create tidak terbuka"
         
         # Step 2: Input data kontak
         # Generate unique name untuk parallel testing
-        unique_id = str(int(time.time() * 1000))[-6:]
+        uid = unique_id()
         test_data = {
-            "name": f"Test User {unique_id}",
-            "email": f"test{unique_id}@example.com",
-            "phone": f"0812{unique_id}",
+            "name": f"Test User {uid}",
+            "email": f"test{uid}@example.com",
+            "phone": f"0812{uid}",
             "title": "QA Engineer"
         }
-        
-        driver.find_element(By.ID, "name").send_keys(test_data["name"])
-        driver.find_element(By.ID, "email").send_keys(test_data["email"])
-        driver.find_element(By.ID, "phone").send_keys(test_data["phone"])
-        driver.find_element(By.ID, "title").send_keys(test_data["title"])
+        fill_contact_form(driver, test_data)
         
         # Step 3: Klik Save
-        save_button = driver.find_element(By.CSS_SELECTOR, "input[type='submit']")
-        save_button.click()
+        with benchmark.phase("submit_create"):
+            submit_contact_form(driver)
+            wait_for_datatable(driver)
         
         # Step 4: Verifikasi redirect
-        WebDriverWait(driver, 10).until(EC.url_contains("index.php"))
         assert "index.php" in driver.current_url, "Tidak redirect ke dashboard"
         
         # Step 5: Verifikasi data muncul dengan search
-        time.sleep(1)
-        
         # Gunakan search DataTables untuk mencari data yang baru dibuat
-        search_box = driver.find_element(By.CSS_SELECTOR, "#employee_filter input")
-        search_box.clear()
-        search_box.send_keys(test_data["name"])
-        time.sleep(1)
+        with benchmark.phase("search"):
+            search_table(driver, test_data["name"])
         
-        page_source = driver.page_source
-        assert test_data["name"] in page_source, f"Data '{test_data['name']}' tidak muncul di tabel"
+        table = EmployeeTable(driver).read()
+        assert table.find(name=test_data["name"]), f"Data '{test_data['name']}' tidak muncul di tabel"
 
     # =========================================================================
     # TC-018: UPDATE CONTACT DENGAN DATA VALID
     # =========================================================================
     @pytest.mark.update
-    def test_TC018_update_contact_valid_data(self, logged_in_driver):
+    @pytest.mark.benchmark
+    def test_TC018_update_contact_valid_data(self, logged_in_driver, benchmark):
         """
         TC-018: Verifikasi update kontak dengan data valid
         
@@ -195,40 +320,27 @@ class TestDamnCRUD:
         driver = logged_in_driver
         
         # Step 1: Navigasi ke dashboard
-        driver.get(f"{BASE_URL}/index.php")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "employee"))
-        )
+        with benchmark.phase("load_dashboard"):
+            load_dashboard(driver, datatable=False)
         
         # Step 2: Klik Edit
-        edit_buttons = driver.find_elements(By.LINK_TEXT, "edit")
-        assert len(edit_buttons) > 0, "Tidak ada kontak untuk diedit"
-        edit_buttons[0].click()
-        
-        WebDriverWait(driver, 10).until(EC.url_contains("update.php"))
+        with benchmark.phase("open_update_form"):
+            open_first_edit(driver)
         assert "update.php" in driver.current_url, "Halaman Update tidak terbuka"
         
         # Step 3: Update data
-        unique_id = str(int(time.time() * 1000))[-6:]
+        uid = unique_id()
         update_data = {
-            "name": f"Updated Name {unique_id}",
-            "email": f"updated{unique_id}@example.com"
+            "name": f"Updated Name {uid}",
+            "email": f"updated{uid}@example.com"
         }
-        
-        name_field = driver.find_element(By.ID, "name")
-        name_field.clear()
-        name_field.send_keys(update_data["name"])
-        
-        email_field = driver.find_element(By.ID, "email")
-        email_field.clear()
-        email_field.send_keys(update_data["email"])
+        fill_contact_form(driver, update_data)
         
         # Step 4: Klik Update
-        update_button = driver.find_element(By.CSS_SELECTOR, "input[type='submit']")
-        update_button.click()
+        with benchmark.phase("submit_update"):
+            submit_contact_form(driver)
         
         # Step 5: Verifikasi redirect ke index.php (update berhasil)
-        WebDriverWait(driver, 10).until(EC.url_contains("index.php"))
         assert "index.php" in driver.current_url, "Tidak redirect ke dashboard setelah update"
         
         # Tunggu DataTables loaded
@@ -245,7 +357,8 @@ class TestDamnCRUD:
     # TC-024: DELETE CONTACT DENGAN KONFIRMASI OK
     # =========================================================================
     @pytest.mark.delete
-    def test_TC024_delete_contact_with_confirmation(self, logged_in_driver):
+    @pytest.mark.benchmark
+    def test_TC024_delete_contact_with_confirmation(self, logged_in_driver, benchmark):
         """
         TC-024: Verifikasi hapus kontak dengan konfirmasi OK
         
@@ -258,60 +371,53 @@ class TestDamnCRUD:
         driver = logged_in_driver
         
         # Step 1: Hitung kontak sebelum delete
-        driver.get(f"{BASE_URL}/index.php")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "employee"))
-        )
+        with benchmark.phase("load_dashboard"):
+            load_dashboard(driver)
         
-        delete_buttons_before = driver.find_elements(By.LINK_TEXT, "delete")
-        count_before = len(delete_buttons_before)
-        assert count_before > 0, "Tidak ada kontak untuk dihapus"
+        table_before = EmployeeTable(driver).read()
+        assert table_before.total > 0, "Tidak ada kontak untuk dihapus"
         
-        # Step 2: Ambil ID kontak pertama dan nama untuk verifikasi
-        first_row = driver.find_element(By.CSS_SELECTOR, "#employee tbody tr:first-child")
-        first_name = first_row.find_element(By.CSS_SELECTOR, "td:nth-child(2)").text
-        delete_button = first_row.find_element(By.LINK_TEXT, "delete")
+        # Step 2: Ambil id & nama kontak pertama untuk verifikasi
+        deleted = table_before.rows[0]
+        first_name = deleted["name"]
+        delete_button = driver.find_element(By.CSS_SELECTOR, "#employee tbody tr:first-child a.btn-danger")
         
         # Step 3: Klik delete dan handle alert
-        delete_button.click()
-        
-        # Accept JavaScript confirm dialog
-        try:
-            WebDriverWait(driver, 5).until(EC.alert_is_present())
-            alert = driver.switch_to.alert
-            alert.accept()
-        except TimeoutException:
-            pass
-        
-        # Step 4: Verifikasi - tunggu halaman reload dan cari nama yang dihapus
-        time.sleep(2)
-        driver.get(f"{BASE_URL}/index.php")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "employee"))
-        )
+        with benchmark.phase("submit_delete"):
+            delete_button.click()
+            
+            # Accept JavaScript confirm dialog
+            try:
+                WebDriverWait(driver, 5).until(EC.alert_is_present())
+                alert = driver.switch_to.alert
+                alert.accept()
+            except TimeoutException:
+                pass
+            
+            # Tunggu redirect delete.php selesai
+            wait_for_page_change(driver, delete_button)
+        
+        # Step 4: Verifikasi - reload dan cari nama yang dihapus
+        load_dashboard(driver)
         
         # Cari nama yang dihapus menggunakan search
-        search_box = driver.find_element(By.CSS_SELECTOR, "#employee_filter input")
-        search_box.clear()
-        search_box.send_keys(first_name)
-        time.sleep(1)
-        
-        # Verifikasi nama tidak ditemukan atau jumlah berkurang
-        page_source = driver.page_source
-        rows_after = driver.find_elements(By.CSS_SELECTOR, "#employee tbody tr")
-        
-        # Jika row berisi "No matching records" atau nama tidak ada, delete berhasil
-        no_records = "No matching records" in page_source
-        name_gone = first_name not in page_source
-        
-        assert no_records or name_gone, \
-            f"Kontak '{first_name}' masih ada setelah delete"
+        with benchmark.phase("search"):
+            search_table(driver, first_name)
+        
+        # Verifikasi kontak dengan id tersebut tidak ditemukan lagi
+        table_after = EmployeeTable(driver).read(scope="filtered")
+        assert table_after.find(id=deleted["id"]) is None, \
+            f"Kontak #{deleted['id']} '{first_name}' masih ada setelah delete"
+        # Jumlah total hanya pasti jika schema tidak dipakai worker lain
+        if database.isolation_enabled():
+            assert table_after.total == table_before.total - 1, "Jumlah kontak tidak berkurang"
 
     # =========================================================================
     # TC-010: SEARCH DATATABLES
     # =========================================================================
     @pytest.mark.search
-    def test_TC010_search_datatables(self, logged_in_driver):
+    @pytest.mark.benchmark
+    def test_TC010_search_datatables(self, logged_in_driver, benchmark):
         """
         TC-010: Verifikasi fitur search DataTables
         
@@ -324,46 +430,37 @@ class TestDamnCRUD:
         driver = logged_in_driver
         
         # Step 1: Navigasi ke dashboard
-        driver.get(f"{BASE_URL}/index.php")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "employee"))
-        )
+        with benchmark.phase("load_dashboard"):
+            load_dashboard(driver)
         
-        # Hitung total data
-        rows_before = driver.find_elements(By.CSS_SELECTOR, "#employee tbody tr")
-        count_before = len(rows_before)
+        table = EmployeeTable(driver)
         
         # Step 2: Input keyword
         search_keyword = "John"
-        search_box = driver.find_element(By.CSS_SELECTOR, "#employee_filter input")
-        search_box.clear()
-        search_box.send_keys(search_keyword)
-        
-        time.sleep(1)  # Tunggu filter
+        with benchmark.phase("search"):
+            search_table(driver, search_keyword)  # Tunggu filter
         
         # Step 3: Verifikasi hasil filter
-        rows_after = driver.find_elements(By.CSS_SELECTOR, "#employee tbody tr")
-        
-        for row in rows_after:
-            row_text = row.text.lower()
-            if "no matching records" not in row_text and row_text.strip():
-                assert search_keyword.lower() in row_text, \
-                    f"Baris tidak mengandung '{search_keyword}': {row_text}"
+        for row in table.rows():
+            assert search_keyword.lower() in row["text"].lower(), \
+                f"Baris tidak mengandung '{search_keyword}': {row['text']}"
         
         # Step 4: Clear search
-        search_box.clear()
-        search_box.send_keys(Keys.RETURN)
-        time.sleep(1)
+        with benchmark.phase("clear_search"):
+            clear_search(driver)
         
-        rows_cleared = driver.find_elements(By.CSS_SELECTOR, "#employee tbody tr")
-        # Data harus kembali (atau tetap ada)
-        assert len(rows_cleared) >= 0, "Error setelah clear search"
+        # Semua data harus kembali
+        info = table.info()
+        assert info["filtered"] == info["total"], "Data tidak kembali utuh setelah clear search"
 
     # =========================================================================
     # TC-028: VIEW PROFILE PAGE
     # =========================================================================
     @pytest.mark.profile
-    def test_TC028_view_profile_page(self, logged_in_driver):
+    @pytest.mark.benchmark
+    @pytest.mark.ui_login  # alur form login.php tetap teruji di browser
+    @pytest.mark.chrome_profile("faithful")  # profil fast memblokir gambar
+    def test_TC028_view_profile_page(self, logged_in_driver, benchmark):
         """
         TC-028: Verifikasi tampilan halaman profil
         
@@ -377,10 +474,8 @@ class TestDamnCRUD:
         driver = logged_in_driver
         
         # Step 1: Navigasi ke Profile
-        profile_link = driver.find_element(By.LINK_TEXT, "Profil")
-        profile_link.click()
-        
-        WebDriverWait(driver, 10).until(EC.url_contains("profil.php"))
+        with benchmark.phase("open_profile"):
+            open_profile(driver)
         assert "profil.php" in driver.current_url, "Halaman Profile tidak terbuka"
         
         # Step 2: Verifikasi judul
@@ -395,6 +490,8 @@ class TestDamnCRUD:
         
         # Step 4: Verifikasi foto profil
         profile_image = driver.find_element(By.CSS_SELECTOR, "img[src*='profile']")
+        assert profile_image.get_attribute("src").endswith("image/profile.jpg"), \
+            f"Sumber foto profil salah: {profile_image.get_attribute('src')}"
         assert profile_image.is_displayed(), "Foto profil tidak terlihat"
         
         # Step 5: Verifikasi form upload
@@ -423,6 +520,7 @@ class TestDamnCRUD:
 # pytest test_pytest.py -m search -v      # Hanya test search
 # pytest test_pytest.py -m profile -v     # Hanya test profile
 # pytest test_pytest.py -m parallel -v    # Semua test paralel
+# BENCHMARK=1 pytest test_pytest.py -m benchmark -v   # Timing fase + baseline
 
 
 # =============================================================================
@@ -3,40 +3,39 @@
 AUTOMATION TEST SCRIPT - DamnCRUD Application (Auto Driver Version)
 =============================================================================
 Versi ini menggunakan webdriver-manager untuk otomatis download ChromeDriver
+(sekali per versi Chrome, selanjutnya dari cache - lihat browser.py)
 Install: pip install selenium webdriver-manager
 =============================================================================
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+
+import cdn_cache
+from browser import STARTUP_LOG, chrome_options, create_chrome, format_startup, resolve_profile
+from http_client import PASSWORD, USERNAME
+from pages import FORM_LOG, ContactForm, EmployeeTable, format_fills
+from waits import datatable_redraw, wait_for_datatable, wait_for_page_change
 
 # =============================================================================
 # KONFIGURASI
 # =============================================================================
 BASE_URL = "http://localhost:81/DamnCRUD"  # Sesuaikan port jika berbeda
-USERNAME = "admin"
-PASSWORD = "admin123"
 
 # =============================================================================
 # SETUP DRIVER
 # =============================================================================
 def setup_driver():
-    """Setup Chrome driver dengan webdriver-manager"""
-    chrome_options = Options()
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--disable-notifications")
-    # chrome_options.add_argument("--headless")  # Uncomment untuk mode headless
-    
-    # Auto download & setup ChromeDriver
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    """Setup Chrome driver (ChromeDriver di-cache per versi Chrome, lihat browser.py)"""
+    # Profil debug (headed, maximized); CHROME_PROFILE / HEADLESS=1 untuk CI
+    profile = resolve_profile(default="debug")
+    
+    # ChromeDriver dari cache; webdriver-manager hanya dipakai jika belum ada
+    # Asset CDN dari automation/assets/cdn sejak halaman pertama
+    driver = create_chrome(chrome_options(profile), first_url=f"{BASE_URL}/login.php", profile=profile,
+                           setup=cdn_cache.install)
     driver.implicitly_wait(10)
     return driver
 
@@ -81,19 +80,18 @@ def test_create_contact(driver):
         "title": "Automation Tester"
     }
     
-    driver.find_element(By.ID, "name").send_keys(test_data["name"])
-    driver.find_element(By.ID, "email").send_keys(test_data["email"])
-    driver.find_element(By.ID, "phone").send_keys(test_data["phone"])
-    driver.find_element(By.ID, "title").send_keys(test_data["title"])
+    form = ContactForm(driver)
+    form.fill(test_data)  # Semua field dalam satu execute_script
     print(f"Step 2: ✓ Data diinput: {test_data['name']}")
     
-    # Step 3: Klik Save
-    driver.find_element(By.CSS_SELECTOR, "input[type='submit']").click()
-    print("Step 3: ✓ Tombol Save diklik")
+    # Step 3: Submit
+    form.submit()
+    print("Step 3: ✓ Form Save di-submit")
     
     # Step 4: Verifikasi
     WebDriverWait(driver, 10).until(EC.url_contains("index.php"))
-    assert test_data["name"] in driver.page_source
+    wait_for_datatable(driver)
+    assert EmployeeTable(driver).read(scope="filtered").find(name=test_data["name"])
     print(f"Step 4: ✓ Data '{test_data['name']}' muncul di tabel")
     
     print("\n>>> HASIL: TC-013 PASSED ✓")
@@ -126,19 +124,19 @@ def test_update_contact(driver):
         return False
     
     # Step 3: Update data
-    name_field = driver.find_element(By.ID, "name")
-    name_field.clear()
+    form = ContactForm(driver)
     new_name = "Updated By Selenium"
-    name_field.send_keys(new_name)
+    form.fill({"name": new_name})
     print(f"Step 3: ✓ Name diubah: {new_name}")
     
-    # Step 4: Klik Update
-    driver.find_element(By.CSS_SELECTOR, "input[type='submit']").click()
-    print("Step 4: ✓ Tombol Update diklik")
+    # Step 4: Submit
+    form.submit()
+    print("Step 4: ✓ Form Update di-submit")
     
     # Step 5: Verifikasi
     WebDriverWait(driver, 10).until(EC.url_contains("index.php"))
-    assert new_name in driver.page_source
+    wait_for_datatable(driver)
+    assert EmployeeTable(driver).read(scope="filtered").find(name=new_name)
     print(f"Step 5: ✓ Data '{new_name}' terlihat di tabel")
     
     print("\n>>> HASIL: TC-018 PASSED ✓")
@@ -157,10 +155,9 @@ def test_delete_contact(driver):
     
     # Step 1: Buka dashboard & hitung data
     driver.get(f"{BASE_URL}/index.php")
-    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "employee")))
+    wait_for_datatable(driver)
     
-    delete_buttons = driver.find_elements(By.LINK_TEXT, "delete")
-    count_before = len(delete_buttons)
+    count_before = EmployeeTable(driver).info()["total"]
     print(f"Step 1: ✓ Jumlah kontak sebelum: {count_before}")
     
     if count_before == 0:
@@ -168,7 +165,8 @@ def test_delete_contact(driver):
         return False
     
     # Step 2: Klik Delete
-    delete_buttons[0].click()
+    delete_button = driver.find_element(By.LINK_TEXT, "delete")
+    delete_button.click()
     print("Step 2: ✓ Tombol Delete diklik")
     
     # Step 3: Handle alert
@@ -176,13 +174,12 @@ def test_delete_contact(driver):
     alert.accept()
     print("Step 3: ✓ Alert konfirmasi di-accept")
     
-    # Step 4: Verifikasi
-    time.sleep(1)
+    # Step 4: Verifikasi (tunggu redirect delete.php selesai)
+    wait_for_page_change(driver, delete_button)
     driver.get(f"{BASE_URL}/index.php")
-    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "employee")))
+    wait_for_datatable(driver)
     
-    delete_buttons_after = driver.find_elements(By.LINK_TEXT, "delete")
-    count_after = len(delete_buttons_after)
+    count_after = EmployeeTable(driver).info()["total"]
     print(f"Step 4: ✓ Jumlah kontak setelah: {count_after}")
     
     assert count_after == count_before - 1
@@ -204,30 +201,28 @@ def test_search_datatables(driver):
     
     # Step 1: Buka dashboard
     driver.get(f"{BASE_URL}/index.php")
-    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "employee")))
+    wait_for_datatable(driver)
     print("Step 1: ✓ Dashboard dibuka")
     
     # Step 2: Input keyword pencarian
     search_keyword = "John"
     search_box = driver.find_element(By.CSS_SELECTOR, "#employee_filter input")
-    search_box.send_keys(search_keyword)
+    with datatable_redraw(driver, search=search_keyword):  # Tunggu filter
+        search_box.send_keys(search_keyword)
     print(f"Step 2: ✓ Keyword '{search_keyword}' diinputkan")
     
-    time.sleep(1)  # Tunggu filter
-    
     # Step 3: Verifikasi hasil
-    rows = driver.find_elements(By.CSS_SELECTOR, "#employee tbody tr")
+    rows = EmployeeTable(driver).rows(scope="filtered")
     print(f"Step 3: ✓ Ditemukan {len(rows)} baris hasil")
     
     for row in rows:
-        row_text = row.text.lower()
-        if "no matching records" not in row_text:
-            assert search_keyword.lower() in row_text
+        assert search_keyword.lower() in row["text"].lower()
     print(f"Step 3: ✓ Semua hasil mengandung '{search_keyword}'")
     
     # Step 4: Clear search
-    search_box.clear()
-    time.sleep(1)
+    with datatable_redraw(driver, search=""):
+        search_box.clear()
+        search_box.send_keys(Keys.RETURN)
     print("Step 4: ✓ Search box dikosongkan")
     
     print("\n>>> HASIL: TC-010 PASSED ✓")
@@ -316,6 +311,16 @@ def main():
     total = len(results)
     print(f"\nTotal: {passed}/{total} test cases passed")
     print("="*60)
+    
+    # Print startup browser
+    print("\nSTARTUP BROWSER")
+    for line in format_startup(STARTUP_LOG):
+        print(f"  {line}")
+    
+    # Print pengisian form
+    print("\nPENGISIAN FORM")
+    for line in format_fills(FORM_LOG):
+        print(f"  {line}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,179 @@
+"""
+=============================================================================
+WAITS - Event-driven Wait untuk DataTables #employee
+=============================================================================
+File: waits.py
+Pengganti time.sleep() untuk menunggu DataTables selesai inisialisasi atau
+selesai redraw (filter/search). Wait memakai event `draw.dt` DataTables dan
+jQuery ready state lewat execute_async_script, sehingga langsung kembali
+begitu tabel benar-benar selesai di-redraw.
+
+Setiap wait dicatat di WAIT_LOG (nama, durasi, status, test) agar terlihat
+berapa banyak waktu yang dihabiskan untuk menunggu.
+
+Contoh:
+    wait_for_datatable(driver)
+
+    with datatable_redraw(driver, search="John"):
+        search_box.send_keys("John")
+=============================================================================
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+
+DEFAULT_TABLE = "#employee"
+DEFAULT_TIMEOUT = 10
+
+# Catatan setiap pemanggilan wait di proses (worker) ini
+WAIT_LOG = []
+
+
+# =============================================================================
+# JAVASCRIPT
+# =============================================================================
+
+# Tunggu dokumen selesai load, jQuery ready, dan DataTable sudah diinisialisasi
+_READY_JS = """
+var table = arguments[0], done = arguments[arguments.length - 1];
+function ready() {
+    return document.readyState === 'complete' && !!window.jQuery &&
+        !!jQuery.fn.dataTable && jQuery.fn.dataTable.isDataTable(table);
+}
+if (ready()) { return done(true); }
+if (document.readyState === 'complete') { return done(false); }
+window.addEventListener('load', function () {
+    if (window.jQuery) { jQuery(function () { done(ready()); }); }
+    else { done(false); }
+});
+"""
+
+# Pasang listener draw.dt (sekali per halaman), kembalikan jumlah draw saat ini
+_INSTALL_DRAW_HOOK_JS = """
+var table = arguments[0];
+window.__dtWait = window.__dtWait || {};
+if (!window.__dtWait[table]) {
+    var state = window.__dtWait[table] = {draws: 0, search: null, waiters: []};
+    jQuery(table).on('draw.dt', function (e, settings) {
+        state.draws += 1;
+        state.search = new jQuery.fn.dataTable.Api(settings).search();
+        var waiters = state.waiters;
+        state.waiters = [];
+        waiters.forEach(function (waiter) { waiter(); });
+    });
+}
+return window.__dtWait[table].draws;
+"""
+
+# Selesai saat terjadi draw baru (setelah `since`) dengan nilai search yang diharapkan
+_WAIT_DRAW_JS = """
+var table = arguments[0], since = arguments[1], expected = arguments[2];
+var done = arguments[arguments.length - 1];
+var state = window.__dtWait && window.__dtWait[table];
+if (!state) { return done(-1); }
+function check() {
+    if (state.draws > since && (expected === null || state.search === expected)) {
+        done(state.draws);
+        return true;
+    }
+    return false;
+}
+(function arm() {
+    if (!check()) { state.waiters.push(arm); }
+})();
+"""
+
+
+# =============================================================================
+# RECORDING
+# =============================================================================
+
+def _current_test():
+    """Nama test yang sedang berjalan (diset oleh pytest), jika ada."""
+    current = os.environ.get("PYTEST_CURRENT_TEST", "")
+    return current.rsplit(" (", 1)[0]
+
+
+@contextmanager
+def _recorded(name, detail=None):
+    """Catat durasi dan status sebuah wait ke WAIT_LOG."""
+    record = {"name": name, "detail": detail, "test": _current_test(), "ok": False}
+    start = time.perf_counter()
+    try:
+        yield
+        record["ok"] = True
+    finally:
+        record["seconds"] = round(time.perf_counter() - start, 4)
+        WAIT_LOG.append(record)
+
+
+def _ensure_script_timeout(driver, timeout):
+    """Set script timeout hanya jika berubah (menghemat satu round trip)."""
+    if getattr(driver, "_waits_script_timeout", None) != timeout:
+        driver.set_script_timeout(timeout)
+        driver._waits_script_timeout = timeout
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def wait_for_datatable(driver, table=DEFAULT_TABLE, timeout=DEFAULT_TIMEOUT):
+    """
+    Tunggu halaman selesai load dan DataTable `table` siap dipakai.
+    """
+    with _recorded("datatable_ready", table):
+        _ensure_script_timeout(driver, timeout)
+        if not driver.execute_async_script(_READY_JS, table):
+            raise TimeoutException(f"DataTable {table} tidak terinisialisasi")
+        driver.execute_script(_INSTALL_DRAW_HOOK_JS, table)
+
+
+@contextmanager
+def datatable_redraw(driver, search=None, table=DEFAULT_TABLE, timeout=DEFAULT_TIMEOUT):
+    """
+    Context manager: jalankan aksi (mis. ketik di search box), lalu tunggu
+    sampai DataTable selesai redraw. Jika `search` diberikan, tunggu redraw
+    yang memakai nilai search tersebut (berguna saat mengetik per karakter,
+    karena setiap keyup memicu redraw).
+    """
+    since = driver.execute_script(_INSTALL_DRAW_HOOK_JS, table)
+
+    yield
+
+    with _recorded("datatable_redraw", search):
+        _ensure_script_timeout(driver, timeout)
+        if driver.execute_async_script(_WAIT_DRAW_JS, table, since, search) < 0:
+            raise TimeoutException(f"Listener draw.dt untuk {table} hilang (halaman berganti?)")
+
+
+def wait_for_page_change(driver, old_element, timeout=DEFAULT_TIMEOUT):
+    """
+    Tunggu sampai halaman lama diganti halaman baru (elemen lama menjadi stale),
+    mis. setelah submit form atau konfirmasi delete yang me-redirect.
+    """
+    with _recorded("page_change"):
+        WebDriverWait(driver, timeout).until(EC.staleness_of(old_element))
+
+
+def summarize(records):
+    """
+    Ringkas daftar record wait per nama: jumlah, total, rata-rata, maksimum,
+    dan jumlah wait yang gagal.
+    """
+    summary = {}
+    for record in records:
+        item = summary.setdefault(record["name"], {"count": 0, "total": 0.0, "max": 0.0, "failed": 0})
+        item["count"] += 1
+        item["total"] += record["seconds"]
+        item["max"] = max(item["max"], record["seconds"])
+        item["failed"] += 0 if record["ok"] else 1
+    for item in summary.values():
+        item["mean"] = item["total"] / item["count"]
+    return summary
@@ -5,7 +5,7 @@ function pdo_connect()
     $DATABASE_HOST = 'localhost';
     $DATABASE_USER = 'root';
     $DATABASE_PASS = '';
-    $DATABASE_NAME = 'damncrud';
+    $DATABASE_NAME = database_name('damncrud');
     try {
         return new PDO('mysql:host=' . $DATABASE_HOST . ';dbname=' . $DATABASE_NAME, $DATABASE_USER, $DATABASE_PASS);
     } catch (PDOException $exception) {
@@ -13,6 +13,25 @@ function pdo_connect()
     }
 }
 
+// Test automation: setiap worker paralel memakai schema sendiri (mis. damncrud_gw0).
+// Hanya aktif jika server dijalankan dengan env DAMNCRUD_DB_OVERRIDE=1.
+function database_name($default)
+{
+    if (!getenv('DAMNCRUD_DB_OVERRIDE')) {
+        return $default;
+    }
+    $name = null;
+    if (isset($_SERVER['HTTP_X_DAMNCRUD_DB'])) {
+        $name = $_SERVER['HTTP_X_DAMNCRUD_DB'];
+    } elseif (isset($_COOKIE['damncrud_db'])) {
+        $name = $_COOKIE['damncrud_db'];
+    }
+    if ($name !== null && preg_match('/^' . $default . '_[A-Za-z0-9_]+$/', $name)) {
+        return $name;
+    }
+    return $default;
+}
+
 function style_script()
 {
     return '